@@ -0,0 +1,249 @@
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from colorama import init, Fore, Style
+
+init()
+
+REGRESSION_THRESHOLD = 0.10
+REGRESSION_MIN_MILLISECONDS = 5.0
+
+SCRIPT_MODULES = ("task_01", "task_02", "task_03")
+
+
+def setup_command_line_arguments():
+    parser = argparse.ArgumentParser(
+        description="Бенчмарк часу старту task_01/02/03: час імпорту та час до першого виводу",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Приклади використання:
+  python benchmark_startup.py
+  python benchmark_startup.py --repeat 20 --output startup.json
+  python benchmark_startup.py --compare startup_old.json
+        """
+    )
+
+    parser.add_argument(
+        "--repeat", "-r",
+        type=int,
+        default=7,
+        help="Кількість запусків кожного сценарію (за замовчуванням: 7)"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark_startup.json"),
+        help="Файл JSON зі звітом (за замовчуванням: benchmark_startup.json)"
+    )
+
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Попередній звіт; сповільнення медіани понад 10%% (і понад 5 мс) позначаються як регресії"
+    )
+
+    return parser.parse_args()
+
+
+def build_startup_scenarios(work_directory):
+    """
+    Повертає сценарії (назва, аргументи, зупинити після першого виводу).
+
+    Сценарії з коротким запуском (--help, помилка валідації, маленьке
+    завдання) вимірюються до завершення процесу; повний бенчмарк
+    task_03 - лише до першого виводу. Експорт task_02 іде без кешу
+    шаблонів, щоб не писати в ~/.cache і не міряти теплий кеш з другого повтору.
+    """
+    empty_source = work_directory / "empty_source"
+    empty_source.mkdir(exist_ok=True)
+
+    return [
+        ("task_01 --help", ["task_01.py", "--help"], False),
+        ("task_01 invalid source", ["task_01.py", os.fspath(work_directory / "missing"), "-q"], False),
+        ("task_01 empty tree", ["task_01.py", os.fspath(empty_source), os.fspath(work_directory / "dist"), "-q"], False),
+        ("task_02 --help", ["task_02.py", "--help"], False),
+        ("task_02 invalid level", ["task_02.py", "--level", "-1"], False),
+        ("task_02 export level 2", ["task_02.py", "--level", "2", "--export-dir", os.fspath(work_directory / "export"), "-p", "1", "--no-cache"], False),
+        ("task_03 --help", ["task_03.py", "--help"], False),
+        ("task_03 invalid jobs", ["task_03.py", "--jobs", "0"], False),
+        ("task_03 run", ["task_03.py"], True),
+    ]
+
+
+def measure_import_time(module_name):
+    """
+    Повертає накопичений час імпорту модуля в мілісекундах за python -X importtime.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parent
+    )
+
+    for line in reversed(completed.stderr.splitlines()):
+        match = re.match(r"import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*(\S+)\s*$", line)
+        if match and match.group(2) == module_name:
+            return int(match.group(1)) / 1000
+
+    return None
+
+
+def measure_startup_run(arguments, stop_after_first_output):
+    """
+    Запускає скрипт і повертає (мс до першого байта stdout, мс до завершення або None).
+    """
+    environment = dict(os.environ, PYTHONUNBUFFERED="1", MPLBACKEND="Agg")
+    start_time = time.perf_counter()
+
+    process = subprocess.Popen(
+        [sys.executable, *arguments],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=Path(__file__).resolve().parent,
+        env=environment
+    )
+
+    process.stdout.read(1)
+    first_output_ms = (time.perf_counter() - start_time) * 1000
+
+    if stop_after_first_output:
+        process.kill()
+        process.communicate()
+        return first_output_ms, None
+
+    process.communicate()
+    return first_output_ms, (time.perf_counter() - start_time) * 1000
+
+
+def summarize_timings(timings):
+    return {
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+    }
+
+
+def compare_with_previous_report(current_report, previous_report_path):
+    """
+    Порівнює медіани з попереднім звітом і повертає кількість регресій.
+    """
+    previous_report = json.loads(previous_report_path.read_text(encoding="utf-8"))
+    previous_metrics = {
+        (result["name"], metric): result[metric]["median_ms"]
+        for result in previous_report["results"]
+        for metric in ("import", "first_output", "total")
+        if result.get(metric)
+    }
+
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}ПОРІВНЯННЯ З {previous_report_path}{Style.RESET_ALL}")
+    print("="*70)
+
+    regressions_count = 0
+
+    for result in current_report["results"]:
+        for metric in ("import", "first_output", "total"):
+            previous_median = previous_metrics.get((result["name"], metric))
+
+            if previous_median is None or not result.get(metric):
+                continue
+
+            current_median = result[metric]["median_ms"]
+            label = f"{result['name']:<24} {metric:<13} {previous_median:8.1f} -> {current_median:8.1f} мс"
+
+            if current_median > previous_median * (1 + REGRESSION_THRESHOLD) and current_median - previous_median > REGRESSION_MIN_MILLISECONDS:
+                regressions_count += 1
+                print(f"{Fore.RED}[REGRESSION]{Style.RESET_ALL} {label}")
+            elif current_median < previous_median * (1 - REGRESSION_THRESHOLD):
+                print(f"{Fore.GREEN}[FASTER]{Style.RESET_ALL} {label}")
+            else:
+                print(f"{Fore.WHITE}[SAME]{Style.RESET_ALL} {label}")
+
+    return regressions_count
+
+
+def display_results_table(results):
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}РЕЗУЛЬТАТИ (медіана / мінімум, мс){Style.RESET_ALL}")
+    print("="*80)
+    print(f"{'Сценарій':<26} {'Імпорт':>15} {'Перший вивід':>17} {'До завершення':>17}")
+    print("-"*80)
+
+    for result in results:
+        columns = []
+        for metric in ("import", "first_output", "total"):
+            timing = result.get(metric)
+            columns.append(f"{timing['median_ms']:.1f} / {timing['min_ms']:.1f}" if timing else "-")
+
+        print(f"{Fore.CYAN}{result['name']:<26}{Style.RESET_ALL} {columns[0]:>15} {columns[1]:>17} {columns[2]:>17}")
+
+    print("="*80)
+
+
+def main():
+    args = setup_command_line_arguments()
+
+    if args.repeat < 1:
+        print(f"{Fore.RED}Помилка: кількість запусків має бути не меншою за 1{Style.RESET_ALL}")
+        sys.exit(1)
+
+    print(f"{Fore.CYAN}{Style.BRIGHT}Бенчмарк часу старту{Style.RESET_ALL}")
+    print("="*60)
+
+    results = []
+
+    try:
+        for module_name in SCRIPT_MODULES:
+            print(f"{Fore.BLUE}Імпорт{Style.RESET_ALL} {module_name}...")
+            import_timings = [measure_import_time(module_name) for _ in range(args.repeat)]
+
+            if None in import_timings:
+                print(f"{Fore.RED}Не вдалося виміряти імпорт {module_name}{Style.RESET_ALL}")
+                continue
+
+            results.append({"name": f"import {module_name}", "import": summarize_timings(import_timings)})
+
+        with tempfile.TemporaryDirectory(prefix="startup_benchmark_") as work_directory:
+            for name, arguments, stop_after_first_output in build_startup_scenarios(Path(work_directory)):
+                print(f"{Fore.BLUE}Запускаю{Style.RESET_ALL} {name}...")
+                runs = [measure_startup_run(arguments, stop_after_first_output) for _ in range(args.repeat)]
+
+                results.append({
+                    "name": name,
+                    "arguments": arguments[1:],
+                    "first_output": summarize_timings([first_output_ms for first_output_ms, _ in runs]),
+                    "total": None if stop_after_first_output else summarize_timings([total_ms for _, total_ms in runs]),
+                })
+
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Бенчмарк перервано{Style.RESET_ALL}")
+        sys.exit(1)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    display_results_table(results)
+    print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Звіт збережено в: {args.output.resolve()}")
+
+    if args.compare is not None:
+        regressions_count = compare_with_previous_report(report, args.compare)
+        sys.exit(1 if regressions_count else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from colorama import init, Fore, Style
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+init()
+
+TREE_FORMAT_VERSION = 1
+REGRESSION_THRESHOLD = 0.10
+
+SCALE_PRESETS = {
+    "small": {"tiny_files": 2_000, "deep_depth": 100, "collision_directories": 200, "huge_files": 2, "huge_file_size": 8 * 1024 * 1024},
+    "medium": {"tiny_files": 100_000, "deep_depth": 500, "collision_directories": 5_000, "huge_files": 3, "huge_file_size": 256 * 1024 * 1024},
+    "large": {"tiny_files": 2_000_000, "deep_depth": 2_000, "collision_directories": 50_000, "huge_files": 4, "huge_file_size": 2 * 1024 * 1024 * 1024},
+}
+
+ORGANIZER_MODES = {
+    "sequential": [],
+    "workers": ["--workers", "8"],
+    "async": ["--async"],
+    "dedup": ["--dedup", "hardlink"],
+}
+
+FILE_EXTENSIONS = [".txt", ".md", ".py", ".css", ".png", ".jpg", ".gif", ".json", ""]
+COLLIDING_NAMES = ["readme.md", "index.html", "logo.png", "styles.css", "script.py", "data.json"]
+
+
+def setup_command_line_arguments():
+    parser = argparse.ArgumentParser(
+        description="Бенчмарк файлового органайзера (task_01.py) на синтетичних деревах",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Приклади використання:
+  python benchmark_task_01.py
+  python benchmark_task_01.py --scale medium --modes sequential workers
+  python benchmark_task_01.py --output new.json --compare old.json
+        """
+    )
+    
+    parser.add_argument(
+        "--scale",
+        choices=SCALE_PRESETS,
+        default="small",
+        help="Розмір синтетичних дерев (за замовчуванням: small)"
+    )
+    
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=SCENARIO_GENERATORS,
+        default=list(SCENARIO_GENERATORS),
+        help="Сценарії для запуску (за замовчуванням: усі)"
+    )
+    
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=ORGANIZER_MODES,
+        default=["sequential", "workers"],
+        help="Режими органайзера (за замовчуванням: sequential workers)"
+    )
+    
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "task_01_benchmark",
+        help="Директорія для згенерованих дерев (повторно використовується між запусками)"
+    )
+    
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Зерно генератора випадкових чисел (за замовчуванням: 42)"
+    )
+    
+    parser.add_argument(
+        "--strace",
+        action="store_true",
+        help="Рахувати всі системні виклики через strace -c (якщо strace доступний)"
+    )
+    
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark_task_01.json"),
+        help="Файл JSON зі звітом (за замовчуванням: benchmark_task_01.json)"
+    )
+    
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Попередній звіт для порівняння; сповільнення понад 10%% позначаються як регресії"
+    )
+    
+    parser.add_argument(
+        "--run-child",
+        nargs=argparse.REMAINDER,
+        help=argparse.SUPPRESS
+    )
+    
+    return parser.parse_args()
+
+
+def write_file(file_path, size, random_generator):
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(random_generator.randbytes(size))
+    return size
+
+
+def generate_tiny_files_tree(root_path, preset, random_generator):
+    """
+    Багато крихітних файлів (0-512 байт), розкиданих по ~√N директоріях.
+    """
+    files_count = preset["tiny_files"]
+    directories_count = max(1, int(files_count ** 0.5))
+    total_bytes = 0
+    
+    for file_index in range(files_count):
+        directory_path = root_path / f"dir_{file_index % directories_count:05d}"
+        extension = random_generator.choice(FILE_EXTENSIONS)
+        total_bytes += write_file(directory_path / f"file_{file_index}{extension}", random_generator.randint(0, 512), random_generator)
+    
+    return files_count, total_bytes
+
+
+def generate_deep_nesting_tree(root_path, preset, random_generator):
+    """
+    Один дуже глибокий ланцюжок директорій з двома файлами на кожному рівні.
+    """
+    depth = preset["deep_depth"]
+    directory_path = root_path
+    total_bytes = 0
+    
+    for level in range(depth):
+        directory_path = directory_path / "d"
+        total_bytes += write_file(directory_path / f"level_{level}.txt", random_generator.randint(16, 256), random_generator)
+        total_bytes += write_file(directory_path / "same_name.md", random_generator.randint(16, 256), random_generator)
+    
+    return depth * 2, total_bytes
+
+
+def generate_name_collisions_tree(root_path, preset, random_generator):
+    """
+    Тисячі директорій з однаковими іменами файлів - найгірший випадок для суфіксів _N.
+    """
+    directories_count = preset["collision_directories"]
+    total_bytes = 0
+    
+    for directory_index in range(directories_count):
+        for file_name in COLLIDING_NAMES:
+            total_bytes += write_file(
+                root_path / f"project_{directory_index:05d}" / file_name,
+                random_generator.randint(64, 2048),
+                random_generator
+            )
+    
+    return directories_count * len(COLLIDING_NAMES), total_bytes
+
+
+def generate_huge_files_tree(root_path, preset, random_generator):
+    """
+    Кілька великих файлів, що записуються блоками по 8 МБ.
+    """
+    chunk_size = 8 * 1024 * 1024
+    files_count = preset["huge_files"]
+    file_size = preset["huge_file_size"]
+    
+    root_path.mkdir(parents=True, exist_ok=True)
+    
+    for file_index in range(files_count):
+        with open(root_path / f"video_{file_index}.bin", "wb") as huge_file:
+            remaining_bytes = file_size
+            while remaining_bytes > 0:
+                chunk_length = min(chunk_size, remaining_bytes)
+                huge_file.write(random_generator.randbytes(chunk_length))
+                remaining_bytes -= chunk_length
+    
+    return files_count, files_count * file_size
+
+
+SCENARIO_GENERATORS = {
+    "tiny_files": generate_tiny_files_tree,
+    "deep_nesting": generate_deep_nesting_tree,
+    "name_collisions": generate_name_collisions_tree,
+    "huge_files": generate_huge_files_tree,
+}
+
+
+def prepare_scenario_tree(work_directory, scenario, scale, seed):
+    """
+    Генерує дерево сценарію або повторно використовує вже згенероване з тими ж параметрами.
+    
+    Повертає (шлях, кількість файлів, кількість байтів).
+    """
+    tree_path = work_directory / f"{scenario}_{scale}_{seed}"
+    marker_path = tree_path / ".benchmark_tree.json"
+    
+    if marker_path.exists():
+        marker = json.loads(marker_path.read_text(encoding="utf-8"))
+        if marker.get("version") == TREE_FORMAT_VERSION:
+            return tree_path / "source", marker["files"], marker["bytes"]
+    
+    shutil.rmtree(tree_path, ignore_errors=True)
+    print(f"{Fore.BLUE}Генерую дерево{Style.RESET_ALL} {scenario} ({scale})...")
+    
+    random_generator = random.Random(f"{seed}-{scenario}")
+    files_count, total_bytes = SCENARIO_GENERATORS[scenario](tree_path / "source", SCALE_PRESETS[scale], random_generator)
+    
+    marker_path.write_text(
+        json.dumps({"version": TREE_FORMAT_VERSION, "files": files_count, "bytes": total_bytes}),
+        encoding="utf-8"
+    )
+    
+    return tree_path / "source", files_count, total_bytes
+
+
+def read_process_io_counters():
+    """
+    Повертає лічильники /proc/self/io (syscr, syscw, ...) або порожній словник поза Linux.
+    """
+    try:
+        with open("/proc/self/io", encoding="ascii") as io_file:
+            return {key: int(value) for key, value in (line.split(":") for line in io_file)}
+    except OSError:
+        return {}
+
+
+def run_organizer_child(child_arguments):
+    """
+    Запускає task_01.main() у цьому процесі і записує його ресурси в JSON-файл.
+    
+    Виконується в окремому процесі, тому пікова пам'ять і лічильники
+    системних викликів належать лише одному запуску органайзера.
+    """
+    result_path, *organizer_arguments = child_arguments
+    
+    import task_01
+    
+    sys.argv = ["task_01.py", *organizer_arguments]
+    exit_code = 0
+    start_time = time.perf_counter()
+    
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            task_01.main()
+        except SystemExit as system_exit:
+            exit_code = system_exit.code or 0
+    
+    elapsed_seconds = time.perf_counter() - start_time
+    io_counters = read_process_io_counters()
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None
+    
+    Path(result_path).write_text(json.dumps({
+        "exit_code": exit_code,
+        "elapsed_seconds": elapsed_seconds,
+        "peak_rss_kb": peak_rss_kb,
+        "read_syscalls": io_counters.get("syscr"),
+        "write_syscalls": io_counters.get("syscw"),
+    }), encoding="utf-8")
+
+
+def parse_strace_summary(summary_path):
+    """
+    Повертає загальну кількість викликів з підсумкового рядка strace -c.
+    """
+    for line in reversed(summary_path.read_text(encoding="utf-8").splitlines()):
+        fields = line.split()
+        if fields and fields[-1] == "total":
+            return int(fields[3])
+    return None
+
+
+def run_benchmark_case(source_path, work_directory, mode, use_strace):
+    destination_path = work_directory / "destination"
+    shutil.rmtree(destination_path, ignore_errors=True)
+    
+    result_path = work_directory / "child_result.json"
+    strace_path = work_directory / "strace_summary.txt"
+    
+    command = [
+        sys.executable,
+        os.fspath(Path(__file__).resolve()),
+        "--run-child",
+        os.fspath(result_path),
+        os.fspath(source_path),
+        os.fspath(destination_path),
+        "--quiet",
+        *ORGANIZER_MODES[mode]
+    ]
+    
+    if use_strace:
+        command = ["strace", "-f", "-c", "-o", os.fspath(strace_path), *command]
+    
+    # Результат попереднього режиму не повинен видаватися за результат цього
+    result_path.unlink(missing_ok=True)
+    
+    start_time = time.perf_counter()
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=Path(__file__).resolve().parent)
+    wall_seconds = time.perf_counter() - start_time
+    
+    if completed.returncode != 0 or not result_path.exists():
+        shutil.rmtree(destination_path, ignore_errors=True)
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else f"код виходу {completed.returncode}")
+    
+    child_result = json.loads(result_path.read_text(encoding="utf-8"))
+    child_result["wall_seconds"] = wall_seconds
+    child_result["strace_syscalls"] = parse_strace_summary(strace_path) if use_strace else None
+    
+    shutil.rmtree(destination_path, ignore_errors=True)
+    return child_result
+
+
+def compare_with_previous_report(current_report, previous_report_path):
+    """
+    Порівнює files/s з попереднім звітом і повертає кількість регресій.
+    """
+    previous_report = json.loads(previous_report_path.read_text(encoding="utf-8"))
+    previous_results = {
+        (result["scenario"], result["mode"]): result
+        for result in previous_report["results"]
+    }
+    
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}ПОРІВНЯННЯ З {previous_report_path}{Style.RESET_ALL}")
+    print("="*70)
+    
+    regressions_count = 0
+    
+    for result in current_report["results"]:
+        previous_result = previous_results.get((result["scenario"], result["mode"]))
+        
+        if previous_result is None or not previous_result["files_per_second"]:
+            continue
+        
+        ratio = result["files_per_second"] / previous_result["files_per_second"]
+        label = f"{result['scenario']:<16} {result['mode']:<11} {ratio:6.2f}x"
+        
+        if ratio < 1 - REGRESSION_THRESHOLD:
+            regressions_count += 1
+            print(f"{Fore.RED}[REGRESSION]{Style.RESET_ALL} {label}")
+        elif ratio > 1 + REGRESSION_THRESHOLD:
+            print(f"{Fore.GREEN}[FASTER]{Style.RESET_ALL} {label}")
+        else:
+            print(f"{Fore.WHITE}[SAME]{Style.RESET_ALL} {label}")
+    
+    return regressions_count
+
+
+def display_results_table(results):
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}РЕЗУЛЬТАТИ{Style.RESET_ALL}")
+    print("="*116)
+    print(
+        f"{'Сценарій':<16} {'Режим':<11} {'Файлів':>9} {'файл/с':>11} {'МБ/с':>9} {'Час, с':>9} {'Процес, с':>10} "
+        f"{'RSS, МБ':>9} {'syscr+syscw':>13} {'strace':>10}"
+    )
+    print("-"*116)
+    
+    for result in results:
+        io_syscalls = (result["read_syscalls"] or 0) + (result["write_syscalls"] or 0)
+        peak_rss = f"{result['peak_rss_kb'] / 1024:.1f}" if result["peak_rss_kb"] else "-"
+        strace_syscalls = result["strace_syscalls"] if result["strace_syscalls"] is not None else "-"
+        color = Fore.GREEN if result["exit_code"] == 0 else Fore.RED
+        
+        print(
+            f"{color}{result['scenario']:<16}{Style.RESET_ALL} {result['mode']:<11} {result['files']:>9} "
+            f"{result['files_per_second']:>11.1f} {result['bytes_per_second'] / 1024 / 1024:>9.1f} "
+            f"{result['elapsed_seconds']:>9.2f} {result['wall_seconds']:>10.2f} "
+            f"{peak_rss:>9} {io_syscalls:>13} {strace_syscalls:>10}"
+        )
+    
+    print("="*116)
+
+
+def main():
+    args = setup_command_line_arguments()
+    
+    if args.run_child is not None:
+        run_organizer_child(args.run_child)
+        return
+    
+    print(f"{Fore.CYAN}{Style.BRIGHT}Бенчмарк файлового органайзера{Style.RESET_ALL}")
+    print("="*60)
+    
+    use_strace = args.strace and shutil.which("strace") is not None
+    if args.strace and not use_strace:
+        print(f"{Fore.YELLOW}Попередження: strace не знайдено, рахуються лише лічильники /proc/self/io{Style.RESET_ALL}")
+    
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    
+    try:
+        for scenario in args.scenarios:
+            source_path, files_count, total_bytes = prepare_scenario_tree(args.work_dir, scenario, args.scale, args.seed)
+            
+            for mode in args.modes:
+                print(f"{Fore.BLUE}Запускаю{Style.RESET_ALL} {scenario} | {mode}...")
+                
+                try:
+                    case_result = run_benchmark_case(source_path, args.work_dir, mode, use_strace)
+                except RuntimeError as error:
+                    print(f"{Fore.RED}Помилка запуску {scenario}, режим {mode}: {error}{Style.RESET_ALL}")
+                    continue
+                
+                # Пропускна здатність - за часом самого task_01.main(), без старту
+                # інтерпретатора й імпортів; повний час процесу - окреме поле wall_seconds
+                elapsed_seconds = max(case_result["elapsed_seconds"], 1e-9)
+                
+                results.append({
+                    "scenario": scenario,
+                    "mode": mode,
+                    "files": files_count,
+                    "bytes": total_bytes,
+                    "files_per_second": files_count / elapsed_seconds,
+                    "bytes_per_second": total_bytes / elapsed_seconds,
+                    **case_result,
+                })
+    
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Бенчмарк перервано{Style.RESET_ALL}")
+        sys.exit(1)
+    
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "seed": args.seed,
+        "results": results,
+    }
+    
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    
+    display_results_table(results)
+    print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Звіт збережено в: {args.output.resolve()}")
+    
+    if args.compare is not None:
+        regressions_count = compare_with_previous_report(report, args.compare)
+        sys.exit(1 if regressions_count else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from colorama import init, Fore, Style
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+init()
+
+REGRESSION_THRESHOLD = 0.10
+
+FRACTAL_ENGINES = ("recursive", "vectorized", "cached", "progressive", "streaming")
+DEFAULT_ENGINES = ("recursive", "vectorized", "cached")
+
+
+def setup_command_line_arguments():
+    parser = argparse.ArgumentParser(
+        description="Бенчмарк генерації сніжинки Коха (task_02.py): час, пам'ять, геометрія та рендеринг",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Приклади використання:
+  python benchmark_task_02.py
+  python benchmark_task_02.py --max-level 10 --engines vectorized cached streaming
+  python benchmark_task_02.py --output new.json --compare old.json
+        """
+    )
+
+    parser.add_argument(
+        "--max-level",
+        type=int,
+        default=8,
+        help="Найвищий рівень (за замовчуванням: 8)"
+    )
+
+    parser.add_argument(
+        "--recursive-max-level",
+        type=int,
+        default=7,
+        help="Найвищий рівень для рекурсивного рушія - він повільний (за замовчуванням: 7)"
+    )
+
+    parser.add_argument(
+        "--render-max-level",
+        type=int,
+        default=8,
+        help="Найвищий рівень, для якого вимірюється рендеринг matplotlib (за замовчуванням: 8)"
+    )
+
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=300,
+        help="Розмір сторони трикутника (за замовчуванням: 300)"
+    )
+
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=FRACTAL_ENGINES,
+        default=list(DEFAULT_ENGINES),
+        help="Рушії для порівняння (за замовчуванням: recursive vectorized cached)"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark_task_02.json"),
+        help="Файл JSON зі звітом (за замовчуванням: benchmark_task_02.json)"
+    )
+
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Попередній звіт для порівняння; сповільнення понад 10%% позначаються як регресії"
+    )
+
+    parser.add_argument(
+        "--run-case",
+        nargs=5,
+        metavar=("ENGINE", "LEVEL", "SIZE", "RENDER", "CACHE_DIR"),
+        help=argparse.SUPPRESS
+    )
+
+    return parser.parse_args()
+
+
+def generate_with_engine(task_02, engine, recursion_level, side_length, cache_directory):
+    """
+    Будує сніжинку обраним рушієм і повертає (точки для рендерингу, кількість точок).
+
+    Для streaming точки лише проходять через генератор і не зберігаються.
+    """
+    if engine == "recursive":
+        # Рекурсивний варіант до векторизації: три сторони через koch_curve_points
+        vertices = [tuple(vertex) for vertex in task_02.get_triangle_vertices(side_length)]
+        all_points = []
+        for side_index in range(3):
+            side_points = task_02.koch_curve_points(vertices[side_index], vertices[side_index + 1], recursion_level)
+            all_points.extend(side_points if side_index == 0 else side_points[1:])
+        all_points.append(all_points[0])
+        return all_points, len(all_points)
+
+    if engine == "vectorized":
+        snowflake_points = task_02.create_koch_snowflake(recursion_level, side_length)
+        return snowflake_points, len(snowflake_points)
+
+    if engine == "cached":
+        template_cache = task_02.KochTemplateCache(Path(cache_directory))
+        snowflake_points = task_02.create_koch_snowflake(recursion_level, side_length, template_cache)
+        return snowflake_points, len(snowflake_points)
+
+    if engine == "progressive":
+        for _, snowflake_points in task_02.iterate_koch_levels(recursion_level, side_length):
+            pass
+        return snowflake_points, len(snowflake_points)
+
+    points_count = sum(len(chunk) for chunk in task_02.iterate_koch_snowflake_chunks(recursion_level, side_length))
+    return None, points_count
+
+
+def render_points(task_02, engine, snowflake_points, side_length):
+    """
+    Малює точки на полотні Agg так, як це робить відповідний рушій, і повертає секунди.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = task_02.setup_matplotlib_environment("benchmark", side_length)
+    start_time = time.perf_counter()
+
+    if engine == "recursive":
+        ax.plot([point[0] for point in snowflake_points], [point[1] for point in snowflake_points], color='cyan', linewidth=2)
+    else:
+        task_02.draw_snowflake(ax, snowflake_points)
+
+    fig.canvas.draw()
+    elapsed_seconds = time.perf_counter() - start_time
+    plt.close(fig)
+    return elapsed_seconds
+
+
+def run_benchmark_case(engine, recursion_level, side_length, render, cache_directory):
+    """
+    Виконує один вимір в окремому процесі та друкує результат JSON у stdout.
+
+    Геометрія вимірюється двічі: спершу час без tracemalloc (він
+    сповільнює виділення пам'яті), потім пік пам'яті під tracemalloc.
+    """
+    import contextlib
+    import io
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import task_02
+
+        if engine == "cached":
+            # Прогрів: кеш на диску вже є, як у повторному запуску
+            generate_with_engine(task_02, engine, recursion_level, side_length, cache_directory)
+
+        start_time = time.perf_counter()
+        snowflake_points, points_count = generate_with_engine(task_02, engine, recursion_level, side_length, cache_directory)
+        geometry_seconds = time.perf_counter() - start_time
+
+        render_seconds = None
+        if render and snowflake_points is not None:
+            render_seconds = render_points(task_02, engine, snowflake_points, side_length)
+
+        del snowflake_points
+
+        tracemalloc.start()
+        generate_with_engine(task_02, engine, recursion_level, side_length, cache_directory)
+        _, tracemalloc_peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None
+
+    print(json.dumps({
+        "points": points_count,
+        "geometry_seconds": geometry_seconds,
+        "render_seconds": render_seconds,
+        "tracemalloc_peak_bytes": tracemalloc_peak_bytes,
+        "peak_rss_kb": peak_rss_kb,
+    }))
+
+
+def measure_case(engine, recursion_level, side_length, render, cache_directory):
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--run-case",
+        engine,
+        str(recursion_level),
+        str(side_length),
+        "1" if render else "0",
+        str(cache_directory)
+    ]
+
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=Path(__file__).resolve().parent)
+
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "невідома помилка")
+
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare_with_previous_report(current_report, previous_report_path):
+    """
+    Порівнює points/s з попереднім звітом і повертає кількість регресій.
+    """
+    previous_report = json.loads(previous_report_path.read_text(encoding="utf-8"))
+    previous_results = {
+        (result["engine"], result["level"]): result
+        for result in previous_report["results"]
+    }
+
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}ПОРІВНЯННЯ З {previous_report_path}{Style.RESET_ALL}")
+    print("="*70)
+
+    regressions_count = 0
+
+    for result in current_report["results"]:
+        previous_result = previous_results.get((result["engine"], result["level"]))
+
+        if previous_result is None or not previous_result["points_per_second"]:
+            continue
+
+        ratio = result["points_per_second"] / previous_result["points_per_second"]
+        label = f"{result['engine']:<12} рівень {result['level']:<3} {ratio:6.2f}x"
+
+        if ratio < 1 - REGRESSION_THRESHOLD:
+            regressions_count += 1
+            print(f"{Fore.RED}[REGRESSION]{Style.RESET_ALL} {label}")
+        elif ratio > 1 + REGRESSION_THRESHOLD:
+            print(f"{Fore.GREEN}[FASTER]{Style.RESET_ALL} {label}")
+        else:
+            print(f"{Fore.WHITE}[SAME]{Style.RESET_ALL} {label}")
+
+    return regressions_count
+
+
+def display_results_table(results):
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}РЕЗУЛЬТАТИ{Style.RESET_ALL}")
+    print("="*98)
+    print(f"{'Рушій':<12} {'Рів.':>4} {'Точок':>11} {'Геом., с':>10} {'Рендер, с':>10} {'точок/с':>13} {'tracemalloc':>12} {'RSS, МБ':>9}")
+    print("-"*98)
+
+    for result in results:
+        render_seconds = f"{result['render_seconds']:.4f}" if result["render_seconds"] is not None else "-"
+        peak_rss = f"{result['peak_rss_kb'] / 1024:.1f}" if result["peak_rss_kb"] else "-"
+
+        print(
+            f"{Fore.CYAN}{result['engine']:<12}{Style.RESET_ALL} {result['level']:>4} {result['points']:>11,} "
+            f"{result['geometry_seconds']:>10.4f} {render_seconds:>10} {result['points_per_second']:>13,.0f} "
+            f"{result['tracemalloc_peak_bytes'] / 1024 / 1024:>10.1f}МБ {peak_rss:>9}"
+        )
+
+    print("="*98)
+
+
+def main():
+    args = setup_command_line_arguments()
+
+    if args.run_case is not None:
+        engine, level_text, size_text, render_text, cache_directory = args.run_case
+        run_benchmark_case(engine, int(level_text), int(size_text), render_text == "1", cache_directory)
+        return
+
+    print(f"{Fore.CYAN}{Style.BRIGHT}Бенчмарк сніжинки Коха{Style.RESET_ALL}")
+    print("="*60)
+
+    results = []
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="koch_benchmark_") as cache_directory:
+            for engine in args.engines:
+                max_level = min(args.max_level, args.recursive_max_level) if engine == "recursive" else args.max_level
+
+                for recursion_level in range(max_level + 1):
+                    print(f"{Fore.BLUE}Вимірюю{Style.RESET_ALL} {engine} | рівень {recursion_level}...")
+
+                    try:
+                        case_result = measure_case(
+                            engine,
+                            recursion_level,
+                            args.size,
+                            recursion_level <= args.render_max_level,
+                            cache_directory
+                        )
+                    except RuntimeError as error:
+                        print(f"{Fore.RED}Помилка виміру {engine}, рівень {recursion_level}: {error}{Style.RESET_ALL}")
+                        continue
+
+                    results.append({
+                        "engine": engine,
+                        "level": recursion_level,
+                        "points_per_second": case_result["points"] / max(case_result["geometry_seconds"], 1e-9),
+                        **case_result,
+                    })
+
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Бенчмарк перервано{Style.RESET_ALL}")
+        sys.exit(1)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": args.size,
+        "results": results,
+    }
+
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    display_results_table(results)
+    print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Звіт збережено в: {args.output.resolve()}")
+
+    if args.compare is not None:
+        regressions_count = compare_with_previous_report(report, args.compare)
+        sys.exit(1 if regressions_count else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,142 +1,2350 @@
 import argparse
+import errno
+import hashlib
+import json
+import os
+import select
 import shutil
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing.managers import BaseManager
 from pathlib import Path
 import sys
+from typing import NamedTuple, Optional
 from colorama import init, Fore, Style
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 init()
 
 
-def setup_command_line_arguments():
-    parser = argparse.ArgumentParser(
-        description="Рекурсивне копіювання та сортування файлів за розширенням",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Приклади використання:
-  python task_01.py /path/to/source
-  python task_01.py /path/to/source /path/to/destination
-  python task_01.py ./test_folder ./sorted_files
+def setup_command_line_arguments():
+    parser = argparse.ArgumentParser(
+        description="Рекурсивне копіювання та сортування файлів за розширенням",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Приклади використання:
+  python task_01.py /path/to/source
+  python task_01.py /path/to/source /path/to/destination
+  python task_01.py ./test_folder ./sorted_files
+  python task_01.py ./test_folder ./sorted_files --workers 8
+  python task_01.py ./test_folder ./sorted_files --sync --hash
+  python task_01.py ./test_folder ./sorted_files --dedup hardlink
+  python task_01.py ./test_folder ./sorted_files --no-metadata
+  python task_01.py ./test_folder ./sorted_files --progress --json-log events.jsonl
+  python task_01.py ./test_folder ./sorted_files --dry-run --save-plan plan.jsonl
+  python task_01.py --execute-plan plan.jsonl --order destination
+  python task_01.py /mnt/nfs/share ./sorted_files --async --copy-concurrency 32
+  python task_01.py ./huge_tree ./sorted_files --processes 8 --quiet
+  python task_01.py ./inbox ./sorted_files --watch --debounce 2
+  python task_01.py ./test_folder ./sorted_files --archive zip --compress
+        """
+    )
+    
+    parser.add_argument(
+        "source_directory",
+        type=Path,
+        nargs='?',
+        help="Шлях до вихідної директорії (не потрібен разом із --execute-plan)"
+    )
+    
+    parser.add_argument(
+        "destination_directory", 
+        type=Path,
+        nargs='?',
+        default=Path("dist"),
+        help="Шлях до директорії призначення (за замовчуванням: dist)"
+    )
+    
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Кількість потоків копіювання (за замовчуванням: 1 - послідовно)"
+    )
+    
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Інкрементальний режим: пропускати файли, не змінені з попереднього запуску"
+    )
+    
+    parser.add_argument(
+        "--hash",
+        action="store_true",
+        help="У режимі --sync додатково зберігати й порівнювати SHA-256 вмісту"
+    )
+    
+    parser.add_argument(
+        "--dedup",
+        choices=DEDUP_MODES,
+        help="Дедуплікація однакових файлів: жорстке посилання, reflink або пропуск"
+    )
+    
+    parser.add_argument(
+        "--no-metadata",
+        action="store_true",
+        help="Не зберігати права доступу та час зміни файлів (швидше)"
+    )
+    
+    output_mode_group = parser.add_mutually_exclusive_group()
+    
+    output_mode_group.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Не виводити повідомлення про кожен файл і директорію (лише помилки та підсумок)"
+    )
+    
+    output_mode_group.add_argument(
+        "--progress",
+        action="store_true",
+        help="Показувати один рядок прогресу, що оновлюється не частіше ніж 5 разів на секунду"
+    )
+    
+    parser.add_argument(
+        "--json-log",
+        type=Path,
+        help="Записувати події (копіювання, пропуски, помилки) у буферизований файл JSON Lines"
+    )
+    
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Лише скласти план (джерело, категорія, ім'я, розмір) без змін на диску"
+    )
+    
+    parser.add_argument(
+        "--save-plan",
+        type=Path,
+        help="Зберегти план у файл JSON Lines для перегляду чи пізнішого виконання"
+    )
+    
+    parser.add_argument(
+        "--execute-plan",
+        type=Path,
+        help="Виконати раніше збережений план (директорії беруться з плану)"
+    )
+    
+    parser.add_argument(
+        "--order",
+        choices=EXECUTION_ORDERS,
+        default=ORDER_STREAM,
+        help="Порядок виконання: stream - у порядку обходу, destination - за директорією "
+             "призначення, inode - за inode джерела (за замовчуванням: stream)"
+    )
+    
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Конвеєр asyncio (читання директорій, stat, копіювання) для мережевих файлових систем"
+    )
+    
+    parser.add_argument(
+        "--list-concurrency",
+        type=int,
+        default=ASYNC_LIST_CONCURRENCY,
+        help=f"Одночасних читань директорій у режимі --async (за замовчуванням: {ASYNC_LIST_CONCURRENCY})"
+    )
+    
+    parser.add_argument(
+        "--stat-concurrency",
+        type=int,
+        default=ASYNC_STAT_CONCURRENCY,
+        help=f"Одночасних викликів stat у режимі --async (за замовчуванням: {ASYNC_STAT_CONCURRENCY})"
+    )
+    
+    parser.add_argument(
+        "--copy-concurrency",
+        type=int,
+        default=ASYNC_COPY_CONCURRENCY,
+        help=f"Одночасних копіювань у режимі --async (за замовчуванням: {ASYNC_COPY_CONCURRENCY})"
+    )
+    
+    parser.add_argument(
+        "--processes", "-p",
+        type=int,
+        default=1,
+        help="Кількість процесів, між якими діляться піддиректорії верхнього рівня "
+             "(за замовчуванням: 1 - без процесів-воркерів)"
+    )
+    
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Після сортування залишатися працювати й сортувати нові та змінені файли "
+             "(inotify або опитування mtime; вмикає --sync)"
+    )
+    
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=WATCH_DEBOUNCE_SECONDS,
+        help=f"Секунд тиші, після яких пакет змін у режимі --watch обробляється (за замовчуванням: {WATCH_DEBOUNCE_SECONDS})"
+    )
+    
+    parser.add_argument(
+        "--archive",
+        choices=ARCHIVE_FORMATS,
+        help="Записувати кожну категорію в один архів tar або zip з індексом замість окремих файлів"
+    )
+    
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Стискати архіви --archive (tar.gz або zip deflate)"
+    )
+    
+    return parser.parse_args()
+
+
+def get_file_category(file_extension):
+    """
+    Повертає назву категорії (піддиректорії) для розширення файлу.
+    """
+    return file_extension.lstrip('.') if file_extension else 'no_extension'
+
+
+def create_destination_subdirectory(destination_base_path, file_extension):
+    """
+    Створює піддиректорію для файлів із вказанним розширенням.
+    
+    Функція створює директорію, якщо вона не існує.
+    
+    """
+    extension_clean = get_file_category(file_extension)
+    
+    subdirectory_path = destination_base_path / extension_clean
+    
+    try:
+        subdirectory_path.mkdir(parents=True, exist_ok=True)
+        return subdirectory_path
+    
+    except OSError as error:
+        print(f"{Fore.RED}Помилка створення директорії {subdirectory_path}: {error}{Style.RESET_ALL}")
+        raise
+
+
+class DestinationIndex:
+    """
+    Індекс директорії призначення в пам'яті.
+    
+    Заповнюється одним проходом на старті, після чого всі рішення приймаються
+    без звернень до диска: які директорії категорій уже створено, які імена
+    зайняті та з якого суфікса _N продовжувати для кожного імені файлу,
+    скільки файлів і байтів записано в кожну категорію.
+    """
+    
+    def __init__(self, destination_directory_path):
+        self.destination_directory_path = destination_directory_path
+        self.lock = threading.Lock()
+        self.created_categories = set()
+        self.taken_names = {}
+        self.next_suffixes = {}
+        self.existing_files_counts = {}
+        self.replaced_files_counts = {}
+        self.copied_files_counts = {}
+        self.copied_bytes_counts = {}
+        
+        self._scan_destination()
+    
+    def _scan_destination(self):
+        if not self.destination_directory_path.is_dir():
+            return
+        
+        with os.scandir(self.destination_directory_path) as destination_entries:
+            for entry in destination_entries:
+                if not entry.is_dir():
+                    continue
+                
+                with os.scandir(entry.path) as category_entries:
+                    names = {category_entry.name for category_entry in category_entries}
+                
+                self.created_categories.add(entry.name)
+                self.taken_names[entry.name] = names
+                self.existing_files_counts[entry.name] = len(names)
+    
+    def prepare_category(self, category):
+        """
+        Створює директорію категорії перед першим записом у неї.
+        """
+        if category in self.created_categories:
+            return
+        
+        with self.lock:
+            if category not in self.created_categories:
+                create_destination_subdirectory(self.destination_directory_path, category)
+                self.created_categories.add(category)
+    
+    def allocate(self, source_file_path):
+        """
+        Резервує вільне ім'я для файлу, додаючи суфікс _N при конфлікті імен.
+        
+        Повертає (категорія, ім'я файлу); на диску нічого не створюється.
+        Для кожного імені запам'ятовується наступний суфікс, тож N однакових
+        імен коштують O(N), а не O(N²) перевірок.
+        """
+        category = get_file_category(source_file_path.suffix.lower())
+        file_name = source_file_path.name
+        
+        with self.lock:
+            taken_names = self.taken_names.setdefault(category, set())
+            
+            if file_name in taken_names:
+                suffix_key = (category, file_name)
+                counter = self.next_suffixes.get(suffix_key, 1)
+                original_stem = source_file_path.stem
+                extension = source_file_path.suffix
+                
+                while True:
+                    new_name = f"{original_stem}_{counter}{extension}"
+                    counter += 1
+                    if new_name not in taken_names:
+                        break
+                
+                self.next_suffixes[suffix_key] = counter
+                file_name = new_name
+            
+            taken_names.add(file_name)
+        
+        return category, file_name
+    
+    def allocate_many(self, file_names):
+        """
+        Резервує імена для пакета файлів одним викликом.
+        
+        Використовується процесами --processes: один виклик через менеджер
+        на пакет замість одного на файл.
+        """
+        return [self.allocate(Path(file_name)) for file_name in file_names]
+    
+    def is_taken(self, category, file_name):
+        with self.lock:
+            return file_name in self.taken_names.get(category, ())
+    
+    def reserve(self, category, file_name):
+        """
+        Позначає вже відоме ім'я (з маніфесту чи збереженого плану) як зайняте.
+        """
+        with self.lock:
+            taken_names = self.taken_names.setdefault(category, set())
+            if file_name in taken_names:
+                self.replaced_files_counts[category] = self.replaced_files_counts.get(category, 0) + 1
+            taken_names.add(file_name)
+    
+    def record_copied(self, category, size):
+        with self.lock:
+            self.copied_files_counts[category] = self.copied_files_counts.get(category, 0) + 1
+            self.copied_bytes_counts[category] = self.copied_bytes_counts.get(category, 0) + size
+    
+    def merge_shard_stats(self, copied_files_counts, copied_bytes_counts):
+        """
+        Додає лічильники копій, накопичені процесом-воркером (--processes).
+        """
+        with self.lock:
+            for category, files_count in copied_files_counts.items():
+                self.created_categories.add(category)
+                self.copied_files_counts[category] = self.copied_files_counts.get(category, 0) + files_count
+                self.copied_bytes_counts[category] = self.copied_bytes_counts.get(category, 0) + copied_bytes_counts.get(category, 0)
+    
+    def get_category_stats(self):
+        """
+        Повертає відсортований список (категорія, усього файлів, нових файлів, нових байтів).
+        """
+        category_stats = []
+        
+        with self.lock:
+            for category in sorted(self.created_categories):
+                copied_files = self.copied_files_counts.get(category, 0)
+                total_files = (
+                    self.existing_files_counts.get(category, 0) 
+                    + copied_files 
+                    - self.replaced_files_counts.get(category, 0)
+                )
+                category_stats.append((category, total_files, copied_files, self.copied_bytes_counts.get(category, 0)))
+        
+        return category_stats
+
+
+MANIFEST_FILE_NAME = ".organizer_manifest.jsonl"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def calculate_file_hash(file_path):
+    """
+    Обчислює SHA-256 вмісту файлу, читаючи його блоками.
+    """
+    file_hash = hashlib.sha256()
+    
+    with open(file_path, "rb") as source_file:
+        while chunk := source_file.read(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    
+    return file_hash.hexdigest()
+
+
+class SyncManifest:
+    """
+    Маніфест інкрементальної синхронізації, що зберігається в директорії призначення.
+    
+    Кожен скопійований файл одразу дописується рядком JSON (шлях джерела, шлях
+    призначення, розмір, mtime і, за потреби, хеш), тому перерваний запуск
+    продовжується з місця зупинки. Під час закриття маніфест ущільнюється
+    до одного запису на файл джерела. У режимі read_only (--dry-run)
+    маніфест лише читається.
+    """
+    
+    def __init__(self, destination_directory_path, use_hash=False, read_only=False):
+        self.destination_directory_path = destination_directory_path
+        self.manifest_path = destination_directory_path / MANIFEST_FILE_NAME
+        self.use_hash = use_hash
+        self.read_only = read_only
+        self.entries = {}
+        self.skipped_files_count = 0
+        self.lock = threading.Lock()
+        self.manifest_file = None
+        
+        self._load()
+        if not read_only:
+            self.manifest_file = open(self.manifest_path, "a", encoding="utf-8")
+    
+    def _load(self):
+        if not self.manifest_path.exists():
+            return
+        
+        with open(self.manifest_path, encoding="utf-8") as manifest_file:
+            for line in manifest_file:
+                try:
+                    entry = json.loads(line)
+                    self.entries[entry["source"]] = entry
+                except (ValueError, KeyError):
+                    # Обірваний останній рядок після переривання запуску
+                    continue
+    
+    def get_destination(self, source_file_path):
+        """
+        Повертає відносний шлях призначення файлу з маніфесту або None.
+        """
+        entry = self.entries.get(os.fspath(source_file_path))
+        return None if entry is None else entry["destination"]
+    
+    def is_unchanged(self, source_file_path, source_stat):
+        """
+        Перевіряє, чи файл не змінився з моменту останнього копіювання.
+        
+        Спершу порівнюються розмір і mtime; хеш рахується лише тоді, коли
+        mtime змінився, а розмір - ні.
+        """
+        entry = self.entries.get(os.fspath(source_file_path))
+        
+        if entry is None or entry["size"] != source_stat.st_size:
+            return False
+        
+        if not (self.destination_directory_path / entry["destination"]).exists():
+            return False
+        
+        if entry["mtime_ns"] != source_stat.st_mtime_ns:
+            if not self.use_hash or entry.get("sha256") is None:
+                return False
+            
+            if calculate_file_hash(source_file_path) != entry["sha256"]:
+                return False
+            
+            self.record(source_file_path, entry["destination"], source_stat.st_size, source_stat.st_mtime_ns, entry["sha256"])
+        
+        with self.lock:
+            self.skipped_files_count += 1
+        return True
+    
+    def previous_destination(self, source_file_path):
+        """
+        Повертає (категорія, ім'я), куди файл копіювався раніше, щоб перезаписати
+        його замість створення _N копії.
+        """
+        entry = self.entries.get(os.fspath(source_file_path))
+        
+        if entry is None:
+            return None
+        
+        category, file_name = entry["destination"].split("/", 1)
+        
+        if not (self.destination_directory_path / category).is_dir():
+            return None
+        
+        return category, file_name
+    
+    def record(self, source_file_path, relative_destination, size, mtime_ns, file_hash=None):
+        if self.use_hash and file_hash is None:
+            file_hash = calculate_file_hash(source_file_path)
+        
+        entry = {
+            "source": os.fspath(source_file_path),
+            "destination": relative_destination,
+            "size": size,
+            "mtime_ns": mtime_ns,
+        }
+        if file_hash is not None:
+            entry["sha256"] = file_hash
+        
+        with self.lock:
+            self.entries[entry["source"]] = entry
+            
+            if self.manifest_file is not None:
+                self.manifest_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self.manifest_file.flush()
+    
+    def close(self):
+        """
+        Закриває маніфест і перезаписує його без застарілих записів.
+        """
+        if self.read_only:
+            return
+        
+        self.manifest_file.close()
+        
+        temporary_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+            for entry in self.entries.values():
+                manifest_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        
+        os.replace(temporary_path, self.manifest_path)
+
+
+DEDUP_MODES = ("hardlink", "reflink", "skip")
+PARTIAL_HASH_SIZE = 64 * 1024
+LINK_TARGET_WAIT_TIMEOUT = 300.0
+FICLONE_IOCTL = 0x40049409
+
+
+def calculate_partial_file_hash(file_path):
+    """
+    Обчислює SHA-256 перших PARTIAL_HASH_SIZE байт файлу.
+    """
+    with open(file_path, "rb") as source_file:
+        return hashlib.sha256(source_file.read(PARTIAL_HASH_SIZE)).hexdigest()
+
+
+def reflink_file(source_file_path, destination_file_path):
+    """
+    Створює reflink-копію (спільні блоки з оригіналом) через ioctl FICLONE.
+    
+    Працює лише на файлових системах із підтримкою reflink (Btrfs, XFS);
+    в іншому разі піднімає OSError.
+    """
+    if fcntl is None:
+        raise OSError("reflink не підтримується на цій платформі")
+    
+    with open(source_file_path, "rb") as source_file, open(destination_file_path, "wb") as destination_file:
+        try:
+            fcntl.ioctl(destination_file.fileno(), FICLONE_IOCTL, source_file.fileno())
+        except OSError:
+            destination_file.close()
+            os.unlink(destination_file_path)
+            raise
+
+
+class ContentEntry:
+    """
+    Запис індексу вмісту: один файл джерела та (ліниво) його хеші.
+    """
+    
+    __slots__ = ("source_path", "size", "relative_destination", "partial_hash", "full_hash")
+    
+    def __init__(self, source_path, size):
+        self.source_path = source_path
+        self.size = size
+        self.relative_destination = None
+        self.partial_hash = None
+        self.full_hash = None
+    
+    def get_partial_hash(self):
+        if self.partial_hash is None:
+            self.partial_hash = calculate_partial_file_hash(self.source_path)
+        return self.partial_hash
+    
+    def get_full_hash(self):
+        if self.full_hash is None:
+            self.full_hash = calculate_file_hash(self.source_path)
+        return self.full_hash
+
+
+class ContentIndex:
+    """
+    Індекс вмісту для пошуку байт-у-байт однакових файлів.
+    
+    Файли групуються за розміром; хеші рахуються лише тоді, коли в групі
+    з'являється другий файл: спершу частковий (перші 64 КБ), потім повний.
+    Унікальні за розміром файли не читаються зовсім.
+    
+    Класифікація виконується під час планування, тому вибір оригіналу
+    детермінований; потоки копіювання лише чекають, поки оригінал буде записано.
+    """
+    
+    def __init__(self, mode):
+        self.mode = mode
+        self.size_buckets = {}
+        self.source_entries = {}
+        self.finished_targets = {}
+        self.condition = threading.Condition()
+        self.duplicates_count = 0
+        self.duplicate_bytes = 0
+        self.saved_bytes = 0
+        self.fallback_copies_count = 0
+    
+    def classify(self, source_file_path, size):
+        """
+        Повертає (новий запис, None) для нового вмісту або (None, оригінал) для дубліката.
+        """
+        bucket = self.size_buckets.setdefault(size, [])
+        new_entry = ContentEntry(source_file_path, size)
+        
+        for candidate in bucket:
+            if self._has_same_content(candidate, new_entry):
+                self.register_duplicate(size)
+                return None, candidate
+        
+        bucket.append(new_entry)
+        self.source_entries[os.fspath(source_file_path)] = new_entry
+        return new_entry, None
+    
+    def add_existing(self, source_file_path, size, relative_destination):
+        """
+        Додає файл, уже скопійований попереднім запуском (--sync), як готовий оригінал.
+        
+        Так дублікати незмінених файлів і далі пропускаються або зв'язуються з ними.
+        """
+        existing_entry = ContentEntry(source_file_path, size)
+        existing_entry.relative_destination = relative_destination
+        self.size_buckets.setdefault(size, []).append(existing_entry)
+        self.source_entries[os.fspath(source_file_path)] = existing_entry
+        self.mark_finished(relative_destination, True)
+    
+    def forget(self, source_file_path):
+        """
+        Видаляє попередній запис файлу джерела (--watch), щоб змінений файл не збігся сам із собою.
+        
+        Хеші запису рахуються ліниво з поточного вмісту, тож застарілий запис
+        того самого файлу завжди виглядав би дублікатом нової версії.
+        """
+        previous_entry = self.source_entries.pop(os.fspath(source_file_path), None)
+        if previous_entry is not None:
+            self.size_buckets[previous_entry.size].remove(previous_entry)
+    
+    def _has_same_content(self, candidate, new_entry):
+        if candidate.get_partial_hash() != new_entry.get_partial_hash():
+            return False
+        
+        if new_entry.size <= PARTIAL_HASH_SIZE:
+            return True
+        
+        return candidate.get_full_hash() == new_entry.get_full_hash()
+    
+    def mark_finished(self, relative_destination, copied):
+        with self.condition:
+            self.finished_targets[relative_destination] = copied
+            self.condition.notify_all()
+    
+    def is_finished(self, relative_destination):
+        with self.condition:
+            return relative_destination in self.finished_targets
+    
+    def wait_for_target(self, relative_destination, timeout=LINK_TARGET_WAIT_TIMEOUT):
+        """
+        Чекає, поки оригінал буде скопійовано; повертає True, якщо копія вдалася.
+        
+        Якщо оригінал так і не з'явився за timeout секунд, повертає False,
+        і дублікат копіюється звичайним способом замість вічного очікування.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: relative_destination in self.finished_targets, timeout):
+                return False
+            return self.finished_targets[relative_destination]
+    
+    def register_duplicate(self, size):
+        with self.condition:
+            self.duplicates_count += 1
+            self.duplicate_bytes += size
+    
+    def register_saved(self, size):
+        with self.condition:
+            self.saved_bytes += size
+    
+    def link_duplicate(self, original_path, destination_file_path, size):
+        """
+        Створює дублікат як жорстке посилання або reflink на оригінал.
+        
+        Повертає False, якщо це неможливо (інша файлова система, немає
+        підтримки reflink) - тоді файл треба скопіювати звичайним способом.
+        """
+        try:
+            if self.mode == "hardlink":
+                os.link(original_path, destination_file_path)
+            else:
+                reflink_file(original_path, destination_file_path)
+            
+            self.register_saved(size)
+            return True
+        
+        except OSError:
+            with self.condition:
+                self.fallback_copies_count += 1
+            return False
+
+
+SMALL_FILE_THRESHOLD = 1024 * 1024
+ZERO_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+PORTABLE_COPY_BUFFER_SIZE = 1024 * 1024
+
+COPY_BACKEND_BULK = "bulk"
+COPY_BACKEND_COPY_FILE_RANGE = "copy_file_range"
+COPY_BACKEND_SENDFILE = "sendfile"
+COPY_BACKEND_PORTABLE = "portable"
+COPY_BACKEND_LINK = "link"
+
+# Помилки, після яких zero-copy метод не підходить для цієї пари файлів
+ZERO_COPY_UNSUPPORTED_ERRORS = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF)
+
+
+class FileCopyBackend:
+    """
+    Копіювання з вибором стратегії за розміром файлу.
+    
+    Малі файли читаються й записуються одним викликом. Великі копіюються
+    в ядрі через os.copy_file_range або os.sendfile блоками ZERO_COPY_CHUNK_SIZE,
+    а якщо ядро чи файлова система цього не підтримують - через shutil.copyfileobj.
+    Для кожної стратегії накопичуються кількість файлів, байти та час.
+    """
+    
+    def __init__(self, preserve_metadata=True, small_file_threshold=SMALL_FILE_THRESHOLD):
+        self.preserve_metadata = preserve_metadata
+        self.small_file_threshold = small_file_threshold
+        self.lock = threading.Lock()
+        self.backend_stats = {}
+        self.zero_copy_backends = [
+            backend for backend, available in (
+                (COPY_BACKEND_COPY_FILE_RANGE, hasattr(os, "copy_file_range")),
+                (COPY_BACKEND_SENDFILE, hasattr(os, "sendfile") and sys.platform.startswith("linux")),
+            ) if available
+        ]
+    
+    def copy(self, source_file_path, destination_file_path, size):
+        start_time = time.perf_counter()
+        
+        if size < self.small_file_threshold:
+            backend = self._copy_bulk(source_file_path, destination_file_path)
+        else:
+            backend = self._copy_large(source_file_path, destination_file_path)
+        
+        if self.preserve_metadata:
+            shutil.copystat(source_file_path, destination_file_path)
+        
+        self.record(backend, size, time.perf_counter() - start_time)
+    
+    def record(self, backend, size, elapsed_seconds):
+        with self.lock:
+            stats = self.backend_stats.setdefault(backend, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += size
+            stats[2] += elapsed_seconds
+    
+    def _copy_bulk(self, source_file_path, destination_file_path):
+        with open(source_file_path, "rb") as source_file:
+            content = source_file.read()
+        
+        with open(destination_file_path, "wb") as destination_file:
+            destination_file.write(content)
+        
+        return COPY_BACKEND_BULK
+    
+    def _copy_large(self, source_file_path, destination_file_path):
+        with open(source_file_path, "rb") as source_file, open(destination_file_path, "wb") as destination_file:
+            source_fd = source_file.fileno()
+            destination_fd = destination_file.fileno()
+            
+            for backend in list(self.zero_copy_backends):
+                try:
+                    if backend == COPY_BACKEND_COPY_FILE_RANGE:
+                        self._copy_with_copy_file_range(source_fd, destination_fd)
+                    else:
+                        self._copy_with_sendfile(source_fd, destination_fd)
+                    return backend
+                
+                except OSError as error:
+                    if error.errno not in ZERO_COPY_UNSUPPORTED_ERRORS:
+                        raise
+                    
+                    if error.errno == errno.ENOSYS:
+                        with self.lock:
+                            if backend in self.zero_copy_backends:
+                                self.zero_copy_backends.remove(backend)
+                    
+                    os.lseek(destination_fd, 0, os.SEEK_SET)
+                    os.ftruncate(destination_fd, 0)
+            
+            source_file.seek(0)
+            shutil.copyfileobj(source_file, destination_file, PORTABLE_COPY_BUFFER_SIZE)
+            return COPY_BACKEND_PORTABLE
+    
+    @staticmethod
+    def _copy_with_copy_file_range(source_fd, destination_fd):
+        offset = 0
+        while True:
+            copied_bytes = os.copy_file_range(source_fd, destination_fd, ZERO_COPY_CHUNK_SIZE, offset, offset)
+            if copied_bytes == 0:
+                break
+            offset += copied_bytes
+    
+    @staticmethod
+    def _copy_with_sendfile(source_fd, destination_fd):
+        offset = 0
+        while True:
+            copied_bytes = os.sendfile(destination_fd, source_fd, offset, ZERO_COPY_CHUNK_SIZE)
+            if copied_bytes == 0:
+                break
+            offset += copied_bytes
+    
+    def merge_backend_stats(self, backend_stats):
+        """
+        Додає статистику іншого FileCopyBackend у форматі get_backend_stats().
+        """
+        with self.lock:
+            for backend, files_count, bytes_count, elapsed_seconds in backend_stats:
+                stats = self.backend_stats.setdefault(backend, [0, 0, 0.0])
+                stats[0] += files_count
+                stats[1] += bytes_count
+                stats[2] += elapsed_seconds
+    
+    def get_backend_stats(self):
+        """
+        Повертає список (стратегія, файлів, байтів, секунд) у порядку спадання байтів.
+        """
+        with self.lock:
+            return sorted(
+                ((backend, *stats) for backend, stats in self.backend_stats.items()), 
+                key=lambda item: item[2], 
+                reverse=True
+            )
+
+
+OUTPUT_VERBOSE = "verbose"
+OUTPUT_QUIET = "quiet"
+OUTPUT_PROGRESS = "progress"
+
+PROGRESS_REFRESH_INTERVAL = 0.2
+JSON_LOG_BUFFER_SIZE = 1024 * 1024
+
+
+class EventReporter:
+    """
+    Виведення подій обробки в обраному режимі.
+    
+    verbose - кольоровий рядок на кожен файл і директорію (як раніше);
+    quiet - лише помилки; progress - один рядок з лічильниками, що
+    перемальовується не частіше ніж раз на PROGRESS_REFRESH_INTERVAL секунд.
+    Незалежно від режиму події можна писати в буферизований журнал JSON Lines.
+    """
+    
+    def __init__(self, mode=OUTPUT_VERBOSE, json_log_path=None):
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.counters = {"directories": 0, "planned": 0, "copied": 0, "skipped": 0, "errors": 0}
+        self.last_refresh_time = 0.0
+        self.progress_line_visible = False
+        self.json_log_file = None
+        
+        if json_log_path is not None:
+            self.json_log_file = open(json_log_path, "w", encoding="utf-8", buffering=JSON_LOG_BUFFER_SIZE)
+    
+    def directory_entered(self, directory_path):
+        if self.mode == OUTPUT_VERBOSE:
+            print(f"{Fore.BLUE}Обробляю директорію:{Style.RESET_ALL} {directory_path}")
+        
+        self._handle_event("directories", "directory", path=os.fspath(directory_path))
+    
+    def file_copied(self, source_file_path, destination_file_path, size):
+        if self.mode == OUTPUT_VERBOSE:
+            file_extension = source_file_path.suffix.lower()
+            print(f"{Fore.GREEN}Скопійовано:{Style.RESET_ALL} {source_file_path.name} -> {Fore.CYAN}{file_extension or 'no_extension'}/{Style.RESET_ALL}")
+        
+        self._handle_event(
+            "copied", 
+            "copied", 
+            source=os.fspath(source_file_path), 
+            destination=os.fspath(destination_file_path), 
+            size=size
+        )
+    
+    def file_planned(self, operation):
+        if self.mode == OUTPUT_VERBOSE:
+            print(f"{Fore.MAGENTA}План:{Style.RESET_ALL} {operation.source_path} -> {Fore.CYAN}{operation.relative_destination}{Style.RESET_ALL}")
+        
+        self._handle_event(
+            "planned", 
+            "planned", 
+            source=operation.source_path, 
+            destination=operation.relative_destination, 
+            size=operation.size
+        )
+    
+    def file_skipped(self, source_file_path, reason):
+        """
+        Пропущений файл: reason - "unchanged" (режим --sync) або "duplicate" (--dedup skip).
+        """
+        if self.mode == OUTPUT_VERBOSE and reason == "duplicate":
+            print(f"{Fore.YELLOW}Дублікат пропущено:{Style.RESET_ALL} {source_file_path.name}")
+        
+        self._handle_event("skipped", "skipped", source=os.fspath(source_file_path), reason=reason)
+    
+    def directory_skipped(self, directory_path, reason):
+        """
+        Пропущена директорія: reason - "symlink_cycle" (посилання на власного предка).
+        """
+        if self.mode == OUTPUT_VERBOSE:
+            print(f"{Fore.YELLOW}Пропущено цикл символьних посилань:{Style.RESET_ALL} {directory_path}")
+        
+        self._handle_event("skipped", "skipped", path=os.fspath(directory_path), reason=reason)
+    
+    def error(self, message, item_path):
+        with self.lock:
+            self._clear_progress_line()
+            print(f"{Fore.RED}{message}{Style.RESET_ALL}")
+        
+        self._handle_event("errors", "error", path=os.fspath(item_path), message=message)
+    
+    def _handle_event(self, counter_name, event_name, **event_fields):
+        if self.mode != OUTPUT_PROGRESS and self.json_log_file is None:
+            return
+        
+        with self.lock:
+            self.counters[counter_name] += 1
+            
+            if self.json_log_file is not None:
+                event_fields["event"] = event_name
+                event_fields["time"] = time.time()
+                self.json_log_file.write(json.dumps(event_fields, ensure_ascii=False) + "\n")
+            
+            if self.mode == OUTPUT_PROGRESS:
+                current_time = time.monotonic()
+                if current_time - self.last_refresh_time >= PROGRESS_REFRESH_INTERVAL:
+                    self.last_refresh_time = current_time
+                    self._draw_progress_line()
+    
+    def _draw_progress_line(self):
+        planned_part = ""
+        if self.counters["planned"]:
+            planned_part = f" | {Fore.MAGENTA}заплановано:{Style.RESET_ALL} {self.counters['planned']}"
+        
+        sys.stdout.write(
+            f"\r{Fore.CYAN}Директорій:{Style.RESET_ALL} {self.counters['directories']}"
+            f"{planned_part}"
+            f" | {Fore.GREEN}скопійовано:{Style.RESET_ALL} {self.counters['copied']}"
+            f" | {Fore.YELLOW}пропущено:{Style.RESET_ALL} {self.counters['skipped']}"
+            f" | {Fore.RED}помилок:{Style.RESET_ALL} {self.counters['errors']}"
+        )
+        sys.stdout.flush()
+        self.progress_line_visible = True
+    
+    def _clear_progress_line(self):
+        if self.progress_line_visible:
+            sys.stdout.write("\r\033[K")
+            self.progress_line_visible = False
+    
+    def close(self):
+        """
+        Домальовує останній стан прогресу та скидає журнал подій на диск.
+        """
+        with self.lock:
+            if self.mode == OUTPUT_PROGRESS:
+                self._draw_progress_line()
+                sys.stdout.write("\n")
+                self.progress_line_visible = False
+            
+            if self.json_log_file is not None:
+                self.json_log_file.close()
+                self.json_log_file = None
+
+
+@dataclass
+class OrganizerContext:
+    """
+    Додаткові служби, що спільно використовуються під час обробки файлів.
+    """
+    
+    destination_index: DestinationIndex = None
+    sync_manifest: SyncManifest = None
+    content_index: ContentIndex = None
+    copy_backend: FileCopyBackend = field(default_factory=FileCopyBackend)
+    reporter: EventReporter = field(default_factory=EventReporter)
+
+
+def format_bytes_count(bytes_count):
+    for unit in ("Б", "КБ", "МБ", "ГБ"):
+        if bytes_count < 1024:
+            return f"{bytes_count:.1f} {unit}"
+        bytes_count /= 1024
+    return f"{bytes_count:.1f} ТБ"
+
+
+class PlannedOperation(NamedTuple):
+    """
+    Одна операція плану: який файл, у яку категорію, під яким ім'ям і скільки байтів.
+    
+    link_target - відносний шлях оригіналу, якщо файл є дублікатом (--dedup).
+    """
+    
+    source_path: str
+    category: str
+    file_name: str
+    size: int
+    mtime_ns: int
+    inode: int
+    link_target: Optional[str] = None
+    
+    @property
+    def relative_destination(self):
+        return f"{self.category}/{self.file_name}"
+
+
+PLAN_FORMAT = "task_01-plan"
+PLAN_FORMAT_VERSION = 1
+
+ORDER_STREAM = "stream"
+ORDER_DESTINATION = "destination"
+ORDER_INODE = "inode"
+EXECUTION_ORDERS = (ORDER_STREAM, ORDER_DESTINATION, ORDER_INODE)
+
+
+def plan_file_operation(source_file_path, source_stat, context):
+    """
+    Вирішує, що зробити з одним файлом, нічого не змінюючи на диску.
+    
+    Повертає PlannedOperation або None, якщо файл пропущено (незмінений
+    у режимі --sync або дублікат у режимі --dedup skip).
+    """
+    sync_manifest = context.sync_manifest
+    content_index = context.content_index
+    previous_destination = None
+    new_content_entry = None
+    link_target = None
+    
+    if sync_manifest is not None:
+        if sync_manifest.is_unchanged(source_file_path, source_stat):
+            if content_index is not None:
+                content_index.add_existing(
+                    source_file_path, 
+                    source_stat.st_size, 
+                    sync_manifest.get_destination(source_file_path)
+                )
+            
+            context.reporter.file_skipped(source_file_path, "unchanged")
+            return None
+        
+        previous_destination = sync_manifest.previous_destination(source_file_path)
+    
+    if content_index is not None:
+        new_content_entry, original_entry = content_index.classify(source_file_path, source_stat.st_size)
+        
+        if original_entry is not None:
+            if content_index.mode == "skip":
+                skip_duplicate_file(source_file_path, context, source_stat)
+                return None
+            
+            link_target = original_entry.relative_destination
+    
+    if previous_destination is None:
+        category, file_name = context.destination_index.allocate(source_file_path)
+    else:
+        category, file_name = previous_destination
+        context.destination_index.reserve(category, file_name)
+    
+    operation = PlannedOperation(
+        os.fspath(source_file_path), 
+        category, 
+        file_name, 
+        source_stat.st_size, 
+        source_stat.st_mtime_ns, 
+        source_stat.st_ino, 
+        link_target
+    )
+    
+    if new_content_entry is not None:
+        new_content_entry.relative_destination = operation.relative_destination
+    
+    return operation
+
+
+def skip_duplicate_file(source_file_path, context, source_stat):
+    """
+    Пропускає дублікат у режимі --dedup skip.
+    
+    У маніфест дублікат не записується: інакше два джерела ділили б один
+    шлях призначення, і зміна будь-якого з них перезаписала б єдину копію
+    іншого. Наступний запуск знову розпізнає його як дублікат.
+    """
+    context.content_index.register_saved(source_stat.st_size)
+    context.reporter.file_skipped(source_file_path, "duplicate")
+
+
+def execute_planned_operation(operation, context):
+    """
+    Виконує одну операцію плану: копіює файл або створює посилання на оригінал.
+    
+    Якщо в контексті є маніфест, успішна копія одразу записується в нього.
+    """
+    source_file_path = Path(operation.source_path)
+    destination_index = context.destination_index
+    destination_file_path = destination_index.destination_directory_path / operation.category / operation.file_name
+    
+    copied = False
+    try:
+        destination_index.prepare_category(operation.category)
+        
+        if context.sync_manifest is not None:
+            # Розриваємо можливе жорстке посилання з попереднього запуску
+            destination_file_path.unlink(missing_ok=True)
+        
+        linked = False
+        if operation.link_target is not None and context.content_index.wait_for_target(operation.link_target):
+            link_start_time = time.perf_counter()
+            linked = context.content_index.link_duplicate(
+                destination_index.destination_directory_path / operation.link_target, 
+                destination_file_path, 
+                operation.size
+            )
+            
+            if linked:
+                context.copy_backend.record(COPY_BACKEND_LINK, operation.size, time.perf_counter() - link_start_time)
+        
+        if not linked:
+            context.copy_backend.copy(source_file_path, destination_file_path, operation.size)
+        
+        copied = True
+        destination_index.record_copied(operation.category, operation.size)
+        
+        if context.sync_manifest is not None:
+            context.sync_manifest.record(
+                source_file_path, 
+                operation.relative_destination, 
+                operation.size, 
+                operation.mtime_ns
+            )
+        
+        context.reporter.file_copied(source_file_path, destination_file_path, operation.size)
+        return True
+        
+    except Exception as error:
+        context.reporter.error(f"Помилка копіювання файлу {source_file_path}: {error}", source_file_path)
+        return False
+    
+    finally:
+        if context.content_index is not None and operation.link_target is None:
+            context.content_index.mark_finished(operation.relative_destination, copied)
+
+
+def copy_file_to_destination(source_file_path, destination_directory_path, context=None):
+    """
+    Копіює файл до відповідної піддиректорії на основі розширення.
+    
+    Це план з однієї операції, виконаний одразу. Повертає True, якщо файл
+    скопійовано або пропущено як незмінений чи дублікат.
+    """
+    if context is None:
+        context = OrganizerContext(destination_index=DestinationIndex(destination_directory_path))
+    
+    try:
+        operation = plan_file_operation(source_file_path, source_file_path.stat(), context)
+    except Exception as error:
+        context.reporter.error(f"Помилка копіювання файлу {source_file_path}: {error}", source_file_path)
+        return False
+    
+    return operation is None or execute_planned_operation(operation, context)
+
+
+class ParallelFileCopier:
+    """
+    Обмежений пул потоків для копіювання файлів.
+    
+    Імена призначення резервуються ще на етапі планування, тому структура
+    результату детермінована незалежно від порядку завершення копій.
+    Кількість операцій у черзі обмежена, щоб планування не випереджало копіювання.
+    """
+    
+    def __init__(self, workers_count, context):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.context = context
+        self.executor = ThreadPoolExecutor(max_workers=workers_count)
+        self.pending_slots = threading.BoundedSemaphore(workers_count * 2)
+        self.counters_lock = threading.Lock()
+        self.processed_files_count = 0
+        self.errors_count = 0
+    
+    def submit(self, operation):
+        self.pending_slots.acquire()
+        try:
+            future = self.executor.submit(execute_planned_operation, operation, self.context)
+        except Exception:
+            self.pending_slots.release()
+            raise
+        
+        future.add_done_callback(self._on_copy_finished)
+    
+    def _on_copy_finished(self, future):
+        copied = not future.cancelled() and future.exception() is None and future.result()
+        
+        with self.counters_lock:
+            if copied:
+                self.processed_files_count += 1
+            else:
+                self.errors_count += 1
+        
+        self.pending_slots.release()
+    
+    def finish(self):
+        """
+        Чекає завершення всіх копіювань і повертає (оброблено, помилок).
+        """
+        self.executor.shutdown(wait=True)
+        return self.processed_files_count, self.errors_count
+
+
+def iterate_source_files(root_directory_path, on_directory=None, on_error=None, on_skip=None, root_ancestor_keys=frozenset()):
+    """
+    Ітеративно обходить дерево директорій через os.scandir і віддає файли потоком.
+    
+    Для кожного файлу повертається os.DirEntry: тип елемента береться з кешу
+    DirEntry, тому зайвих stat-викликів на файл немає. Замість рекурсії
+    використовується стек директорій, тож глибина дерева не обмежена лімітом
+    рекурсії, а в пам'яті тримаються лише ще не відвідані директорії.
+    Разом із кожною директорією в стеку лежать st_dev/st_ino її предків:
+    директорія, що є власним предком, - це цикл символьних посилань, і
+    вона пропускається через on_skip(шлях, причина). Повторний візит без
+    циклу (два посилання на одну директорію) обходиться як звичайно.
+    root_ancestor_keys - предки кореня обходу, якщо він сам є частиною
+    більшого дерева (шард у режимі --processes).
+    """
+    pending_directories = [(os.fspath(root_directory_path), frozenset(root_ancestor_keys))]
+    
+    while pending_directories:
+        directory_path, ancestor_keys = pending_directories.pop()
+        subdirectories = []
+        
+        try:
+            directory_stat = os.stat(directory_path)
+            directory_key = (directory_stat.st_dev, directory_stat.st_ino)
+            
+            if directory_key in ancestor_keys:
+                if on_skip is not None:
+                    on_skip(Path(directory_path), "symlink_cycle")
+                continue
+            
+            if on_directory is not None:
+                on_directory(Path(directory_path))
+            
+            with os.scandir(directory_path) as directory_entries:
+                for entry in directory_entries:
+                    try:
+                        if entry.is_file():
+                            yield entry
+                        elif entry.is_dir():
+                            subdirectories.append(entry.path)
+                    except OSError as error:
+                        if on_error is not None:
+                            on_error(Path(entry.path), error)
+        
+        except OSError as error:
+            if on_error is not None:
+                on_error(Path(directory_path), error)
+        
+        # Розвертаємо, щоб піддиректорії оброблялись у порядку scandir
+        if subdirectories:
+            child_ancestor_keys = ancestor_keys | {directory_key}
+            pending_directories.extend((subdirectory, child_ancestor_keys) for subdirectory in reversed(subdirectories))
+
+
+def plan_directory_operations(source_directory_path, context, on_error):
+    """
+    Потоком віддає PlannedOperation для кожного файлу дерева директорії.
+    
+    Помилки обходу й планування передаються в on_error(повідомлення, шлях).
+    """
+    def report_traversal_error(item_path, error):
+        if isinstance(error, PermissionError):
+            on_error(f"Немає доступу до: {item_path}", item_path)
+        else:
+            on_error(f"Помилка читання {item_path}: {error}", item_path)
+    
+    for file_entry in iterate_source_files(
+        source_directory_path, 
+        context.reporter.directory_entered, 
+        report_traversal_error, 
+        context.reporter.directory_skipped
+    ):
+        item_path = Path(file_entry.path)
+        
+        try:
+            operation = plan_file_operation(item_path, file_entry.stat(), context)
+        except Exception as error:
+            on_error(f"Помилка обробки {item_path}: {error}", item_path)
+            continue
+        
+        if operation is not None:
+            yield operation
+
+
+def execute_operations(operations, context, file_copier=None):
+    """
+    Виконує операції по черзі (або передає їх у file_copier) і повертає (оброблено, помилок).
+    
+    Операції, передані в file_copier, рахуються ним самим після завершення копіювання.
+    """
+    processed_files_count = 0
+    errors_count = 0
+    
+    for operation in operations:
+        if file_copier is not None:
+            file_copier.submit(operation)
+        elif execute_planned_operation(operation, context):
+            processed_files_count += 1
+        else:
+            errors_count += 1
+    
+    return processed_files_count, errors_count
+
+
+def process_directory_recursively(
+    current_directory_path, 
+    destination_directory_path, 
+    file_copier=None, 
+    context=None
+):
+    """
+    Обробляє все дерево директорії, копіюючи всі файли.
+
+    1. plan_directory_operations потоком вирішує долю кожного файлу:
+       пропуск незміненого (--sync), дублікат (--dedup), вільне ім'я
+    2. execute_operations одразу виконує кожну операцію (або передає в file_copier)
+    3. Помилки обходу рахуються разом із помилками копіювання
+    """
+    if context is None:
+        context = OrganizerContext(destination_index=DestinationIndex(destination_directory_path))
+    
+    planning_errors_count = 0
+    
+    def report_planning_error(message, item_path):
+        nonlocal planning_errors_count
+        context.reporter.error(message, item_path)
+        planning_errors_count += 1
+    
+    operations = plan_directory_operations(current_directory_path, context, report_planning_error)
+    processed_files_count, errors_count = execute_operations(operations, context, file_copier)
+    
+    return processed_files_count, errors_count + planning_errors_count
+
+
+ASYNC_LIST_CONCURRENCY = 4
+ASYNC_STAT_CONCURRENCY = 16
+ASYNC_COPY_CONCURRENCY = 8
+ASYNC_QUEUE_SIZE_PER_WORKER = 4
+
+
+def list_directory_entries(directory_path):
+    """
+    Читає одну директорію і повертає (st_dev/st_ino, файли, піддиректорії, помилки елементів).
+    """
+    directory_stat = os.stat(directory_path)
+    file_paths = []
+    subdirectory_paths = []
+    entry_errors = []
+    
+    with os.scandir(directory_path) as directory_entries:
+        for entry in directory_entries:
+            try:
+                if entry.is_file():
+                    file_paths.append(entry.path)
+                elif entry.is_dir():
+                    subdirectory_paths.append(entry.path)
+            except OSError as error:
+                entry_errors.append((entry.path, error))
+    
+    return (directory_stat.st_dev, directory_stat.st_ino), file_paths, subdirectory_paths, entry_errors
+
+
+async def run_async_pipeline(
+    source_directory_path, 
+    context, 
+    on_error, 
+    list_concurrency, 
+    stat_concurrency, 
+    copy_concurrency
+):
+    """
+    Конвеєр із трьох етапів, з'єднаних обмеженими чергами asyncio.
+    
+    1. Читання директорій (list_concurrency задач) наповнює чергу файлів
+    2. stat і планування (stat_concurrency задач) наповнюють чергу операцій
+    3. Копіювання (copy_concurrency задач) виконує операції
+    
+    Блокуючі системні виклики виконуються в пулі потоків, тож очікування
+    мережевих відповідей на різних етапах перекривається. Планування
+    (вибір імені, дедуплікація з читанням хешів) теж іде в пулі потоків,
+    щоб хешування не зупиняло цикл подій і копіювання; виклики планування
+    серіалізуються замком, бо індекс вмісту не розрахований на паралельний доступ.
+    
+    Кілька задач планування можуть поставити дублікат у чергу раніше за
+    його оригінал, і він зайняв би задачу копіювання очікуванням. Тому
+    дублікат, чий оригінал ще не записано, відкладається й виконується
+    тією задачею копіювання, що завершила оригінал.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=list_concurrency + stat_concurrency + copy_concurrency))
+    
+    directory_queue = asyncio.Queue()
+    file_queue = asyncio.Queue(maxsize=stat_concurrency * ASYNC_QUEUE_SIZE_PER_WORKER)
+    operation_queue = asyncio.Queue(maxsize=copy_concurrency * ASYNC_QUEUE_SIZE_PER_WORKER)
+    deferred_duplicates = {}
+    planning_lock = threading.Lock()
+    counters = {"processed": 0, "errors": 0}
+    
+    def report_error(item_path, error):
+        if isinstance(error, PermissionError):
+            on_error(f"Немає доступу до: {item_path}", Path(item_path))
+        else:
+            on_error(f"Помилка читання {item_path}: {error}", Path(item_path))
+    
+    async def list_directories():
+        while True:
+            directory_path, ancestor_keys = await directory_queue.get()
+            
+            try:
+                directory_key, file_paths, subdirectory_paths, entry_errors = await asyncio.to_thread(
+                    list_directory_entries, 
+                    directory_path
+                )
+                
+                # Як і в iterate_source_files: циклом є лише посилання на предка
+                if directory_key in ancestor_keys:
+                    context.reporter.directory_skipped(Path(directory_path), "symlink_cycle")
+                    continue
+                
+                context.reporter.directory_entered(Path(directory_path))
+                
+                for entry_path, error in entry_errors:
+                    report_error(entry_path, error)
+                
+                child_ancestor_keys = ancestor_keys | {directory_key}
+                for subdirectory_path in subdirectory_paths:
+                    directory_queue.put_nowait((subdirectory_path, child_ancestor_keys))
+                
+                for file_path in file_paths:
+                    await file_queue.put(file_path)
+            
+            except Exception as error:
+                report_error(directory_path, error)
+            
+            finally:
+                directory_queue.task_done()
+    
+    def stat_and_plan_file(item_path):
+        source_stat = os.stat(item_path)
+        
+        with planning_lock:
+            return plan_file_operation(item_path, source_stat, context)
+    
+    async def plan_files():
+        while (file_path := await file_queue.get()) is not None:
+            item_path = Path(file_path)
+            
+            try:
+                operation = await asyncio.to_thread(stat_and_plan_file, item_path)
+            except Exception as error:
+                on_error(f"Помилка обробки {item_path}: {error}", item_path)
+                continue
+            
+            if operation is None:
+                continue
+            
+            if operation.link_target is not None and not context.content_index.is_finished(operation.link_target):
+                deferred_duplicates.setdefault(operation.link_target, []).append(operation)
+                continue
+            
+            await operation_queue.put(operation)
+    
+    async def execute_operation(operation):
+        if await asyncio.to_thread(execute_planned_operation, operation, context):
+            counters["processed"] += 1
+        else:
+            counters["errors"] += 1
+    
+    async def copy_files():
+        while (operation := await operation_queue.get()) is not None:
+            await execute_operation(operation)
+            
+            # Оригінал уже позначено завершеним, тож дублікати не чекатимуть
+            if operation.link_target is None:
+                for duplicate_operation in deferred_duplicates.pop(operation.relative_destination, []):
+                    await execute_operation(duplicate_operation)
+    
+    list_tasks = [asyncio.create_task(list_directories()) for _ in range(list_concurrency)]
+    plan_tasks = [asyncio.create_task(plan_files()) for _ in range(stat_concurrency)]
+    copy_tasks = [asyncio.create_task(copy_files()) for _ in range(copy_concurrency)]
+    
+    directory_queue.put_nowait((os.fspath(source_directory_path), frozenset()))
+    await directory_queue.join()
+    
+    for task in list_tasks:
+        task.cancel()
+    
+    for _ in plan_tasks:
+        await file_queue.put(None)
+    await asyncio.gather(*plan_tasks)
+    
+    for _ in copy_tasks:
+        await operation_queue.put(None)
+    await asyncio.gather(*copy_tasks)
+    
+    # Оригінал, що так і не потрапив у чергу (помилка планування), не
+    # буде позначено завершеним - такі дублікати копіюються звичайним способом
+    for duplicate_operations in deferred_duplicates.values():
+        for duplicate_operation in duplicate_operations:
+            await execute_operation(duplicate_operation._replace(link_target=None))
+    
+    return counters["processed"], counters["errors"]
+
+
+def process_directory_async(
+    current_directory_path, 
+    context, 
+    on_error, 
+    list_concurrency=ASYNC_LIST_CONCURRENCY, 
+    stat_concurrency=ASYNC_STAT_CONCURRENCY, 
+    copy_concurrency=ASYNC_COPY_CONCURRENCY
+):
+    """
+    Обробляє дерево директорії конвеєром asyncio і повертає (оброблено, помилок копіювання).
+    
+    Помилки обходу й планування передаються в on_error(повідомлення, шлях).
+    Порядок надходження файлів залежить від затримок мережі, тому при
+    конфліктах імен суфікси _N можуть відрізнятися між запусками.
+    """
+    import asyncio
+    
+    return asyncio.run(run_async_pipeline(
+        current_directory_path, 
+        context, 
+        on_error, 
+        list_concurrency, 
+        stat_concurrency, 
+        copy_concurrency
+    ))
+
+
+SHARD_ALLOCATION_BATCH_SIZE = 512
+
+
+class DestinationIndexManager(BaseManager):
+    """
+    Процес-менеджер, що тримає єдиний DestinationIndex для всіх процесів --processes.
+    """
+
+
+DestinationIndexManager.register("DestinationIndex", DestinationIndex)
+
+
+class ShardDestinationIndex:
+    """
+    Індекс призначення всередині процесу-воркера (--processes).
+    
+    Імена виділяє спільний DestinationIndex у процесі менеджера пакетами,
+    тож суфікси _N не конфліктують між процесами. Директорії категорій
+    і лічильники копій ведуться локально й повертаються в ShardResult.
+    """
+    
+    def __init__(self, destination_directory_path, shared_index):
+        self.destination_directory_path = destination_directory_path
+        self.shared_index = shared_index
+        self.lock = threading.Lock()
+        self.created_categories = set()
+        self.copied_files_counts = {}
+        self.copied_bytes_counts = {}
+    
+    def prepare_category(self, category):
+        if category in self.created_categories:
+            return
+        
+        with self.lock:
+            if category not in self.created_categories:
+                create_destination_subdirectory(self.destination_directory_path, category)
+                self.created_categories.add(category)
+    
+    def allocate_many(self, source_file_paths):
+        return self.shared_index.allocate_many([source_file_path.name for source_file_path in source_file_paths])
+    
+    def record_copied(self, category, size):
+        with self.lock:
+            self.copied_files_counts[category] = self.copied_files_counts.get(category, 0) + 1
+            self.copied_bytes_counts[category] = self.copied_bytes_counts.get(category, 0) + size
+
+
+class ShardResult(NamedTuple):
+    """
+    Підсумок одного шарда: (оброблено, помилок) і лічильники для загального звіту.
+    """
+    
+    processed_files_count: int
+    errors_count: int
+    copied_files_counts: dict
+    copied_bytes_counts: dict
+    backend_stats: list
+
+
+def list_source_shards(source_directory_path, on_error):
+    """
+    Розбиває джерело на шарди: кожна директорія верхнього рівня - окремий шард,
+    усі файли кореня разом - ще один.
+    
+    Шард - це список шляхів, які обробляє один процес.
+    """
+    root_files = []
+    shards = []
+    
+    try:
+        with os.scandir(source_directory_path) as root_entries:
+            for entry in sorted(root_entries, key=lambda root_entry: root_entry.name):
+                try:
+                    if entry.is_file():
+                        root_files.append(entry.path)
+                    elif entry.is_dir():
+                        shards.append([entry.path])
+                except OSError as error:
+                    on_error(f"Помилка читання {entry.path}: {error}", Path(entry.path))
+    
+    except OSError as error:
+        on_error(f"Помилка читання {source_directory_path}: {error}", source_directory_path)
+    
+    if root_files:
+        shards.insert(0, root_files)
+    
+    return shards
+
+
+def plan_shard_operations(shard_paths, context, on_error):
+    """
+    Потоком віддає PlannedOperation для файлів шарда, виділяючи імена пакетами.
+    """
+    def report_traversal_error(item_path, error):
+        if isinstance(error, PermissionError):
+            on_error(f"Немає доступу до: {item_path}", item_path)
+        else:
+            on_error(f"Помилка читання {item_path}: {error}", item_path)
+    
+    def iterate_shard_files():
+        for shard_path in shard_paths:
+            if os.path.isdir(shard_path):
+                # Корінь джерела - предок кожного шарда, тож посилання на нього теж цикл
+                try:
+                    source_root_stat = os.stat(os.path.dirname(shard_path))
+                    root_ancestor_keys = {(source_root_stat.st_dev, source_root_stat.st_ino)}
+                except OSError:
+                    root_ancestor_keys = frozenset()
+                
+                yield from iterate_source_files(
+                    shard_path, 
+                    context.reporter.directory_entered, 
+                    report_traversal_error, 
+                    context.reporter.directory_skipped, 
+                    root_ancestor_keys
+                )
+            else:
+                yield Path(shard_path)
+    
+    pending_files = []
+    
+    def flush_pending_files():
+        allocated_names = context.destination_index.allocate_many([source_file_path for source_file_path, _ in pending_files])
+        
+        for (source_file_path, source_stat), (category, file_name) in zip(pending_files, allocated_names):
+            yield PlannedOperation(
+                os.fspath(source_file_path), 
+                category, 
+                file_name, 
+                source_stat.st_size, 
+                source_stat.st_mtime_ns, 
+                source_stat.st_ino
+            )
+        
+        pending_files.clear()
+    
+    for file_entry in iterate_shard_files():
+        item_path = Path(file_entry)
+        
+        try:
+            pending_files.append((item_path, file_entry.stat()))
+        except Exception as error:
+            on_error(f"Помилка обробки {item_path}: {error}", item_path)
+            continue
+        
+        if len(pending_files) >= SHARD_ALLOCATION_BATCH_SIZE:
+            yield from flush_pending_files()
+    
+    if pending_files:
+        yield from flush_pending_files()
+
+
+def organize_shard(shard_paths, destination_directory_path, shared_index, workers_count, output_mode, preserve_metadata):
+    """
+    Обробляє один шард у процесі-воркері та повертає ShardResult.
+    """
+    context = OrganizerContext(
+        destination_index=ShardDestinationIndex(destination_directory_path, shared_index), 
+        copy_backend=FileCopyBackend(preserve_metadata=preserve_metadata), 
+        reporter=EventReporter(output_mode)
+    )
+    planning_errors_count = 0
+    
+    def report_planning_error(message, item_path):
+        nonlocal planning_errors_count
+        context.reporter.error(message, item_path)
+        planning_errors_count += 1
+    
+    operations = plan_shard_operations(shard_paths, context, report_planning_error)
+    
+    if workers_count > 1:
+        file_copier = ParallelFileCopier(workers_count, context)
+        try:
+            processed_files_count, errors_count = execute_operations(operations, context, file_copier)
+        finally:
+            copied_files, copy_errors = file_copier.finish()
+        processed_files_count += copied_files
+        errors_count += copy_errors
+    else:
+        processed_files_count, errors_count = execute_operations(operations, context)
+    
+    context.reporter.close()
+    
+    return ShardResult(
+        processed_files_count, 
+        errors_count + planning_errors_count, 
+        context.destination_index.copied_files_counts, 
+        context.destination_index.copied_bytes_counts, 
+        context.copy_backend.get_backend_stats()
+    )
+
+
+def process_directory_sharded(current_directory_path, context, processes_count, workers_count, on_error):
+    """
+    Обробляє дерево в processes_count процесах, по шарду (піддереву верхнього рівня) на завдання.
+    
+    Шарди роздаються пулом процесів динамічно, тож великі піддерева не
+    блокують решту. Імена призначення виділяє спільний DestinationIndex
+    у процесі менеджера, тому конфліктів між процесами немає, але суфікси _N
+    залежать від порядку виконання шардів. Результати (оброблено, помилок)
+    кожного шарда зводяться в один підсумок і в статистику context.
+    Повертає (оброблено, помилок копіювання).
+    """
+    destination_index = context.destination_index
+    shards = list_source_shards(current_directory_path, on_error)
+    output_mode = OUTPUT_VERBOSE if context.reporter.mode == OUTPUT_VERBOSE else OUTPUT_QUIET
+    processed_files_count = 0
+    errors_count = 0
+    
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    with DestinationIndexManager() as manager:
+        shared_index = manager.DestinationIndex(destination_index.destination_directory_path)
+        
+        with ProcessPoolExecutor(max_workers=processes_count) as executor:
+            shard_futures = {
+                executor.submit(
+                    organize_shard, 
+                    shard_paths, 
+                    destination_index.destination_directory_path, 
+                    shared_index, 
+                    workers_count, 
+                    output_mode, 
+                    context.copy_backend.preserve_metadata
+                ): shard_paths 
+                for shard_paths in shards
+            }
+            
+            for future in as_completed(shard_futures):
+                shard_paths = shard_futures[future]
+                
+                try:
+                    shard_result = future.result()
+                except Exception as error:
+                    on_error(f"Помилка обробки шарда {shard_paths[0]}: {error}", Path(shard_paths[0]))
+                    continue
+                
+                processed_files_count += shard_result.processed_files_count
+                errors_count += shard_result.errors_count
+                destination_index.merge_shard_stats(shard_result.copied_files_counts, shard_result.copied_bytes_counts)
+                context.copy_backend.merge_backend_stats(shard_result.backend_stats)
+    
+    return processed_files_count, errors_count
+
+
+WATCH_DEBOUNCE_SECONDS = 1.0
+WATCH_MAX_BATCH_DELAY = 10.0
+WATCH_POLL_INTERVAL = 2.0
+INOTIFY_READ_SIZE = 64 * 1024
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+INOTIFY_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """
+    Спостерігач за деревом через Linux inotify (ctypes, без сторонніх пакетів).
+    
+    Файл вважається зміненим після IN_CLOSE_WRITE або IN_MOVED_TO, тож
+    напівзаписані файли не копіюються. Нові директорії одразу беруться під
+    спостереження, а файли, що з'явились у них до цього, віддаються як зміни.
+    При переповненні черги ядра (IN_Q_OVERFLOW) віддається все дерево -
+    маніфест синхронізації відсіє незмінені файли.
+    """
+    
+    def __init__(self, root_directory_path, libc):
+        self.root_directory_path = root_directory_path
+        self.libc = libc
+        self.watched_directories = {}
+        self.inotify_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        
+        if self.inotify_fd < 0:
+            import ctypes
+            
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+        
+        self._watch_tree(root_directory_path)
+    
+    def _watch_tree(self, directory_path):
+        """
+        Додає спостереження за директорією та всіма піддиректоріями й повертає файли, що в них уже є.
+        """
+        existing_files = set()
+        pending_directories = [os.fspath(directory_path)]
+        
+        while pending_directories:
+            current_directory = pending_directories.pop()
+            watch_descriptor = self.libc.inotify_add_watch(
+                self.inotify_fd, 
+                os.fsencode(current_directory), 
+                INOTIFY_WATCH_MASK
+            )
+            
+            if watch_descriptor < 0:
+                continue
+            
+            self.watched_directories[watch_descriptor] = current_directory
+            
+            try:
+                with os.scandir(current_directory) as directory_entries:
+                    for entry in directory_entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_directories.append(entry.path)
+                        elif entry.is_file():
+                            existing_files.add(entry.path)
+            except OSError:
+                continue
+        
+        return existing_files
+    
+    def read_changes(self, timeout):
+        """
+        Чекає подій не довше timeout секунд (None - без обмеження) і повертає множину шляхів файлів.
+        """
+        readable, _, _ = select.select([self.inotify_fd], [], [], timeout)
+        
+        if not readable:
+            return set()
+        
+        changed_files = set()
+        
+        try:
+            buffer = os.read(self.inotify_fd, INOTIFY_READ_SIZE)
+        except BlockingIOError:
+            return changed_files
+        
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, name_length = INOTIFY_EVENT_HEADER.unpack_from(buffer, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + name_length].rstrip(b"\0"))
+            offset += name_length
+            
+            if mask & IN_Q_OVERFLOW:
+                changed_files |= self._watch_tree(self.root_directory_path)
+                continue
+            
+            directory_path = self.watched_directories.get(watch_descriptor)
+            if directory_path is None or not name:
+                continue
+            
+            item_path = os.path.join(directory_path, name)
+            
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    changed_files |= self._watch_tree(item_path)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                changed_files.add(item_path)
+        
+        return changed_files
+    
+    def close(self):
+        os.close(self.inotify_fd)
+
+
+class PollingWatcher:
+    """
+    Запасний спостерігач: періодично обходить дерево й порівнює mtime та розмір файлів.
+    
+    Використовує той самий обхід через os.scandir, що й звичайний запуск,
+    тож на файл припадає один stat без відкриття.
+    """
+    
+    def __init__(self, root_directory_path, poll_interval=WATCH_POLL_INTERVAL):
+        self.root_directory_path = root_directory_path
+        self.poll_interval = poll_interval
+        self.file_signatures = self._scan()
+    
+    def _scan(self):
+        file_signatures = {}
+        
+        for file_entry in iterate_source_files(self.root_directory_path):
+            try:
+                file_stat = file_entry.stat()
+            except OSError:
+                continue
+            file_signatures[file_entry.path] = (file_stat.st_mtime_ns, file_stat.st_size)
+        
+        return file_signatures
+    
+    def read_changes(self, timeout):
         """
-    )
+        Повертає файли, що з'явились або змінились з попереднього обходу.
+        """
+        while True:
+            time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            
+            file_signatures = self._scan()
+            changed_files = {
+                file_path 
+                for file_path, signature in file_signatures.items() 
+                if self.file_signatures.get(file_path) != signature
+            }
+            self.file_signatures = file_signatures
+            
+            if changed_files or timeout is not None:
+                return changed_files
     
-    parser.add_argument(
-        "source_directory",
-        type=Path,
-        help="Шлях до вихідної директорії"
-    )
+    def close(self):
+        pass
+
+
+def create_source_watcher(root_directory_path):
+    """
+    Повертає InotifyWatcher на Linux або PollingWatcher, якщо inotify недоступний.
+    """
+    if sys.platform.startswith("linux"):
+        import ctypes
+        import ctypes.util
+        
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+            if hasattr(libc, "inotify_init1"):
+                return InotifyWatcher(root_directory_path, libc)
+        except OSError:
+            pass
     
-    parser.add_argument(
-        "destination_directory", 
-        type=Path,
-        nargs='?',
-        default=Path("dist"),
-        help="Шлях до директорії призначення (за замовчуванням: dist)"
-    )
+    return PollingWatcher(root_directory_path)
+
+
+def wait_for_change_batch(watcher, debounce_seconds):
+    """
+    Блокує до першої зміни, потім збирає наступні, доки debounce_seconds
+    не мине без нових подій (але не довше WATCH_MAX_BATCH_DELAY).
+    """
+    changed_files = set()
     
-    return parser.parse_args()
+    while not changed_files:
+        changed_files = watcher.read_changes(None)
+    
+    batch_deadline = time.monotonic() + WATCH_MAX_BATCH_DELAY
+    
+    while time.monotonic() < batch_deadline:
+        more_changes = watcher.read_changes(debounce_seconds)
+        if not more_changes:
+            break
+        changed_files |= more_changes
+    
+    return changed_files
 
 
-def create_destination_subdirectory(destination_base_path, file_extension):
+def plan_changed_files(changed_files, context, on_error):
     """
-    Створює піддиректорію для файлів із вказанним розширенням.
+    Потоком віддає PlannedOperation для змінених файлів пакета у стабільному порядку.
+    """
+    destination_directory_path = os.fspath(context.destination_index.destination_directory_path)
     
-    Функція створює директорію, якщо вона не існує.
+    for file_path in sorted(changed_files):
+        item_path = Path(file_path)
+        
+        # Директорія призначення всередині джерела не має повертатися в обробку
+        if file_path.startswith(destination_directory_path + os.sep):
+            continue
+        
+        if context.content_index is not None:
+            context.content_index.forget(item_path)
+        
+        try:
+            source_stat = item_path.stat()
+            operation = plan_file_operation(item_path, source_stat, context)
+        except FileNotFoundError:
+            # Тимчасовий файл, видалений до кінця пакета
+            continue
+        except Exception as error:
+            on_error(f"Помилка обробки {item_path}: {error}", item_path)
+            continue
+        
+        if operation is not None:
+            yield operation
+
+
+def watch_directory(current_directory_path, context, workers_count, on_error, debounce_seconds=WATCH_DEBOUNCE_SECONDS):
+    """
+    Сортує дерево, а потім залишається працювати й сортує нові та змінені файли.
     
+    Потребує маніфесту синхронізації в context: змінений файл перезаписує
+    свою попередню копію, а незмінені події відсіюються. Зміни збираються
+    пакетами (debounce), тож серія записів у файл дає одне копіювання.
+    Зупиняється через Ctrl+C і повертає сумарні (оброблено, помилок копіювання).
     """
-    extension_clean = file_extension.lstrip('.') if file_extension else 'no_extension'
+    processed_files_count, errors_count = run_operations(
+        plan_directory_operations(current_directory_path, context, on_error), 
+        context, 
+        workers_count
+    )
     
-    subdirectory_path = destination_base_path / extension_clean
+    watcher = create_source_watcher(current_directory_path)
+    print(f"{Fore.BLUE}[WATCH]{Style.RESET_ALL} Очікую змін ({type(watcher).__name__}), Ctrl+C - вихід")
     
     try:
-        subdirectory_path.mkdir(parents=True, exist_ok=True)
-        return subdirectory_path
+        while True:
+            changed_files = wait_for_change_batch(watcher, debounce_seconds)
+            batch_processed, batch_errors = run_operations(
+                plan_changed_files(changed_files, context, on_error), 
+                context, 
+                workers_count, 
+                announce_workers=False
+            )
+            processed_files_count += batch_processed
+            errors_count += batch_errors
+            
+            print(
+                f"{Fore.BLUE}[WATCH]{Style.RESET_ALL} Подій: {len(changed_files)}, "
+                f"скопійовано: {batch_processed}, помилок: {batch_errors}"
+            )
     
-    except OSError as error:
-        print(f"{Fore.RED}Помилка створення директорії {subdirectory_path}: {error}{Style.RESET_ALL}")
-        raise
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Спостереження зупинено{Style.RESET_ALL}")
+    
+    finally:
+        watcher.close()
+    
+    return processed_files_count, errors_count
+
 
+ARCHIVE_FORMATS = ("tar", "zip")
+ARCHIVE_INDEX_SUFFIX = ".index.jsonl"
 
-def copy_file_to_destination(source_file_path, destination_directory_path):
+
+class ArchiveBucketWriter:
     """
-    Копіює файл до відповідної піддиректорії на основі розширення.
+    Записує кожну категорію в один архів (<категорія>.tar, .tar.gz або .zip)
+    у директорії призначення замість окремого файлу на кожен вхідний.
+    
+    Поруч з архівом ведеться індекс <архів>.index.jsonl - рядок на файл з
+    ім'ям, зміщенням, розміром і шляхом джерела. У tar зміщення вказує на
+    початок даних у розпакованому потоці, тож з нестиснутого архіву файл
+    читається одним seek; у zip це зміщення локального заголовка (zip
+    стискає кожен файл окремо, тому довільний доступ є і зі стисненням).
+    Наявні tar і zip доповнюються, стиснутий tar.gz - ні.
     """
-    try:
-        file_extension = source_file_path.suffix.lower()
+    
+    def __init__(self, destination_directory_path, archive_format, compress=False):
+        self.destination_directory_path = destination_directory_path
+        self.archive_format = archive_format
+        self.compress = compress
+        self.archives = {}
+        self.archive_stats = {}
+    
+    def get_archive_path(self, category):
+        extension = ".zip" if self.archive_format == "zip" else ".tar.gz" if self.compress else ".tar"
+        return self.destination_directory_path / f"{category}{extension}"
+    
+    def reserve_existing_names(self, destination_index):
+        """
+        Позначає імена з індексів наявних архівів як зайняті, щоб суфікси _N
+        продовжувались, а не перезаписували вміст.
+        """
+        if not self.destination_directory_path.is_dir():
+            return
         
-        target_subdirectory = create_destination_subdirectory(
-            destination_directory_path, 
-            file_extension
-        )
+        for index_path in self.destination_directory_path.glob(f"*{ARCHIVE_INDEX_SUFFIX}"):
+            archive_name = index_path.name[:-len(ARCHIVE_INDEX_SUFFIX)]
+            category = archive_name.split(".", 1)[0]
+            
+            if archive_name != self.get_archive_path(category).name:
+                continue
+            
+            if self.archive_format == "tar" and self.compress:
+                raise ValueError(f"Стиснутий архів не можна доповнити: {self.get_archive_path(category)}")
+            
+            with open(index_path, encoding="utf-8") as index_file:
+                for line in index_file:
+                    try:
+                        destination_index.reserve(category, json.loads(line)["name"])
+                    except (ValueError, KeyError):
+                        continue
+    
+    def _open_archive(self, category):
+        import tarfile
+        import zipfile
         
-        destination_file_path = target_subdirectory / source_file_path.name
+        archive_path = self.get_archive_path(category)
         
-        if destination_file_path.exists():
-            counter = 1
-            original_stem = source_file_path.stem
-            extension = source_file_path.suffix
+        if self.archive_format == "zip":
+            compression = zipfile.ZIP_DEFLATED if self.compress else zipfile.ZIP_STORED
+            archive = zipfile.ZipFile(archive_path, "a", compression=compression, allowZip64=True)
+        elif self.compress:
+            if archive_path.exists():
+                raise ValueError(f"Стиснутий архів не можна доповнити: {archive_path}")
+            archive = tarfile.open(archive_path, "w:gz")
+        else:
+            archive = tarfile.open(archive_path, "a")
+        
+        index_file = open(archive_path.with_name(archive_path.name + ARCHIVE_INDEX_SUFFIX), "a", encoding="utf-8", buffering=JSON_LOG_BUFFER_SIZE)
+        self.archives[category] = (archive, index_file)
+        self.archive_stats[category] = [0, 0]
+        return archive, index_file
+    
+    def add(self, category, file_name, source_file_path, size):
+        """
+        Дописує файл в архів категорії під уже виділеним ім'ям і повертає шлях архіву.
+        """
+        archive, index_file = self.archives.get(category) or self._open_archive(category)
+        
+        if self.archive_format == "zip":
+            archive.write(source_file_path, arcname=file_name)
+            member_offset = archive.infolist()[-1].header_offset
+        else:
+            from tarfile import BLOCKSIZE
+            
+            tar_info = archive.gettarinfo(source_file_path, arcname=file_name)
             
-            while destination_file_path.exists():
-                new_name = f"{original_stem}_{counter}{extension}"
-                destination_file_path = target_subdirectory / new_name
-                counter += 1
+            with open(source_file_path, "rb") as source_file:
+                archive.addfile(tar_info, source_file)
+            
+            data_blocks, remainder = divmod(tar_info.size, BLOCKSIZE)
+            member_offset = archive.offset - (data_blocks + (remainder > 0)) * BLOCKSIZE
         
-        shutil.copy2(source_file_path, destination_file_path)
-        print(f"{Fore.GREEN}Скопійовано:{Style.RESET_ALL} {source_file_path.name} -> {Fore.CYAN}{file_extension or 'no_extension'}/{Style.RESET_ALL}")
-        return True
+        index_file.write(json.dumps({
+            "name": file_name, 
+            "offset": member_offset, 
+            "size": size, 
+            "source": os.fspath(source_file_path),
+        }, ensure_ascii=False) + "\n")
+        
+        stats = self.archive_stats[category]
+        stats[0] += 1
+        stats[1] += size
+        
+        return self.get_archive_path(category)
+    
+    def close(self):
+        for archive, index_file in self.archives.values():
+            archive.close()
+            index_file.close()
         
+        self.archives = {}
+    
+    def get_archive_stats(self):
+        """
+        Повертає відсортований список (шлях архіву, доданих файлів, доданих байтів).
+        """
+        return [
+            (self.get_archive_path(category), files_count, bytes_count) 
+            for category, (files_count, bytes_count) in sorted(self.archive_stats.items())
+        ]
+
+
+def execute_archive_operation(operation, context, archive_writer):
+    """
+    Виконує операцію плану, дописуючи файл в архів категорії замість копіювання.
+    """
+    source_file_path = Path(operation.source_path)
+    
+    try:
+        archive_path = archive_writer.add(operation.category, operation.file_name, source_file_path, operation.size)
+        context.destination_index.record_copied(operation.category, operation.size)
+        context.reporter.file_copied(source_file_path, archive_path / operation.file_name, operation.size)
+        return True
+    
     except Exception as error:
-        print(f"{Fore.RED}Помилка копіювання файлу {source_file_path}: {error}{Style.RESET_ALL}")
+        context.reporter.error(f"Помилка архівування файлу {source_file_path}: {error}", source_file_path)
         return False
 
 
-def process_directory_recursively(current_directory_path, destination_directory_path):
+def archive_operations(operations, context, archive_writer):
     """
-    Рекурсивно обробляємо директорію, копіюючи всі файли.
-
-    1. Перебираємо всі елементи у директорії
-    2. Якщо елемент файл - копіюємо його
-    3. Якщо елемент директорія - викликаємо рекурсивно
+    Послідовно дописує операції в архіви категорій і повертає (оброблено, помилок).
     """
     processed_files_count = 0
     errors_count = 0
     
     try:
-        print(f"{Fore.BLUE}Обробляю директорію:{Style.RESET_ALL} {current_directory_path}")
-        
-        for item_path in current_directory_path.iterdir():
-            try:
-                if item_path.is_file():
-                    if copy_file_to_destination(item_path, destination_directory_path):
-                        processed_files_count += 1
-                    else:
-                        errors_count += 1
-                
-                elif item_path.is_dir():
-                    sub_files, sub_errors = process_directory_recursively(
-                        item_path, 
-                        destination_directory_path
-                    )
-                    processed_files_count += sub_files
-                    errors_count += sub_errors
-                    
-            except PermissionError:
-                print(f"{Fore.RED}Немає доступу до: {item_path}{Style.RESET_ALL}")
-                errors_count += 1
-            except Exception as error:
-                print(f"{Fore.RED}Помилка обробки {item_path}: {error}{Style.RESET_ALL}")
+        for operation in operations:
+            if execute_archive_operation(operation, context, archive_writer):
+                processed_files_count += 1
+            else:
                 errors_count += 1
-                
-    except PermissionError:
-        print(f"{Fore.RED}Немає доступу до директорії: {current_directory_path}{Style.RESET_ALL}")
-        errors_count += 1
-    except Exception as error:
-        print(f"{Fore.RED}Помилка читання директорії {current_directory_path}: {error}{Style.RESET_ALL}")
-        errors_count += 1
+    finally:
+        archive_writer.close()
     
     return processed_files_count, errors_count
 
 
-def validate_input_arguments(source_path, destination_path):
+def write_plan_file(operations, plan_path, plan_header):
+    """
+    Записує план у файл JSON Lines (заголовок і по масиву на операцію), пропускаючи операції далі потоком.
+    """
+    with open(plan_path, "w", encoding="utf-8", buffering=JSON_LOG_BUFFER_SIZE) as plan_file:
+        plan_file.write(json.dumps(plan_header, ensure_ascii=False) + "\n")
+        
+        for operation in operations:
+            plan_file.write(json.dumps(list(operation), ensure_ascii=False) + "\n")
+            yield operation
+
+
+def read_plan_header(plan_path):
+    with open(plan_path, encoding="utf-8") as plan_file:
+        try:
+            plan_header = json.loads(plan_file.readline())
+        except ValueError:
+            plan_header = None
+    
+    if not isinstance(plan_header, dict) or plan_header.get("format") != PLAN_FORMAT:
+        raise ValueError(f"Файл не є планом органайзера: {plan_path}")
+    
+    if plan_header.get("version") != PLAN_FORMAT_VERSION:
+        raise ValueError(f"Непідтримувана версія плану: {plan_header.get('version')}")
+    
+    return plan_header
+
+
+def iterate_plan_file(plan_path):
+    with open(plan_path, encoding="utf-8") as plan_file:
+        plan_file.readline()
+        
+        for line in plan_file:
+            if line.strip():
+                yield PlannedOperation(*json.loads(line))
+
+
+def admit_loaded_operations(operations, context, on_error):
+    """
+    Перевіряє операції збереженого плану перед виконанням.
+    
+    Ім'я, яке вже зайняте в директорії призначення (план застарів), не
+    перезаписується, а повідомляється як помилка. У режимі --sync повторний
+    запис у попереднє місце файлу дозволений.
+    
+    Оригінал дубліката, якого план не створює (його скопіював попередній
+    запуск --sync), вважається готовим, якщо він є в директорії призначення;
+    інакше дублікат копіюється як звичайний файл.
+    """
+    destination_index = context.destination_index
+    planned_originals = set()
+    
+    for operation in operations:
+        if operation.link_target is not None and operation.link_target not in planned_originals:
+            if (destination_index.destination_directory_path / operation.link_target).is_file():
+                context.content_index.mark_finished(operation.link_target, True)
+            else:
+                operation = operation._replace(link_target=None)
+        
+        if operation.link_target is None:
+            planned_originals.add(operation.relative_destination)
+        
+        replaces_own_copy = (
+            context.sync_manifest is not None 
+            and context.sync_manifest.previous_destination(operation.source_path) == (operation.category, operation.file_name)
+        )
+        
+        if destination_index.is_taken(operation.category, operation.file_name) and not replaces_own_copy:
+            on_error(f"Файл призначення вже існує: {operation.relative_destination}", Path(operation.source_path))
+            
+            if context.content_index is not None and operation.link_target is None:
+                context.content_index.mark_finished(operation.relative_destination, False)
+            continue
+        
+        destination_index.reserve(operation.category, operation.file_name)
+        
+        if operation.link_target is not None:
+            context.content_index.register_duplicate(operation.size)
+        
+        yield operation
+
+
+def order_operations(operations, order):
+    """
+    Упорядковує операції для кращої локальності введення-виведення.
+    
+    Будь-який порядок, окрім stream, потребує повного плану в пам'яті.
+    Дублікати (посилання) завжди йдуть після оригіналів.
+    """
+    if order == ORDER_DESTINATION:
+        return sorted(operations, key=lambda operation: (operation.link_target is not None, operation.category, operation.file_name))
+    
+    if order == ORDER_INODE:
+        return sorted(operations, key=lambda operation: (operation.link_target is not None, operation.inode))
+    
+    return operations
+
+
+def summarize_planned_operations(operations, reporter):
+    """
+    Проходить план без виконання (--dry-run) і повертає {категорія: [файлів, байтів]}.
+    """
+    plan_summary = {}
+    
+    for operation in operations:
+        reporter.file_planned(operation)
+        category_summary = plan_summary.setdefault(operation.category, [0, 0])
+        category_summary[0] += 1
+        category_summary[1] += operation.size
+    
+    return plan_summary
+
+
+def validate_input_arguments(source_path, destination_path, workers_count=1):
+    if workers_count < 1:
+        raise ValueError("Кількість потоків має бути не меншою за 1")
+    
     if not source_path.exists():
         raise ValueError(f"Вихідна директорія не існує: {source_path}")
     
@@ -162,30 +2370,139 @@ def validate_input_arguments(source_path, destination_path):
     return True
 
 
-def display_stats(processed_files, errors_count, destination_path):
+def validate_async_arguments(args):
+    if min(args.list_concurrency, args.stat_concurrency, args.copy_concurrency) < 1:
+        raise ValueError("Паралельність кожного етапу --async має бути не меншою за 1")
+    
+    if args.dry_run or args.save_plan or args.execute_plan or args.order != ORDER_STREAM or args.workers > 1:
+        raise ValueError("--async не поєднується з --dry-run, --save-plan, --execute-plan, --order та --workers")
+
+
+def validate_process_arguments(args):
+    if args.processes < 1:
+        raise ValueError("Кількість процесів має бути не меншою за 1")
+    
+    if args.async_mode or args.sync or args.dedup or args.json_log or args.progress or args.dry_run or args.save_plan or args.execute_plan or args.order != ORDER_STREAM:
+        raise ValueError(
+            "--processes не поєднується з --async, --sync, --dedup, --json-log, "
+            "--progress, --dry-run, --save-plan, --execute-plan та --order"
+        )
+
+
+def validate_watch_arguments(args):
+    if args.debounce < 0:
+        raise ValueError("Інтервал --debounce не може бути від'ємним")
+    
+    if args.async_mode or args.processes > 1 or args.dry_run or args.save_plan or args.execute_plan or args.order != ORDER_STREAM:
+        raise ValueError("--watch не поєднується з --async, --processes, --dry-run, --save-plan, --execute-plan та --order")
+
+
+def validate_archive_arguments(args):
+    if args.workers > 1 or args.processes > 1 or args.async_mode or args.watch or args.sync or args.dedup:
+        raise ValueError("--archive не поєднується з --workers, --processes, --async, --watch, --sync та --dedup")
+
+
+def display_stats(processed_files, errors_count, destination_index):
     print("\n" + "="*60)
     print(f"{Fore.MAGENTA}{Style.BRIGHT}ПІДСУМКОВА СТАТИСТИКА{Style.RESET_ALL}")
     print("="*60)
     print(f"{Fore.GREEN}[OK]{Style.RESET_ALL} Файлів успішно оброблено: {processed_files}")
     print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Помилок під час обробки: {errors_count}")
-    print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Файли збережено в: {destination_path.resolve()}")
+    print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Файли збережено в: {destination_index.destination_directory_path.resolve()}")
     
-    if destination_path.exists():
+    category_stats = destination_index.get_category_stats()
+    
+    if category_stats:
         print(f"\n{Fore.YELLOW}Створені категорії файлів:{Style.RESET_ALL}")
-        try:
-            subdirectories = [d for d in destination_path.iterdir() if d.is_dir()]
-            subdirectories.sort()
-            
-            for subdir in subdirectories:
-                files_count = len(list(subdir.glob("*")))
-                print(f"   {Fore.CYAN}-{Style.RESET_ALL} {subdir.name}: {files_count} файл(ів)")
-                
-        except Exception as error:
-            print(f"{Fore.YELLOW}Не вдалося проаналізувати структуру: {error}{Style.RESET_ALL}")
+        
+        for category, total_files, copied_files, copied_bytes in category_stats:
+            print(f"   {Fore.CYAN}-{Style.RESET_ALL} {category}: {total_files} файл(ів) (нових: {copied_files}, {format_bytes_count(copied_bytes)})")
+    
+    print("="*60)
+
+
+def display_archive_report(archive_writer):
+    print(f"\n{Fore.YELLOW}Архіви категорій:{Style.RESET_ALL}")
+    
+    for archive_path, files_count, bytes_count in archive_writer.get_archive_stats():
+        print(
+            f"   {Fore.CYAN}-{Style.RESET_ALL} {archive_path.name}: додано {files_count} файл(ів), "
+            f"{format_bytes_count(bytes_count)} -> архів {format_bytes_count(archive_path.stat().st_size)}"
+        )
+
+
+def display_copy_backend_report(copy_backend):
+    backend_stats = copy_backend.get_backend_stats()
+    
+    if not backend_stats:
+        return
+    
+    print(f"\n{Fore.YELLOW}Швидкість копіювання (сумарний час потоків):{Style.RESET_ALL}")
+    
+    for backend, files_count, bytes_count, elapsed_seconds in backend_stats:
+        elapsed_seconds = max(elapsed_seconds, 1e-9)
+        print(
+            f"   {Fore.CYAN}-{Style.RESET_ALL} {backend}: {files_count} файл(ів), {format_bytes_count(bytes_count)} | "
+            f"{format_bytes_count(bytes_count / elapsed_seconds)}/с, {files_count / elapsed_seconds:.1f} файл/с"
+        )
+
+
+def display_dedup_report(content_index, dry_run=False):
+    print(f"\n{Fore.YELLOW}Дедуплікація ({content_index.mode}):{Style.RESET_ALL}")
+    print(f"   {Fore.CYAN}-{Style.RESET_ALL} Знайдено дублікатів: {content_index.duplicates_count}")
+    
+    if dry_run:
+        print(f"   {Fore.CYAN}-{Style.RESET_ALL} Можна заощадити: {format_bytes_count(content_index.duplicate_bytes)}")
+        return
+    
+    print(f"   {Fore.CYAN}-{Style.RESET_ALL} Заощаджено: {format_bytes_count(content_index.saved_bytes)}")
+    
+    if content_index.fallback_copies_count:
+        print(f"   {Fore.CYAN}-{Style.RESET_ALL} Скопійовано звичайним способом (посилання недоступне): {content_index.fallback_copies_count}")
+
+
+def display_plan_summary(plan_summary, errors_count, plan_path=None):
+    planned_files = sum(files_count for files_count, _ in plan_summary.values())
+    planned_bytes = sum(bytes_count for _, bytes_count in plan_summary.values())
+    
+    print("\n" + "="*60)
+    print(f"{Fore.MAGENTA}{Style.BRIGHT}ПЛАН (БЕЗ ЗМІН НА ДИСКУ){Style.RESET_ALL}")
+    print("="*60)
+    print(f"{Fore.GREEN}[PLAN]{Style.RESET_ALL} Файлів до копіювання: {planned_files} ({format_bytes_count(planned_bytes)})")
+    print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Помилок під час планування: {errors_count}")
+    
+    if plan_path is not None:
+        print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} План збережено в: {plan_path.resolve()}")
+    
+    if plan_summary:
+        print(f"\n{Fore.YELLOW}Категорії файлів:{Style.RESET_ALL}")
+        
+        for category in sorted(plan_summary):
+            files_count, bytes_count = plan_summary[category]
+            print(f"   {Fore.CYAN}-{Style.RESET_ALL} {category}: {files_count} файл(ів), {format_bytes_count(bytes_count)}")
     
     print("="*60)
 
 
+def run_operations(operations, context, workers_count, announce_workers=True):
+    """
+    Виконує потік операцій послідовно або в пулі потоків і повертає (оброблено, помилок).
+    """
+    if workers_count <= 1:
+        return execute_operations(operations, context)
+    
+    if announce_workers:
+        print(f"{Fore.BLUE}Потоків копіювання:{Style.RESET_ALL} {workers_count}")
+    file_copier = ParallelFileCopier(workers_count, context)
+    
+    try:
+        processed_files, errors_count = execute_operations(operations, context, file_copier)
+    finally:
+        copied_files, copy_errors = file_copier.finish()
+    
+    return processed_files + copied_files, errors_count + copy_errors
+
+
 def main():
     print(f"{Fore.CYAN}{Style.BRIGHT}Файловий органайзер{Style.RESET_ALL}")
     print(f"{Fore.WHITE}Сортування файлів за розширенням{Style.RESET_ALL}")
@@ -193,24 +2510,161 @@ def main():
     
     try:
         args = setup_command_line_arguments()
-        source_directory = args.source_directory.resolve()
-        destination_directory = args.destination_directory.resolve()
+        plan_header = None
+        
+        if args.execute_plan is not None:
+            plan_header = read_plan_header(args.execute_plan)
+            source_directory = Path(plan_header["source"])
+            destination_directory = Path(plan_header["destination"])
+            print(f"{Fore.BLUE}Виконую план:{Style.RESET_ALL} {args.execute_plan}")
+        elif args.source_directory is None:
+            raise ValueError("Не вказано вихідну директорію")
+        else:
+            source_directory = args.source_directory.resolve()
+            destination_directory = args.destination_directory.resolve()
         
         print(f"{Fore.BLUE}Вихідна директорія:{Style.RESET_ALL} {source_directory}")
         print(f"{Fore.BLUE}Директорія призначення:{Style.RESET_ALL} {destination_directory}")
         
-        validate_input_arguments(source_directory, destination_directory)
+        validate_input_arguments(source_directory, destination_directory, args.workers)
+        
+        if args.async_mode:
+            validate_async_arguments(args)
         
-        destination_directory.mkdir(parents=True, exist_ok=True)
+        if args.processes > 1:
+            validate_process_arguments(args)
+        
+        if args.watch:
+            validate_watch_arguments(args)
+        
+        if args.archive:
+            validate_archive_arguments(args)
+        
+        if not args.dry_run:
+            destination_directory.mkdir(parents=True, exist_ok=True)
         
         print(f"\n{Fore.CYAN}Початок обробки...{Style.RESET_ALL}")
         
-        processed_files, errors_count = process_directory_recursively(
-            source_directory, 
-            destination_directory
+        output_mode = OUTPUT_VERBOSE
+        if args.quiet:
+            output_mode = OUTPUT_QUIET
+        elif args.progress:
+            output_mode = OUTPUT_PROGRESS
+        
+        context = OrganizerContext(
+            destination_index=DestinationIndex(destination_directory), 
+            copy_backend=FileCopyBackend(preserve_metadata=not args.no_metadata), 
+            reporter=EventReporter(output_mode, args.json_log)
         )
+        sync_manifest = None
+        if args.sync or args.watch:
+            sync_manifest = SyncManifest(destination_directory, use_hash=args.hash, read_only=args.dry_run)
+            context.sync_manifest = sync_manifest
+            print(f"{Fore.BLUE}Маніфест синхронізації:{Style.RESET_ALL} {sync_manifest.manifest_path} ({len(sync_manifest.entries)} записів)")
+        
+        dedup_mode = args.dedup or (plan_header or {}).get("dedup")
+        if dedup_mode:
+            context.content_index = ContentIndex(dedup_mode)
+            print(f"{Fore.BLUE}Дедуплікація:{Style.RESET_ALL} {dedup_mode}")
+        
+        archive_writer = None
+        if args.archive:
+            archive_writer = ArchiveBucketWriter(destination_directory, args.archive, args.compress)
+            archive_writer.reserve_existing_names(context.destination_index)
+            print(f"{Fore.BLUE}Архіви категорій:{Style.RESET_ALL} {archive_writer.get_archive_path('<категорія>').name}")
+        
+        planning_errors_count = 0
+        
+        def report_planning_error(message, item_path):
+            nonlocal planning_errors_count
+            context.reporter.error(message, item_path)
+            planning_errors_count += 1
+        
+        try:
+            if args.async_mode:
+                print(
+                    f"{Fore.BLUE}Конвеєр asyncio:{Style.RESET_ALL} читання {args.list_concurrency}, "
+                    f"stat {args.stat_concurrency}, копіювання {args.copy_concurrency}"
+                )
+                operations = None
+            elif args.processes > 1:
+                print(f"{Fore.BLUE}Процесів:{Style.RESET_ALL} {args.processes} (потоків копіювання в кожному: {args.workers})")
+                operations = None
+            elif args.watch:
+                operations = None
+            elif args.execute_plan is not None:
+                operations = admit_loaded_operations(iterate_plan_file(args.execute_plan), context, report_planning_error)
+            else:
+                operations = plan_directory_operations(source_directory, context, report_planning_error)
+            
+            if args.save_plan is not None:
+                operations = write_plan_file(operations, args.save_plan, {
+                    "format": PLAN_FORMAT,
+                    "version": PLAN_FORMAT_VERSION,
+                    "source": os.fspath(source_directory),
+                    "destination": os.fspath(destination_directory),
+                    "dedup": dedup_mode,
+                })
+            
+            if args.async_mode:
+                processed_files, errors_count = process_directory_async(
+                    source_directory, 
+                    context, 
+                    report_planning_error, 
+                    args.list_concurrency, 
+                    args.stat_concurrency, 
+                    args.copy_concurrency
+                )
+            elif args.processes > 1:
+                processed_files, errors_count = process_directory_sharded(
+                    source_directory, 
+                    context, 
+                    args.processes, 
+                    args.workers, 
+                    report_planning_error
+                )
+            elif args.watch:
+                processed_files, errors_count = watch_directory(
+                    source_directory, 
+                    context, 
+                    args.workers, 
+                    report_planning_error, 
+                    args.debounce
+                )
+            elif args.dry_run:
+                plan_summary = summarize_planned_operations(operations, context.reporter)
+                processed_files, errors_count = 0, 0
+            else:
+                operations = order_operations(operations, args.order)
+                
+                if archive_writer is not None:
+                    processed_files, errors_count = archive_operations(operations, context, archive_writer)
+                else:
+                    processed_files, errors_count = run_operations(operations, context, args.workers)
+        finally:
+            context.reporter.close()
+            
+            if sync_manifest is not None:
+                sync_manifest.close()
+        
+        errors_count += planning_errors_count
+        
+        if args.dry_run:
+            display_plan_summary(plan_summary, errors_count, args.save_plan)
+        else:
+            display_stats(processed_files, errors_count, context.destination_index)
+        
+        if archive_writer is not None and not args.dry_run:
+            display_archive_report(archive_writer)
+        
+        if sync_manifest is not None:
+            print(f"{Fore.BLUE}[SYNC]{Style.RESET_ALL} Пропущено незмінених файлів: {sync_manifest.skipped_files_count}")
+        
+        if not args.dry_run:
+            display_copy_backend_report(context.copy_backend)
         
-        display_stats(processed_files, errors_count, destination_directory)
+        if context.content_index is not None:
+            display_dedup_report(context.content_index, args.dry_run)
         
         exit_code = 0 if errors_count == 0 else 1
         
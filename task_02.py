@@ -1,7 +1,10 @@
-import matplotlib.pyplot as plt
-import numpy as np
 import argparse
+import contextlib
+import math
+import os
 import sys
+import time
+from pathlib import Path
 from colorama import init, Fore, Style
 
 init()
@@ -16,6 +19,14 @@ def setup_command_line_parser():
   python task_02.py                    # рівень 3, розмір 300
   python task_02.py --level 4          # рівень 4, розмір 300  
   python task_02.py --level 2 --size 200  # рівень 2, розмір 200
+  python task_02.py --level 9 --no-cache  # без кешу шаблонів на диску
+  python task_02.py --level 10 --dpi 200  # деталізація до пікселя при 200 DPI
+  python task_02.py --level 7 --full-detail  # без обмеження деталізації
+  python task_02.py --export-dir out --export-job 3:300 6:500 9:800 --formats png svg npy
+  python task_02.py --level 6 --progressive  # анімація рівнів 0..6
+  python task_02.py --export-dir frames --export-job 7:300 --progressive
+  python task_02.py --level 12 --stream-to points.f32 --dtype float32
+  python task_02.py --level 12 --stream-to tcp://localhost:9000
   
 Рекомендації:
   - Рівень 0-2: швидкий результат, проста форма
@@ -38,9 +49,104 @@ def setup_command_line_parser():
         help="Розмір сторони початкового трикутника (за замовчуванням: 300)"
     )
     
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=DEFAULT_FIGURE_DPI,
+        help=f"Роздільна здатність рисунка, точок на дюйм (за замовчуванням: {DEFAULT_FIGURE_DPI})"
+    )
+    
+    parser.add_argument(
+        "--full-detail",
+        action="store_true",
+        help="Будувати всі рівні, навіть коли сегменти менші за піксель"
+    )
+    
+    parser.add_argument(
+        "--export-dir",
+        type=Path,
+        help="Без вікна: зберегти зображення й точки в цю директорію (бекенд Agg)"
+    )
+    
+    parser.add_argument(
+        "--export-job",
+        type=parse_export_job,
+        nargs="+",
+        metavar="РІВЕНЬ:РОЗМІР",
+        help="Завдання експорту (за замовчуванням: одне з --level і --size)"
+    )
+    
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=EXPORT_FORMATS,
+        default=["png"],
+        help="Формати експорту: png, svg, npy - сирі точки (за замовчуванням: png)"
+    )
+    
+    parser.add_argument(
+        "--processes", "-p",
+        type=int,
+        default=os.cpu_count(),
+        help="Кількість процесів для завдань експорту (за замовчуванням: кількість ядер)"
+    )
+    
+    parser.add_argument(
+        "--progressive",
+        action="store_true",
+        help="Показувати (або експортувати) кадр для кожного рівня від 0, уточнюючи попередній"
+    )
+    
+    parser.add_argument(
+        "--stream-to",
+        help="Без вікна: записати точки потоком (сирі пари x, y) у файл, '-' (stdout) або tcp://хост:порт"
+    )
+    
+    parser.add_argument(
+        "--dtype",
+        choices=STREAM_DTYPES,
+        default="float64",
+        help="Тип чисел для --stream-to (за замовчуванням: float64)"
+    )
+    
+    parser.add_argument(
+        "--chunk-level",
+        type=int,
+        default=KOCH_STREAM_CHUNK_LEVEL,
+        help=f"Розмір шматка для --stream-to: 4**N точок (за замовчуванням: {KOCH_STREAM_CHUNK_LEVEL})"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=KOCH_CACHE_DIRECTORY,
+        help=f"Директорія кешу шаблонів рівнів (за замовчуванням: {KOCH_CACHE_DIRECTORY})"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Не використовувати кеш шаблонів, будувати сніжинку заново"
+    )
+    
     return parser.parse_args()
 
 
+EXPORT_FORMATS = ("png", "svg", "npy")
+EXPORT_NAMES_SHOWN = 6
+
+
+def parse_export_job(job_text):
+    """
+    Розбирає завдання експорту "рівень:розмір" для argparse.
+    """
+    try:
+        level_text, size_text = job_text.split(":")
+        return int(level_text), int(size_text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Очікується РІВЕНЬ:РОЗМІР, отримано: {job_text}")
+
+
 def validate_input_parameters(recursion_level, triangle_size):
     if recursion_level < 0:
         raise ValueError("Рівень рекурсії не може бути від'ємним")
@@ -63,6 +169,8 @@ def koch_curve_points(start_point, end_point, recursion_level):
     if recursion_level == 0:
         return [start_point, end_point]
     
+    import numpy as np
+    
     # Обчислюємо ключові точки для побудови кривої Коха
     dx = end_point[0] - start_point[0]
     dy = end_point[1] - start_point[1]
@@ -103,43 +211,313 @@ def koch_curve_points(start_point, end_point, recursion_level):
     return points
 
 
-def create_koch_snowflake(recursion_level, side_length):
+def refine_koch_buffer(points, recursion_level):
+    """
+    Ітеративно будує криву Коха на місці в уже виділеному буфері.
+    
+    На вході заповнені лише точки з кроком 4**recursion_level (вершини
+    ламаної). Кожен прохід одним векторним кроком вставляє в усі сегменти
+    по три нові точки: дві точки поділу на третини та вершину між ними.
+    Нових масивів розміру буфера не створюється.
+    """
+    import numpy as np
+    
+    # Поворот на 60 градусів проти годинникової стрілки (вершина "зубця")
+    peak_rotation = np.array([
+        [np.cos(np.pi / 3), np.sin(np.pi / 3)],
+        [-np.sin(np.pi / 3), np.cos(np.pi / 3)]
+    ])
+    step = 4 ** recursion_level
+    
+    for _ in range(recursion_level):
+        quarter = step // 4
+        vertices = points[::step]
+        third = (vertices[1:] - vertices[:-1]) / 3
+        first_division = vertices[:-1] + third
+        
+        points[quarter::step] = first_division
+        points[2*quarter::step] = first_division + third @ peak_rotation
+        points[3*quarter::step] = first_division + third
+        
+        step = quarter
+    
+    return points
+
+
+def koch_curve_array(start_point, end_point, recursion_level):
+    """
+    Векторизований аналог koch_curve_points: повертає масив (4**n + 1, 2).
+    """
+    import numpy as np
+    
+    points = np.empty((4 ** recursion_level + 1, 2))
+    points[0] = start_point
+    points[-1] = end_point
+    
+    return refine_koch_buffer(points, recursion_level)
+
+
+KOCH_CACHE_DIRECTORY = Path.home() / ".cache" / "koch_snowflake"
+
+
+class KochTemplateCache:
+    """
+    Кеш одиничних кривих Коха (від (0, 0) до (1, 0)) для кожного рівня.
+    
+    Шаблон рівня зберігається у файлі koch_unit_level_<n>.npy і при
+    повторному запуску відкривається через memory-map, тож нічого не
+    перераховується і не читається наперед. Якщо директорія кешу недоступна
+    для запису, шаблони живуть лише в пам'яті.
+    """
+    
+    def __init__(self, cache_directory=KOCH_CACHE_DIRECTORY):
+        self.cache_directory = cache_directory
+        self.unit_curves = {}
+    
+    def get_template_path(self, recursion_level):
+        return self.cache_directory / f"koch_unit_level_{recursion_level}.npy"
+    
+    def get_unit_curve(self, recursion_level):
+        """
+        Повертає одиничну криву рівня (4**n + 1, 2): з пам'яті, з диска або обчислену.
+        """
+        if recursion_level in self.unit_curves:
+            return self.unit_curves[recursion_level]
+        
+        import numpy as np
+        
+        template_path = self.get_template_path(recursion_level)
+        unit_curve = None
+        
+        try:
+            unit_curve = np.load(template_path, mmap_mode='r')
+            if unit_curve.shape != (4 ** recursion_level + 1, 2):
+                unit_curve = None
+        except (OSError, ValueError):
+            pass
+        
+        if unit_curve is None:
+            unit_curve = koch_curve_array((0.0, 0.0), (1.0, 0.0), recursion_level)
+            self._save_template(template_path, unit_curve)
+        
+        self.unit_curves[recursion_level] = unit_curve
+        return unit_curve
+    
+    def _save_template(self, template_path, unit_curve):
+        import numpy as np
+        
+        # Ім'я з PID: шаблон можуть одночасно зберігати кілька процесів експорту
+        temporary_path = template_path.with_name(f"{template_path.name}.{os.getpid()}.tmp")
+        
+        try:
+            self.cache_directory.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "wb") as template_file:
+                np.save(template_file, unit_curve)
+            os.replace(temporary_path, template_path)
+        
+        except OSError as error:
+            print(f"{Fore.YELLOW}Попередження: не вдалося зберегти шаблон у кеш: {error}{Style.RESET_ALL}")
+
+
+def transform_unit_curve(unit_curve, start_point, end_point, out=None):
+    """
+    Переносить одиничну криву на відрізок start_point -> end_point одним афінним перетворенням.
+    
+    Точка (u, v) шаблону переходить у start + u * d + v * perp(d),
+    де d = end - start, а perp(d) - d, повернутий на 90 градусів.
+    """
+    import numpy as np
+    
+    dx = end_point[0] - start_point[0]
+    dy = end_point[1] - start_point[1]
+    transform = np.array([[dx, dy], [-dy, dx]])
+    
+    out = np.matmul(unit_curve, transform, out=out)
+    out += start_point
+    return out
+
+
+def get_triangle_vertices(side_length):
+    """
+    Повертає вершини початкового трикутника (4, 2); остання повторює першу.
+    """
+    import numpy as np
+    
     height = side_length * np.sqrt(3) / 2
-    triangle_vertices = [
+    return np.array([
         (-side_length/2, -height/3),
         (side_length/2, -height/3),
-        (0, 2*height/3)
-    ]
+        (0, 2*height/3),
+        (-side_length/2, -height/3)
+    ])
+
+
+def create_koch_snowflake(recursion_level, side_length, template_cache=None):
+    """
+    Повертає замкнену сніжинку Коха як масив точок (3 * 4**n + 1, 2).
+    
+    Усі три сторони записуються в один буфер: вершини трикутника стоять
+    з кроком 4**n, остання точка збігається з першою. З template_cache
+    кожна сторона - афінне перетворення кешованої одиничної кривої,
+    без нього буфер уточнюється рівень за рівнем.
+    """
+    import numpy as np
+    
+    triangle_vertices = get_triangle_vertices(side_length)
     
     print(f"{Fore.CYAN}Генерую сніжинку Коха, рівень {recursion_level}{Style.RESET_ALL}")
     
-    all_points = []
+    side_points_count = 4 ** recursion_level
+    points = np.empty((3 * side_points_count + 1, 2))
     
-    # Створюємо криву Коха для кожної сторони трикутника
-    for i in range(3):
-        start_vertex = triangle_vertices[i]
-        end_vertex = triangle_vertices[(i + 1) % 3]
+    if template_cache is None:
+        points[::side_points_count] = triangle_vertices
+        return refine_koch_buffer(points, recursion_level)
+    
+    unit_curve = template_cache.get_unit_curve(recursion_level)
+    
+    for side_index in range(3):
+        side_start = side_index * side_points_count
+        transform_unit_curve(
+            unit_curve, 
+            triangle_vertices[side_index], 
+            triangle_vertices[side_index + 1], 
+            out=points[side_start:side_start + side_points_count + 1]
+        )
+    
+    points[-1] = points[0]
+    return points
+
+
+FIGURE_SIZE_INCHES = 10
+DEFAULT_FIGURE_DPI = 100
+PROGRESSIVE_FRAME_DELAY = 0.5
+
+
+def refine_koch_level(points):
+    """
+    Одним векторним кроком перетворює точки рівня k (m + 1, 2) на рівень k + 1 (4m + 1, 2).
+    """
+    import numpy as np
+    
+    refined_points = np.empty((4 * (len(points) - 1) + 1, 2), dtype=points.dtype)
+    refined_points[::4] = points
+    return refine_koch_buffer(refined_points, 1)
+
+
+def iterate_koch_levels(max_level, side_length):
+    """
+    Віддає (рівень, точки) сніжинки для рівнів 0..max_level, уточнюючи попередній рівень.
+    
+    Сумарна робота - приблизно 4/3 від побудови лише останнього рівня,
+    а не сума незалежних побудов усіх рівнів.
+    """
+    snowflake_points = get_triangle_vertices(side_length)
+    yield 0, snowflake_points
+    
+    for recursion_level in range(1, max_level + 1):
+        snowflake_points = refine_koch_level(snowflake_points)
+        yield recursion_level, snowflake_points
+
+
+KOCH_STREAM_CHUNK_LEVEL = 8
+STREAM_DTYPES = ("float32", "float64")
+
+
+def iterate_koch_curve_chunks(start_point, end_point, recursion_level, chunk_level=KOCH_STREAM_CHUNK_LEVEL, dtype="float64"):
+    """
+    Потоком віддає точки кривої Коха по порядку шматками по 4**chunk_level точок.
+    
+    Перший шматок містить на одну точку більше (початок кривої), разом -
+    4**n + 1 точок, як у koch_curve_array. Крива розкладається на
+    сегменти рівня n - chunk_level, які обходяться стеком, а кожен сегмент
+    розгортається афінним перетворенням одного шаблону рівня chunk_level.
+    Пам'ять обмежена шаблоном, одним шматком і стеком глибини n
+    незалежно від рівня.
+    """
+    import numpy as np
+    
+    chunk_level = min(chunk_level, recursion_level)
+    unit_curve = koch_curve_array((0.0, 0.0), (1.0, 0.0), chunk_level)
+    chunk_buffer = np.empty_like(unit_curve)
+    pending_segments = [(np.asarray(start_point, dtype=float), np.asarray(end_point, dtype=float), recursion_level - chunk_level)]
+    is_first_chunk = True
+    
+    while pending_segments:
+        segment_start, segment_end, segment_level = pending_segments.pop()
         
-        print(f"{Fore.BLUE}   Обробляю сторону {i + 1}/3...{Style.RESET_ALL}")
+        if segment_level == 0:
+            transform_unit_curve(unit_curve, segment_start, segment_end, out=chunk_buffer)
+            chunk = chunk_buffer if is_first_chunk else chunk_buffer[1:]
+            is_first_chunk = False
+            yield chunk.astype(dtype, copy=True)
+            continue
         
-        side_points = koch_curve_points(start_vertex, end_vertex, recursion_level)
+        # Точки рівня 1 для сегмента; підсегменти кладуться у стек у зворотному порядку
+        segment_points = koch_curve_array(segment_start, segment_end, 1)
+        for point_index in range(3, -1, -1):
+            pending_segments.append((segment_points[point_index], segment_points[point_index + 1], segment_level - 1))
+
+
+def iterate_koch_snowflake_chunks(recursion_level, side_length, chunk_level=KOCH_STREAM_CHUNK_LEVEL, dtype="float64"):
+    """
+    Потоком віддає замкнену сніжинку (3 * 4**n + 1 точок) сторона за стороною.
+    """
+    triangle_vertices = get_triangle_vertices(side_length)
+    
+    for side_index in range(3):
+        side_chunks = iterate_koch_curve_chunks(
+            triangle_vertices[side_index], 
+            triangle_vertices[side_index + 1], 
+            recursion_level, 
+            chunk_level, 
+            dtype
+        )
         
-        if i == 0:
-            all_points.extend(side_points)
-        else:
-            all_points.extend(side_points[1:])
+        for chunk_index, chunk in enumerate(side_chunks):
+            # Перша точка сторони - це остання точка попередньої
+            yield chunk[1:] if side_index > 0 and chunk_index == 0 else chunk
+
+
+def write_point_chunks(point_chunks, output_file):
+    """
+    Записує шматки точок у бінарний потік (файл, stdout, сокет) і повертає кількість точок.
+    
+    Точки записуються як сирі пари x, y; прочитати файл назад можна через
+    np.fromfile(шлях, dtype).reshape(-1, 2).
+    """
+    points_count = 0
+    
+    for chunk in point_chunks:
+        output_file.write(memoryview(chunk).cast("B"))
+        points_count += len(chunk)
     
-    all_points.append(all_points[0])
+    output_file.flush()
+    return points_count
+
+
+def open_stream_output(stream_target):
+    """
+    Відкриває ціль --stream-to як бінарний потік: '-' - stdout, tcp://хост:порт - сокет, інакше файл.
+    """
+    if stream_target == "-":
+        return open(sys.stdout.fileno(), "wb", closefd=False)
     
-    x_coords = [point[0] for point in all_points]
-    y_coords = [point[1] for point in all_points]
+    if stream_target.startswith("tcp://"):
+        import socket
+        
+        host, _, port = stream_target[len("tcp://"):].rpartition(":")
+        connection = socket.create_connection((host, int(port)))
+        return connection.makefile("wb")
     
-    return x_coords, y_coords
+    return open(stream_target, "wb")
 
 
-def setup_matplotlib_environment(window_title, side_length):
+def setup_matplotlib_environment(window_title, side_length, dpi=DEFAULT_FIGURE_DPI):
+    import matplotlib.pyplot as plt
+    
     plt.style.use('dark_background')
-    fig, ax = plt.subplots(figsize=(10, 10))
+    fig, ax = plt.subplots(figsize=(FIGURE_SIZE_INCHES, FIGURE_SIZE_INCHES), dpi=dpi)
     
     fig.patch.set_facecolor('navy')
     ax.set_facecolor('navy')
@@ -156,6 +534,144 @@ def setup_matplotlib_environment(window_title, side_length):
     return fig, ax
 
 
+def get_pixel_size(ax):
+    """
+    Повертає розмір одного пікселя в одиницях даних для осей з однаковим масштабом.
+    """
+    axes_extent = ax.get_window_extent()
+    x_min, x_max = ax.get_xlim()
+    y_min, y_max = ax.get_ylim()
+    
+    return max((x_max - x_min) / axes_extent.width, (y_max - y_min) / axes_extent.height)
+
+
+def calculate_level_of_detail(recursion_level, side_length, pixel_size):
+    """
+    Повертає найменший рівень, на якому сегменти (side / 3**k) вже не довші за піксель.
+    
+    Глибші рівні лише додають точки всередині одного пікселя, тож
+    результат не перевищує запитаного recursion_level.
+    """
+    if side_length <= pixel_size:
+        return 0
+    
+    return min(recursion_level, math.ceil(math.log(side_length / pixel_size, 3)))
+
+
+def draw_snowflake(ax, points, color='cyan', linewidth=2):
+    """
+    Малює ламану однією LineCollection: без маркерів і автомасштабування Line2D.
+    """
+    from matplotlib.collections import LineCollection
+    
+    snowflake_lines = LineCollection([points], colors=color, linewidths=linewidth)
+    ax.add_collection(snowflake_lines)
+    return snowflake_lines
+
+
+def export_fractal_job(job, export_directory, formats, dpi, full_detail, cache_directory, progressive=False):
+    """
+    Виконує одне завдання експорту (рівень, розмір) і повертає (завдання, шляхи, секунди).
+    
+    Геометрія будується один раз на найглибшому потрібному рівні: npy
+    отримує всі точки, а для png і svg береться кожна 4**k-та точка - це
+    точно точки рівня деталізації, тож перерахунку немає. Один рисунок
+    зберігається в усі графічні формати. У режимі progressive кадр
+    зберігається для кожного рівня від 0, і кожен рівень уточнює попередній;
+    зображення глибших за рівень деталізації кадрів не растеризуються.
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
+    plt.switch_backend("Agg")
+    recursion_level, side_length = job
+    start_time = time.perf_counter()
+    exported_paths = []
+    
+    fig, ax = setup_matplotlib_environment(f"Сніжинка Коха - Рівень {recursion_level}", side_length, dpi)
+    plt.tight_layout()
+    
+    render_level = recursion_level
+    if not full_detail:
+        render_level = calculate_level_of_detail(recursion_level, side_length, get_pixel_size(ax))
+    
+    geometry_level = recursion_level if "npy" in formats else render_level
+    
+    if progressive:
+        # Глибші за geometry_level кадри зображень не відрізнялися б від нього
+        frames = ((frame_level, frame_level, frame_points) for frame_level, frame_points in iterate_koch_levels(geometry_level, side_length))
+    else:
+        template_cache = None if cache_directory is None else KochTemplateCache(cache_directory)
+        frames = [(recursion_level, geometry_level, create_koch_snowflake(geometry_level, side_length, template_cache))]
+    
+    image_formats = [image_format for image_format in formats if image_format != "npy"]
+    snowflake_lines = None
+    
+    for frame_level, points_level, snowflake_points in frames:
+        file_stem = f"koch_level_{frame_level}_size_{side_length}"
+        
+        if "npy" in formats:
+            points_path = export_directory / f"{file_stem}.npy"
+            np.save(points_path, snowflake_points)
+            exported_paths.append(points_path)
+        
+        if not image_formats or (progressive and frame_level > render_level):
+            continue
+        
+        render_points = snowflake_points[::4 ** max(0, points_level - render_level)]
+        
+        if snowflake_lines is None:
+            snowflake_lines = draw_snowflake(ax, render_points)
+        else:
+            snowflake_lines.set_segments([render_points])
+        
+        ax.title.set_text(f"Сніжинка Коха - Рівень {frame_level}")
+        
+        for image_format in image_formats:
+            image_path = export_directory / f"{file_stem}.{image_format}"
+            fig.savefig(image_path, dpi=dpi)
+            exported_paths.append(image_path)
+    
+    plt.close(fig)
+    return job, exported_paths, time.perf_counter() - start_time
+
+
+def run_batch_export(jobs, export_directory, formats, processes_count, dpi, full_detail, cache_directory, progressive=False):
+    """
+    Розподіляє завдання експорту між процесами й повертає кількість невдалих.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    export_directory.mkdir(parents=True, exist_ok=True)
+    failed_jobs_count = 0
+    
+    print(f"{Fore.CYAN}Експорт {len(jobs)} завдань у {export_directory} ({', '.join(formats)}), процесів: {processes_count}{Style.RESET_ALL}")
+    
+    with ProcessPoolExecutor(max_workers=min(processes_count, len(jobs))) as executor:
+        job_futures = {
+            executor.submit(export_fractal_job, job, export_directory, formats, dpi, full_detail, cache_directory, progressive): job 
+            for job in jobs
+        }
+        
+        for future in as_completed(job_futures):
+            recursion_level, side_length = job_futures[future]
+            
+            try:
+                _, exported_paths, elapsed_seconds = future.result()
+            except Exception as error:
+                failed_jobs_count += 1
+                print(f"{Fore.RED}Помилка завдання {recursion_level}:{side_length}: {error}{Style.RESET_ALL}")
+                continue
+            
+            exported_names = ", ".join(exported_path.name for exported_path in exported_paths[:EXPORT_NAMES_SHOWN])
+            if len(exported_paths) > EXPORT_NAMES_SHOWN:
+                exported_names += f" ... (усього {len(exported_paths)})"
+            
+            print(f"{Fore.GREEN}[OK]{Style.RESET_ALL} {recursion_level}:{side_length} за {elapsed_seconds:.2f} с -> {exported_names}")
+    
+    return failed_jobs_count
+
+
 def display_fractal_info(recursion_level, side_length):
     total_segments = 3 * (4 ** recursion_level)
     
@@ -179,37 +695,111 @@ def display_fractal_info(recursion_level, side_length):
 
 
 def main():
+    message_output = sys.stdout
+    
     try:
         args = setup_command_line_parser()
         recursion_level = args.level
         triangle_side_length = args.size
         
+        if args.stream_to is not None:
+            # Повідомлення про помилки теж не повинні потрапити в двійковий потік
+            message_output = sys.stderr
+            
+            # stdout може бути ціллю потоку, тому попередження йдуть у stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                validate_input_parameters(recursion_level, triangle_side_length)
+            
+            if args.chunk_level < 0:
+                raise ValueError("Рівень шматка не може бути від'ємним")
+            
+            start_time = time.perf_counter()
+            point_chunks = iterate_koch_snowflake_chunks(recursion_level, triangle_side_length, args.chunk_level, args.dtype)
+            
+            with open_stream_output(args.stream_to) as output_file:
+                points_count = write_point_chunks(point_chunks, output_file)
+            
+            print(
+                f"{Fore.GREEN}Записано точок:{Style.RESET_ALL} {points_count:,} ({args.dtype}) "
+                f"за {time.perf_counter() - start_time:.2f} с -> {args.stream_to}", 
+                file=sys.stderr
+            )
+            sys.exit(0)
+        
+        if args.dpi < 1:
+            raise ValueError("Роздільна здатність --dpi має бути не меншою за 1")
+        
+        if args.export_dir is not None:
+            jobs = args.export_job or [(recursion_level, triangle_side_length)]
+            
+            if args.processes < 1:
+                raise ValueError("Кількість процесів має бути не меншою за 1")
+            
+            for job_level, job_size in jobs:
+                validate_input_parameters(job_level, job_size)
+            
+            failed_jobs_count = run_batch_export(
+                jobs, 
+                args.export_dir, 
+                args.formats, 
+                args.processes, 
+                args.dpi, 
+                args.full_detail, 
+                None if args.no_cache else args.cache_dir, 
+                args.progressive
+            )
+            sys.exit(1 if failed_jobs_count else 0)
+        
         validate_input_parameters(recursion_level, triangle_side_length)
         display_fractal_info(recursion_level, triangle_side_length)
         
-        print(f"\n{Fore.CYAN}Генерую фрактал...{Style.RESET_ALL}")
-        
-        x_coords, y_coords = create_koch_snowflake(recursion_level, triangle_side_length)
+        import matplotlib.pyplot as plt
         
         window_title = f"Сніжинка Коха - Рівень {recursion_level}"
-        fig, ax = setup_matplotlib_environment(window_title, triangle_side_length)
+        fig, ax = setup_matplotlib_environment(window_title, triangle_side_length, args.dpi)
+        plt.tight_layout()
+        
+        render_level = recursion_level
+        if not args.full_detail:
+            render_level = calculate_level_of_detail(recursion_level, triangle_side_length, get_pixel_size(ax))
+            
+            if render_level < recursion_level:
+                print(
+                    f"{Fore.BLUE}Рівень деталізації:{Style.RESET_ALL} {render_level} "
+                    f"(глибші сегменти менші за піксель при {args.dpi} DPI; --full-detail вимикає)"
+                )
+        
+        print(f"\n{Fore.CYAN}Генерую фрактал...{Style.RESET_ALL}")
         
-        ax.plot(x_coords, y_coords, color='cyan', linewidth=2)
+        if args.progressive:
+            snowflake_lines = None
+            
+            for frame_level, snowflake_points in iterate_koch_levels(render_level, triangle_side_length):
+                if snowflake_lines is None:
+                    snowflake_lines = draw_snowflake(ax, snowflake_points)
+                else:
+                    snowflake_lines.set_segments([snowflake_points])
+                
+                ax.title.set_text(f"Сніжинка Коха - Рівень {frame_level}")
+                plt.pause(PROGRESSIVE_FRAME_DELAY)
+        else:
+            template_cache = None if args.no_cache else KochTemplateCache(args.cache_dir)
+            snowflake_points = create_koch_snowflake(render_level, triangle_side_length, template_cache)
+            draw_snowflake(ax, snowflake_points)
         
         print(f"\n{Fore.GREEN}Готово!{Style.RESET_ALL}")
         print(f"{Fore.WHITE}Закрийте вікно для завершення програми{Style.RESET_ALL}")
         
-        plt.tight_layout()
         plt.show()
         
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Генерацію перервано{Style.RESET_ALL}")
+        print(f"\n{Fore.YELLOW}Генерацію перервано{Style.RESET_ALL}", file=message_output)
         sys.exit(0)
     except ValueError as error:
-        print(f"\n{Fore.RED}Помилка: {error}{Style.RESET_ALL}")
+        print(f"\n{Fore.RED}Помилка: {error}{Style.RESET_ALL}", file=message_output)
         sys.exit(1)
     except Exception as error:
-        print(f"\n{Fore.RED}Помилка: {error}{Style.RESET_ALL}")
+        print(f"\n{Fore.RED}Помилка: {error}{Style.RESET_ALL}", file=message_output)
         sys.exit(1)
 
 
@@ -1,12 +1,221 @@
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import time
 import timeit
 import random
-import statistics
-from typing import List, Callable, Dict, Any
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from bisect import bisect_left, bisect_right
+from typing import List, Callable, Dict, Any, NamedTuple, Tuple
 import sys
 from colorama import init, Fore, Style
 
 init()
 
+HYBRID_MIN_GALLOP = 7
+HYBRID_CUTOFF_CANDIDATES = [8, 16, 32, 64, 96, 128, 192, 256]
+HYBRID_MIN_RUN_CANDIDATES = [16, 32, 64, 96, 128, 192, 256]
+HYBRID_CALIBRATION_SIZE = 2000
+HYBRID_CALIBRATION_REPEATS = 3
+HYBRID_ALGORITHM_NAME = 'Adaptive Hybrid'
+TIMSORT_ALGORITHM_NAME = 'Timsort (Python)'
+HYBRID_COMPARISON_DATA_TYPES = ['sorted', 'reverse', 'nearly_sorted']
+
+TIMING_MIN_SAMPLE_SECONDS = 0.001
+TIMING_CONFIDENCE_Z = 1.96
+REGRESSION_SIGNIFICANCE_LEVEL = 0.05
+
+
+class HybridSortParameters(NamedTuple):
+    insertion_cutoff: int
+    min_run: int
+
+
+DEFAULT_HYBRID_PARAMETERS = HybridSortParameters(insertion_cutoff=32, min_run=32)
+
+
+class TimingSettings(NamedTuple):
+    warmup_runs: int = 1
+    confidence_target: float = 0.05
+    min_repetitions: int = 5
+    max_repetitions: int = 50
+    max_seconds: float = 2.0
+    disable_gc: bool = False
+
+
+DEFAULT_TIMING_SETTINGS = TimingSettings()
+
+
+class TimingStatistics(NamedTuple):
+    median: float
+    iqr: float
+    minimum: float
+    mean: float
+    repetitions: int
+    loops_per_sample: int
+    samples: List[float]
+
+
+class BenchmarkCase(NamedTuple):
+    algorithm_name: str
+    data_type: str
+    size: int
+    test_data: List[int]
+
+
+def setup_command_line_arguments():
+    parser = argparse.ArgumentParser(
+        description="Порівняльний аналіз алгоритмів сортування: емпірична перевірка теоретичних оцінок складності",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Приклади використання:
+  python task_03.py                 # усі виміри послідовно
+  python task_03.py --jobs 4        # виміри розподіляються між 4 процесами
+  python task_03.py -j 4 --pin-cpus # кожен процес закріплений за власним ядром
+  python task_03.py --disable-gc --output baseline.json --csv baseline.csv
+  python task_03.py --compare baseline.json          # новий прогін проти базового
+  python task_03.py --load new.json --compare baseline.json  # два збережені прогони
+        """
+    )
+    
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Кількість процесів для незалежних вимірів (за замовчуванням: 1 - послідовно)"
+    )
+    
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Закріпити кожен процес за окремим ядром; --jobs не може перевищувати кількість доступних ядер"
+    )
+    
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=DEFAULT_TIMING_SETTINGS.warmup_runs,
+        help=f"Кількість розігрівних запусків перед вимірами (за замовчуванням: {DEFAULT_TIMING_SETTINGS.warmup_runs})"
+    )
+    
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=DEFAULT_TIMING_SETTINGS.confidence_target,
+        help=f"Цільова відносна напівширина 95%% довірчого інтервалу (за замовчуванням: {DEFAULT_TIMING_SETTINGS.confidence_target})"
+    )
+    
+    parser.add_argument(
+        "--min-repetitions",
+        type=int,
+        default=DEFAULT_TIMING_SETTINGS.min_repetitions,
+        help=f"Мінімальна кількість вибірок на вимір (за замовчуванням: {DEFAULT_TIMING_SETTINGS.min_repetitions})"
+    )
+    
+    parser.add_argument(
+        "--max-repetitions",
+        type=int,
+        default=DEFAULT_TIMING_SETTINGS.max_repetitions,
+        help=f"Максимальна кількість вибірок на вимір (за замовчуванням: {DEFAULT_TIMING_SETTINGS.max_repetitions})"
+    )
+    
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=DEFAULT_TIMING_SETTINGS.max_seconds,
+        help=f"Бюджет часу на один вимір після мінімуму вибірок (за замовчуванням: {DEFAULT_TIMING_SETTINGS.max_seconds})"
+    )
+    
+    parser.add_argument(
+        "--disable-gc",
+        action="store_true",
+        help="Вимикати збирач сміття під час вимірів"
+    )
+    
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Зберегти результати у файл JSON (разом із вибірками для порівняння)"
+    )
+    
+    parser.add_argument(
+        "--csv",
+        type=Path,
+        help="Зберегти зведену таблицю результатів у файл CSV"
+    )
+    
+    parser.add_argument(
+        "--load",
+        type=Path,
+        help="Не вимірювати, а завантажити результати зі збереженого файлу JSON"
+    )
+    
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Базовий прогін JSON; статистично значущі сповільнення позначаються як регресії"
+    )
+    
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.05,
+        help="Мінімальне відносне сповільнення медіани, що вважається регресією (за замовчуванням: 0.05)"
+    )
+    
+    return parser.parse_args()
+
+
+def get_available_cpus() -> List[int]:
+    """
+    Повертає номери ядер, доступних поточному процесу.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    
+    return list(range(os.cpu_count() or 1))
+
+
+def validate_jobs_arguments(args) -> None:
+    if args.jobs < 1:
+        raise ValueError("Кількість процесів --jobs має бути не меншою за 1")
+    
+    if args.pin_cpus:
+        if not hasattr(os, "sched_setaffinity"):
+            raise ValueError("--pin-cpus не підтримується на цій платформі")
+        
+        available_cpus_count = len(get_available_cpus())
+        if args.jobs > available_cpus_count:
+            raise ValueError(
+                f"З --pin-cpus один вимір займає одне ядро: --jobs {args.jobs} "
+                f"перевищує кількість доступних ядер ({available_cpus_count})"
+            )
+
+
+def validate_timing_arguments(args) -> None:
+    if args.warmup < 0:
+        raise ValueError("Кількість розігрівних запусків --warmup не може бути від'ємною")
+    
+    if args.confidence <= 0:
+        raise ValueError("Ціль --confidence має бути додатною")
+    
+    if args.min_repetitions < 2:
+        raise ValueError("Для медіани та IQR потрібно щонайменше 2 вибірки (--min-repetitions)")
+    
+    if args.max_repetitions < args.min_repetitions:
+        raise ValueError("--max-repetitions не може бути меншим за --min-repetitions")
+    
+    if args.max_seconds <= 0:
+        raise ValueError("Бюджет --max-seconds має бути додатним")
+    
+    if args.regression_threshold < 0:
+        raise ValueError("Поріг --regression-threshold не може бути від'ємним")
+
 
 def merge_sort(array_to_sort: List[int]) -> List[int]:
     """
@@ -46,6 +255,371 @@ def merge_two_sorted_arrays(left_array: List[int], right_array: List[int]) -> Li
     return merged_result
 
 
+def bottom_up_merge_sort(array_to_sort: List[int]) -> List[int]:
+    """
+    Реалізує висхідне сортування злиттям (Bottom-Up Merge Sort) без рекурсії.
+
+    Замість зрізів і нового списку на кожне злиття використовує лише
+    копію вхідного масиву та один заздалегідь виділений буфер: кожен
+    прохід зливає пари серій шириною width з одного масиву в інший,
+    після чого масиви міняються ролями.
+    """
+    elements_count = len(array_to_sort)
+    source = array_to_sort.copy()
+    
+    if elements_count <= 1:
+        return source
+    
+    # Серії довжиною 2 впорядковуються обміном на місці - без проходу через буфер
+    for pair_start in range(0, elements_count - 1, 2):
+        first_value = source[pair_start]
+        second_value = source[pair_start + 1]
+        if second_value < first_value:
+            source[pair_start] = second_value
+            source[pair_start + 1] = first_value
+    
+    target = [None] * elements_count
+    width = 2
+    
+    while width < elements_count:
+        for left_start in range(0, elements_count, 2 * width):
+            middle_index = left_start + width
+            
+            if middle_index >= elements_count:
+                target[left_start:elements_count] = source[left_start:elements_count]
+                continue
+            
+            right_end = min(middle_index + width, elements_count)
+            
+            # Злиття вбудоване в цикл: виклик функції на кожну пару серій
+            # коштує більше, ніж саме злиття коротких серій
+            left_index = left_start
+            right_index = middle_index
+            target_index = left_start
+            left_value = source[left_index]
+            right_value = source[right_index]
+            
+            while True:
+                if left_value <= right_value:
+                    target[target_index] = left_value
+                    target_index += 1
+                    left_index += 1
+                    if left_index == middle_index:
+                        break
+                    left_value = source[left_index]
+                else:
+                    target[target_index] = right_value
+                    target_index += 1
+                    right_index += 1
+                    if right_index == right_end:
+                        break
+                    right_value = source[right_index]
+            
+            if left_index < middle_index:
+                target[target_index:right_end] = source[left_index:middle_index]
+            else:
+                target[target_index:right_end] = source[right_index:right_end]
+        
+        source, target = target, source
+        width *= 2
+    
+    return source
+
+
+def binary_insertion_sort(array_to_sort: List[int], start: int, end: int, sorted_end: int) -> None:
+    """
+    Сортує array_to_sort[start:end] на місці бінарними вставками,
+    вважаючи, що префікс array_to_sort[start:sorted_end] вже відсортований.
+
+    Позиція шукається bisect_right (стабільно), а зсув виконує присвоєння
+    зрізу в межах серії - list.insert зсував би весь хвіст масиву.
+    """
+    for current_position in range(max(sorted_end, start + 1), end):
+        current_element = array_to_sort[current_position]
+        insert_position = bisect_right(array_to_sort, current_element, start, current_position)
+        
+        if insert_position != current_position:
+            array_to_sort[insert_position + 1:current_position + 1] = array_to_sort[insert_position:current_position]
+            array_to_sort[insert_position] = current_element
+
+
+def count_run_and_make_ascending(array_to_sort: List[int], start: int, end: int) -> int:
+    """
+    Знаходить природну серію, що починається з start, і повертає індекс її кінця.
+
+    Строго спадна серія розвертається на місці; нестрогість заборонена,
+    щоб розворот не порушив стабільність рівних елементів.
+    """
+    run_end = start + 1
+    if run_end == end:
+        return end
+    
+    if array_to_sort[run_end] < array_to_sort[start]:
+        while run_end + 1 < end and array_to_sort[run_end + 1] < array_to_sort[run_end]:
+            run_end += 1
+        run_end += 1
+        array_to_sort[start:run_end] = array_to_sort[run_end - 1:start - 1 if start else None:-1]
+    else:
+        while run_end + 1 < end and array_to_sort[run_end + 1] >= array_to_sort[run_end]:
+            run_end += 1
+        run_end += 1
+    
+    return run_end
+
+
+def gallop_right(key: int, array_to_search: List[int], start: int, end: int) -> int:
+    """
+    Повертає перший індекс у [start, end), де елемент більший за key.
+
+    Експоненційний пошук (кроки 1, 2, 4, ...) від start звужує проміжок,
+    а бінарний пошук завершує його - вигідно, коли відповідь близько до start.
+    """
+    low = start
+    offset = 1
+    
+    while start + offset - 1 < end and array_to_search[start + offset - 1] <= key:
+        low = start + offset
+        offset *= 2
+    
+    return bisect_right(array_to_search, key, low, min(start + offset - 1, end))
+
+
+def gallop_left(key: int, array_to_search: List[int], start: int, end: int) -> int:
+    """
+    Повертає перший індекс у [start, end), де елемент не менший за key.
+    """
+    low = start
+    offset = 1
+    
+    while start + offset - 1 < end and array_to_search[start + offset - 1] < key:
+        low = start + offset
+        offset *= 2
+    
+    return bisect_left(array_to_search, key, low, min(start + offset - 1, end))
+
+
+def merge_adjacent_runs(
+    array_to_sort: List[int], 
+    left_start: int, 
+    left_length: int, 
+    right_length: int, 
+    min_gallop: int
+) -> int:
+    """
+    Зливає сусідні серії на місці з галопуванням і повертає нове значення min_gallop.
+
+    Спершу відкидаються елементи, які вже стоять на своїх місцях, потім
+    ліва серія копіюється в тимчасовий буфер. Коли одна серія виграє
+    min_gallop порівнянь поспіль, злиття переходить у режим галопу й
+    переносить цілі блоки зрізами.
+    """
+    right_start = left_start + left_length
+    right_end = right_start + right_length
+    
+    # Префікс лівої серії, не більший за перший елемент правої, вже на місці
+    left_start = gallop_right(array_to_sort[right_start], array_to_sort, left_start, right_start)
+    if left_start == right_start:
+        return min_gallop
+    
+    # Суфікс правої серії, не менший за останній елемент лівої, теж на місці
+    right_end = gallop_left(array_to_sort[right_start - 1], array_to_sort, right_start, right_end)
+    if right_end == right_start:
+        return min_gallop
+    
+    left_buffer = array_to_sort[left_start:right_start]
+    left_length = len(left_buffer)
+    left_index = 0
+    right_index = right_start
+    target_index = left_start
+    
+    while True:
+        left_wins = right_wins = 0
+        
+        while True:
+            if array_to_sort[right_index] < left_buffer[left_index]:
+                array_to_sort[target_index] = array_to_sort[right_index]
+                target_index += 1
+                right_index += 1
+                if right_index == right_end:
+                    array_to_sort[target_index:right_end] = left_buffer[left_index:]
+                    return min_gallop
+                right_wins += 1
+                left_wins = 0
+            else:
+                array_to_sort[target_index] = left_buffer[left_index]
+                target_index += 1
+                left_index += 1
+                if left_index == left_length:
+                    return min_gallop
+                left_wins += 1
+                right_wins = 0
+            
+            if left_wins >= min_gallop or right_wins >= min_gallop:
+                break
+        
+        while True:
+            block_end = gallop_right(array_to_sort[right_index], left_buffer, left_index, left_length)
+            left_wins = block_end - left_index
+            if left_wins:
+                array_to_sort[target_index:target_index + left_wins] = left_buffer[left_index:block_end]
+                target_index += left_wins
+                left_index = block_end
+                if left_index == left_length:
+                    return min_gallop
+            
+            array_to_sort[target_index] = array_to_sort[right_index]
+            target_index += 1
+            right_index += 1
+            if right_index == right_end:
+                array_to_sort[target_index:right_end] = left_buffer[left_index:]
+                return min_gallop
+            
+            block_end = gallop_left(left_buffer[left_index], array_to_sort, right_index, right_end)
+            right_wins = block_end - right_index
+            if right_wins:
+                array_to_sort[target_index:target_index + right_wins] = array_to_sort[right_index:block_end]
+                target_index += right_wins
+                right_index = block_end
+                if right_index == right_end:
+                    array_to_sort[target_index:right_end] = left_buffer[left_index:]
+                    return min_gallop
+            
+            array_to_sort[target_index] = left_buffer[left_index]
+            target_index += 1
+            left_index += 1
+            if left_index == left_length:
+                return min_gallop
+            
+            # Галоп окупається - поріг входу в нього знижується, інакше підвищується
+            min_gallop = max(1, min_gallop - 1)
+            if left_wins < HYBRID_MIN_GALLOP and right_wins < HYBRID_MIN_GALLOP:
+                break
+        
+        min_gallop += 2
+
+
+def adaptive_hybrid_sort(
+    array_to_sort: List[int], 
+    parameters: HybridSortParameters = DEFAULT_HYBRID_PARAMETERS
+) -> List[int]:
+    """
+    Реалізує адаптивне гібридне сортування в дусі Timsort на чистому Python.
+
+    Масиви коротші за insertion_cutoff сортуються бінарними вставками
+    після початкової природної серії.
+    Інакше масив ділиться на природні серії (спадні розвертаються),
+    короткі серії добудовуються до min_run бінарними вставками, а стек
+    серій зливається з галопуванням за інваріантами Timsort.
+    """
+    sorted_array = array_to_sort.copy()
+    elements_count = len(sorted_array)
+    
+    if elements_count < parameters.insertion_cutoff:
+        if elements_count > 1:
+            leading_run_end = count_run_and_make_ascending(sorted_array, 0, elements_count)
+            binary_insertion_sort(sorted_array, 0, elements_count, leading_run_end)
+        return sorted_array
+    
+    runs_stack = []
+    min_gallop = HYBRID_MIN_GALLOP
+    run_start = 0
+    
+    while run_start < elements_count:
+        run_end = count_run_and_make_ascending(sorted_array, run_start, elements_count)
+        
+        if run_end - run_start < parameters.min_run:
+            forced_end = min(run_start + parameters.min_run, elements_count)
+            binary_insertion_sort(sorted_array, run_start, forced_end, run_end)
+            run_end = forced_end
+        
+        runs_stack.append([run_start, run_end - run_start])
+        min_gallop = collapse_runs_stack(sorted_array, runs_stack, min_gallop, force=False)
+        run_start = run_end
+    
+    collapse_runs_stack(sorted_array, runs_stack, min_gallop, force=True)
+    
+    return sorted_array
+
+
+def collapse_runs_stack(array_to_sort: List[int], runs_stack: List[List[int]], min_gallop: int, force: bool) -> int:
+    """
+    Зливає серії на вершині стеку, доки не виконуються інваріанти Timsort
+    (|A| > |B| + |C| і |B| > |C|), а з force=True - до однієї серії.
+    """
+    while len(runs_stack) > 1:
+        merge_index = len(runs_stack) - 2
+        
+        if force:
+            if merge_index > 0 and runs_stack[merge_index - 1][1] < runs_stack[merge_index + 1][1]:
+                merge_index -= 1
+        elif (
+            (merge_index > 0 and runs_stack[merge_index - 1][1] <= runs_stack[merge_index][1] + runs_stack[merge_index + 1][1])
+            or (merge_index > 1 and runs_stack[merge_index - 2][1] <= runs_stack[merge_index - 1][1] + runs_stack[merge_index][1])
+        ):
+            if runs_stack[merge_index - 1][1] < runs_stack[merge_index + 1][1]:
+                merge_index -= 1
+        elif runs_stack[merge_index][1] > runs_stack[merge_index + 1][1]:
+            break
+        
+        left_start, left_length = runs_stack[merge_index]
+        right_length = runs_stack[merge_index + 1][1]
+        
+        min_gallop = merge_adjacent_runs(array_to_sort, left_start, left_length, right_length, min_gallop)
+        
+        runs_stack[merge_index][1] = left_length + right_length
+        del runs_stack[merge_index + 1]
+    
+    return min_gallop
+
+
+def calibrate_hybrid_sort_parameters() -> HybridSortParameters:
+    """
+    Підбирає insertion_cutoff і min_run гібридного сортування на цій машині.
+
+    Поріг - найбільший розмір, на якому бінарні вставки ще не повільніші
+    за повний гібрид; min_run - найшвидший кандидат на випадкових і майже
+    відсортованих масивах. Використовує власний генератор, щоб не зсувати
+    глобальну послідовність random.seed(42) для основних тестів.
+    """
+    calibration_random = random.Random(2024)
+    
+    def best_time(sorting_call, arrays):
+        return min(
+            timeit.timeit(lambda: [sorting_call(array) for array in arrays], number=1)
+            for _ in range(HYBRID_CALIBRATION_REPEATS)
+        )
+    
+    insertion_cutoff = HYBRID_CUTOFF_CANDIDATES[0]
+    for candidate_cutoff in HYBRID_CUTOFF_CANDIDATES:
+        arrays = [[calibration_random.randint(1, 1000) for _ in range(candidate_cutoff)] for _ in range(50)]
+        insertion_time = best_time(lambda array: adaptive_hybrid_sort(array, HybridSortParameters(candidate_cutoff + 1, 1)), arrays)
+        merging_time = best_time(lambda array: adaptive_hybrid_sort(array, HybridSortParameters(0, insertion_cutoff)), arrays)
+        
+        if insertion_time > merging_time:
+            break
+        insertion_cutoff = candidate_cutoff
+    
+    calibration_arrays = [
+        [calibration_random.randint(1, 1000) for _ in range(HYBRID_CALIBRATION_SIZE)]
+        for _ in range(3)
+    ]
+    nearly_sorted_array = list(range(HYBRID_CALIBRATION_SIZE))
+    for _ in range(HYBRID_CALIBRATION_SIZE // 10):
+        i, j = calibration_random.randrange(HYBRID_CALIBRATION_SIZE), calibration_random.randrange(HYBRID_CALIBRATION_SIZE)
+        nearly_sorted_array[i], nearly_sorted_array[j] = nearly_sorted_array[j], nearly_sorted_array[i]
+    calibration_arrays.append(nearly_sorted_array)
+    
+    min_run = min(
+        HYBRID_MIN_RUN_CANDIDATES,
+        key=lambda candidate_min_run: best_time(
+            lambda array: adaptive_hybrid_sort(array, HybridSortParameters(insertion_cutoff, candidate_min_run)),
+            calibration_arrays
+        )
+    )
+    
+    return HybridSortParameters(insertion_cutoff=insertion_cutoff, min_run=min_run)
+
+
 def insertion_sort(array_to_sort: List[int]) -> List[int]:
     """
     Реалізує алгоритм сортування вставками (Insertion Sort).
@@ -101,28 +675,190 @@ def generate_test_data(size: int, data_type: str) -> List[int]:
 def measure_algorithm_performance(
     sorting_algorithm: Callable[[List[int]], List[int]], 
     test_data: List[int], 
-    iterations_count: int = 3
-) -> float:
+    timing_settings: TimingSettings = DEFAULT_TIMING_SETTINGS
+) -> TimingStatistics:
+    """
+    Вимірює час виконання алгоритму сортування зі статистичним контролем.
+
+    Після розігріву одна вибірка - це середній час кількох запусків
+    поспіль, щоб вибірка тривала не менше TIMING_MIN_SAMPLE_SECONDS.
+    Вибірки збираються, доки відносна напівширина 95% довірчого
+    інтервалу середнього не стане меншою за confidence_target, або до
+    ліміту вибірок чи часу.
+    """
+    import gc
+    import statistics
+    
+    def run_sample(loops_count):
+        start_time = time.perf_counter()
+        for _ in range(loops_count):
+            sorting_algorithm(test_data.copy())
+        return (time.perf_counter() - start_time) / loops_count
+    
+    gc_was_enabled = gc.isenabled()
+    
+    if timing_settings.disable_gc:
+        gc.collect()
+        gc.disable()
+    
+    try:
+        probe_time = run_sample(1)
+        for _ in range(timing_settings.warmup_runs):
+            probe_time = run_sample(1)
+        
+        loops_per_sample = max(1, math.ceil(TIMING_MIN_SAMPLE_SECONDS / max(probe_time, 1e-9)))
+        
+        samples = []
+        sampling_started = time.perf_counter()
+        
+        while len(samples) < timing_settings.max_repetitions:
+            samples.append(run_sample(loops_per_sample))
+            
+            if len(samples) < timing_settings.min_repetitions:
+                continue
+            
+            mean_time = statistics.mean(samples)
+            confidence_half_width = TIMING_CONFIDENCE_Z * statistics.stdev(samples) / math.sqrt(len(samples))
+            
+            if confidence_half_width <= timing_settings.confidence_target * mean_time:
+                break
+            if time.perf_counter() - sampling_started >= timing_settings.max_seconds:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    lower_quartile, _, upper_quartile = statistics.quantiles(samples, n=4)
+    
+    return TimingStatistics(
+        median=statistics.median(samples),
+        iqr=upper_quartile - lower_quartile,
+        minimum=min(samples),
+        mean=statistics.mean(samples),
+        repetitions=len(samples),
+        loops_per_sample=loops_per_sample,
+        samples=samples
+    )
+
+
+def measure_algorithm_peak_memory(
+    sorting_algorithm: Callable[[List[int]], List[int]], 
+    test_data: List[int]
+) -> int:
+    """
+    Вимірює пік виділеної пам'яті (у байтах) під час одного запуску алгоритму.
+
+    Виконується окремим проходом, бо tracemalloc сповільнює виділення
+    пам'яті й спотворив би вимір часу.
+    """
+    import tracemalloc
+    
+    data_copy = test_data.copy()
+    
+    tracemalloc.start()
+    try:
+        sorting_algorithm(data_copy)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return peak_bytes
+
+
+def pin_benchmark_worker(cpu_queue) -> None:
+    """
+    Ініціалізатор процесу-робітника: забирає з черги власне ядро й закріплюється за ним.
+    """
+    os.sched_setaffinity(0, {cpu_queue.get()})
+
+
+def measure_benchmark_case(
+    sorting_algorithm: Callable[[List[int]], List[int]], 
+    test_data: List[int], 
+    timing_settings: TimingSettings
+) -> Tuple[TimingStatistics, int]:
     """
-    Вимірює час виконання алгоритму сортування.
+    Виконує один незалежний вимір: статистику часу і пік пам'яті.
     """
-    def run_single_test():
-        data_copy = test_data.copy()
-        return sorting_algorithm(data_copy)
+    timing_statistics = measure_algorithm_performance(sorting_algorithm, test_data, timing_settings)
     
-    execution_times = []
-    for _ in range(iterations_count):
-        execution_time = timeit.timeit(run_single_test, number=1)
-        execution_times.append(execution_time)
+    peak_memory_bytes = measure_algorithm_peak_memory(sorting_algorithm, test_data)
     
-    return statistics.mean(execution_times)
+    return timing_statistics, peak_memory_bytes
 
 
-def run_comprehensive_performance_test() -> Dict[str, Any]:
+def iterate_sequential_measurements(
+    benchmark_cases: List[BenchmarkCase], 
+    algorithms_to_test: Dict[str, Callable[[List[int]], List[int]]], 
+    total_tests: int, 
+    timing_settings: TimingSettings
+):
+    """
+    Виконує виміри по черзі в поточному процесі, оголошуючи кожен перед запуском.
+    """
+    for current_test, benchmark_case in enumerate(benchmark_cases, start=1):
+        algorithm_name, data_type, size, test_data = benchmark_case
+        print(f"{Fore.BLUE}[{current_test}/{total_tests}]{Style.RESET_ALL} Тестую {Fore.YELLOW}{algorithm_name}{Style.RESET_ALL} | {Fore.GREEN}{data_type}{Style.RESET_ALL} | {size} елементів...")
+        
+        try:
+            yield benchmark_case, measure_benchmark_case(algorithms_to_test[algorithm_name], test_data, timing_settings), None
+        except Exception as error:
+            yield benchmark_case, None, error
+
+
+def run_benchmark_cases_in_processes(
+    benchmark_cases: List[BenchmarkCase], 
+    algorithms_to_test: Dict[str, Callable[[List[int]], List[int]]], 
+    jobs_count: int, 
+    pin_cpus: bool, 
+    timing_settings: TimingSettings
+):
+    """
+    Розподіляє виміри між процесами й повертає їх у порядку завершення.
+
+    Кожен процес виконує лише один вимір одночасно, тож з --pin-cpus
+    на кожному ядрі працює рівно один вимір і паралельні запуски не
+    конкурують за ядро.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    executor_options = {}
+    
+    if pin_cpus:
+        cpu_queue = multiprocessing.Queue()
+        for cpu_index in get_available_cpus()[:jobs_count]:
+            cpu_queue.put(cpu_index)
+        executor_options = {"initializer": pin_benchmark_worker, "initargs": (cpu_queue,)}
+    
+    with ProcessPoolExecutor(max_workers=jobs_count, **executor_options) as executor:
+        case_futures = {
+            executor.submit(measure_benchmark_case, algorithms_to_test[benchmark_case.algorithm_name], benchmark_case.test_data, timing_settings): benchmark_case
+            for benchmark_case in benchmark_cases
+        }
+        
+        for future in as_completed(case_futures):
+            try:
+                yield case_futures[future], future.result(), None
+            except Exception as error:
+                yield case_futures[future], None, error
+
+
+def run_comprehensive_performance_test(
+    jobs_count: int = 1, 
+    pin_cpus: bool = False, 
+    timing_settings: TimingSettings = DEFAULT_TIMING_SETTINGS
+) -> Dict[str, Any]:
+    print(f"{Fore.WHITE}Калібрую параметри гібридного сортування...{Style.RESET_ALL}")
+    hybrid_parameters = calibrate_hybrid_sort_parameters()
+    print(f"{Fore.WHITE}Поріг вставок: {hybrid_parameters.insertion_cutoff}, min_run: {hybrid_parameters.min_run}{Style.RESET_ALL}")
+    
     algorithms_to_test = {
         'Merge Sort': merge_sort,
+        'Merge Sort (Bottom-Up)': bottom_up_merge_sort,
         'Insertion Sort': insertion_sort, 
-        'Timsort (Python)': timsort_wrapper
+        HYBRID_ALGORITHM_NAME: partial(adaptive_hybrid_sort, parameters=hybrid_parameters),
+        TIMSORT_ALGORITHM_NAME: timsort_wrapper
     }
     
     test_sizes = [100, 500, 1000, 2000, 5000]
@@ -133,48 +869,222 @@ def run_comprehensive_performance_test() -> Dict[str, Any]:
     print(f"{Fore.WHITE}Тестуємо {len(algorithms_to_test)} алгоритми{Style.RESET_ALL}")
     print(f"{Fore.WHITE}Розміри масивів: {test_sizes}{Style.RESET_ALL}")
     print(f"{Fore.WHITE}Типи даних: {data_types}{Style.RESET_ALL}")
+    if jobs_count > 1:
+        print(f"{Fore.WHITE}Процесів: {jobs_count}{' (закріплені за ядрами)' if pin_cpus else ''}{Style.RESET_ALL}")
+    print(
+        f"{Fore.WHITE}Розігрів: {timing_settings.warmup_runs}, вибірок: {timing_settings.min_repetitions}-{timing_settings.max_repetitions}, "
+        f"ціль довірчого інтервалу: ±{timing_settings.confidence_target:.0%}, GC {'вимкнено' if timing_settings.disable_gc else 'увімкнено'}{Style.RESET_ALL}"
+    )
     print(f"{Fore.CYAN}=" * 70 + f"{Style.RESET_ALL}")
     
     test_results = {
         'algorithms': list(algorithms_to_test.keys()),
         'sizes': test_sizes,
         'data_types': data_types,
-        'results': {}
+        'results': {},
+        'peak_memory': {},
+        'timing_statistics': {},
+        'hybrid_parameters': hybrid_parameters._asdict(),
+        'metadata': {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'jobs': jobs_count,
+            'pin_cpus': pin_cpus,
+            'timing_settings': timing_settings._asdict()
+        }
     }
     
-    total_tests = len(algorithms_to_test) * len(test_sizes) * len(data_types)
-    current_test = 0
+    # Дані генеруються в тому ж порядку, що й завжди, тож з random.seed(42)
+    # кожен вимір отримує ті самі масиви незалежно від --jobs
+    benchmark_cases = []
     
-    for algorithm_name, algorithm_function in algorithms_to_test.items():
+    for algorithm_name in algorithms_to_test:
         test_results['results'][algorithm_name] = {}
+        test_results['peak_memory'][algorithm_name] = {}
+        test_results['timing_statistics'][algorithm_name] = {}
         
         for data_type in data_types:
             test_results['results'][algorithm_name][data_type] = {}
+            test_results['peak_memory'][algorithm_name][data_type] = {}
+            test_results['timing_statistics'][algorithm_name][data_type] = {}
             
             for size in test_sizes:
-                current_test += 1
-                print(f"{Fore.BLUE}[{current_test}/{total_tests}]{Style.RESET_ALL} Тестую {Fore.YELLOW}{algorithm_name}{Style.RESET_ALL} | {Fore.GREEN}{data_type}{Style.RESET_ALL} | {size} елементів...")
-                
-                try:
-                    test_data = generate_test_data(size, data_type)
-                    
-                    execution_time = measure_algorithm_performance(
-                        algorithm_function, 
-                        test_data, 
-                        iterations_count=3
-                    )
-                    
-                    test_results['results'][algorithm_name][data_type][size] = execution_time
-                    
-                    print(f"    {Fore.GREEN}Завершено за {execution_time:.6f} секунд{Style.RESET_ALL}")
-                    
-                except Exception as error:
-                    print(f"    {Fore.RED}Помилка: {error}{Style.RESET_ALL}")
-                    test_results['results'][algorithm_name][data_type][size] = None
+                benchmark_cases.append(BenchmarkCase(algorithm_name, data_type, size, generate_test_data(size, data_type)))
+    
+    total_tests = len(benchmark_cases)
+    
+    if jobs_count > 1:
+        case_measurements = run_benchmark_cases_in_processes(benchmark_cases, algorithms_to_test, jobs_count, pin_cpus, timing_settings)
+    else:
+        if pin_cpus:
+            os.sched_setaffinity(0, {get_available_cpus()[0]})
+        case_measurements = iterate_sequential_measurements(benchmark_cases, algorithms_to_test, total_tests, timing_settings)
+    
+    for current_test, (benchmark_case, measurement, error) in enumerate(case_measurements, start=1):
+        algorithm_name, data_type, size, _ = benchmark_case
+        
+        if jobs_count > 1:
+            print(f"{Fore.BLUE}[{current_test}/{total_tests}]{Style.RESET_ALL} Виміряно {Fore.YELLOW}{algorithm_name}{Style.RESET_ALL} | {Fore.GREEN}{data_type}{Style.RESET_ALL} | {size} елементів")
+        
+        if error is not None:
+            print(f"    {Fore.RED}Помилка: {error}{Style.RESET_ALL}")
+            test_results['results'][algorithm_name][data_type][size] = None
+            test_results['peak_memory'][algorithm_name][data_type][size] = None
+            test_results['timing_statistics'][algorithm_name][data_type][size] = None
+            continue
+        
+        timing_statistics, peak_memory_bytes = measurement
+        
+        # У 'results' лишається одне число на вимір - тепер це медіана
+        test_results['results'][algorithm_name][data_type][size] = timing_statistics.median
+        test_results['peak_memory'][algorithm_name][data_type][size] = peak_memory_bytes
+        test_results['timing_statistics'][algorithm_name][data_type][size] = timing_statistics._asdict()
+        
+        print(
+            f"    {Fore.GREEN}Медіана {timing_statistics.median:.6f} с (IQR {timing_statistics.iqr:.6f}, мін. {timing_statistics.minimum:.6f}, "
+            f"{timing_statistics.repetitions} вибірок x {timing_statistics.loops_per_sample}), пік пам'яті {peak_memory_bytes / 1024:.1f} КБ{Style.RESET_ALL}"
+        )
     
     return test_results
 
 
+def save_results_json(test_results: Dict[str, Any], output_path: Path) -> None:
+    """
+    Зберігає результати разом із вибірками, щоб їх можна було порівняти пізніше.
+    """
+    output_path.write_text(json.dumps(test_results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_results_json(input_path: Path) -> Dict[str, Any]:
+    """
+    Завантажує збережені результати; JSON зберігає розміри як рядки, тож вони повертаються до int.
+    """
+    test_results = json.loads(input_path.read_text(encoding="utf-8"))
+    
+    for section_name in ('results', 'peak_memory', 'timing_statistics'):
+        for algorithm_results in test_results.get(section_name, {}).values():
+            for data_type in algorithm_results:
+                algorithm_results[data_type] = {
+                    int(size): value for size, value in algorithm_results[data_type].items()
+                }
+    
+    return test_results
+
+
+def save_results_csv(test_results: Dict[str, Any], output_path: Path) -> None:
+    """
+    Зберігає зведену таблицю: один рядок на алгоритм, тип даних і розмір.
+    """
+    timing_results = test_results.get('timing_statistics', {})
+    
+    with output_path.open("w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['algorithm', 'data_type', 'size', 'median_s', 'iqr_s', 'min_s', 'mean_s', 'repetitions', 'loops_per_sample', 'peak_memory_bytes'])
+        
+        for algorithm in test_results['algorithms']:
+            for data_type in test_results['data_types']:
+                for size in test_results['sizes']:
+                    statistics_row = timing_results.get(algorithm, {}).get(data_type, {}).get(size)
+                    if statistics_row is None:
+                        continue
+                    
+                    writer.writerow([
+                        algorithm, data_type, size,
+                        statistics_row['median'], statistics_row['iqr'], statistics_row['minimum'], statistics_row['mean'],
+                        statistics_row['repetitions'], statistics_row['loops_per_sample'],
+                        test_results['peak_memory'][algorithm][data_type][size]
+                    ])
+
+
+def mann_whitney_slowdown_p_value(current_samples: List[float], baseline_samples: List[float]) -> float:
+    """
+    Однобічний тест Манна-Вітні: p-значення гіпотези, що поточні вибірки повільніші за базові.
+
+    Використовує нормальне наближення з поправкою на зв'язки; для 5+
+    вибірок з кожного боку його точності достатньо.
+    """
+    combined_samples = sorted(
+        [(sample, 0) for sample in current_samples] + [(sample, 1) for sample in baseline_samples]
+    )
+    
+    ranks_sum = 0.0
+    ties_correction = 0.0
+    position = 0
+    
+    while position < len(combined_samples):
+        tie_end = position
+        while tie_end + 1 < len(combined_samples) and combined_samples[tie_end + 1][0] == combined_samples[position][0]:
+            tie_end += 1
+        
+        tie_count = tie_end - position + 1
+        average_rank = (position + tie_end) / 2 + 1
+        ranks_sum += average_rank * sum(1 for index in range(position, tie_end + 1) if combined_samples[index][1] == 0)
+        ties_correction += tie_count ** 3 - tie_count
+        position = tie_end + 1
+    
+    current_count = len(current_samples)
+    baseline_count = len(baseline_samples)
+    total_count = current_count + baseline_count
+    
+    u_statistic = ranks_sum - current_count * (current_count + 1) / 2
+    expected_u = current_count * baseline_count / 2
+    variance_u = current_count * baseline_count / 12 * ((total_count + 1) - ties_correction / (total_count * (total_count - 1)))
+    
+    if variance_u <= 0:
+        return 1.0
+    
+    z_score = (u_statistic - expected_u) / math.sqrt(variance_u)
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+def compare_with_baseline(test_results: Dict[str, Any], baseline_results: Dict[str, Any], regression_threshold: float) -> int:
+    """
+    Порівнює поточний прогін із базовим і повертає кількість регресій.
+
+    Регресія - це медіана, повільніша на понад regression_threshold, за
+    умови що тест Манна-Вітні на вибірках значущий на рівні
+    REGRESSION_SIGNIFICANCE_LEVEL. Так шум не видається за сповільнення.
+    """
+    current_statistics = test_results.get('timing_statistics', {})
+    baseline_statistics = baseline_results.get('timing_statistics', {})
+    
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}ПОРІВНЯННЯ З БАЗОВИМ ПРОГОНОМ{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}=" * 80 + f"{Style.RESET_ALL}")
+    
+    regressions_count = 0
+    improvements_count = 0
+    compared_count = 0
+    
+    for algorithm in test_results['algorithms']:
+        for data_type in test_results['data_types']:
+            for size in test_results['sizes']:
+                current = current_statistics.get(algorithm, {}).get(data_type, {}).get(size)
+                baseline = baseline_statistics.get(algorithm, {}).get(data_type, {}).get(size)
+                
+                if current is None or baseline is None or not baseline['median']:
+                    continue
+                
+                compared_count += 1
+                ratio = current['median'] / baseline['median']
+                label = f"{algorithm:<24} {data_type:<14} {size:>5}: {baseline['median']:.6f} -> {current['median']:.6f} с ({ratio:.2f}x)"
+                
+                if ratio > 1 + regression_threshold:
+                    p_value = mann_whitney_slowdown_p_value(current['samples'], baseline['samples'])
+                    if p_value < REGRESSION_SIGNIFICANCE_LEVEL:
+                        regressions_count += 1
+                        print(f"{Fore.RED}[REGRESSION]{Style.RESET_ALL} {label}, p={p_value:.4f}")
+                elif ratio < 1 - regression_threshold:
+                    p_value = mann_whitney_slowdown_p_value(baseline['samples'], current['samples'])
+                    if p_value < REGRESSION_SIGNIFICANCE_LEVEL:
+                        improvements_count += 1
+                        print(f"{Fore.GREEN}[FASTER]{Style.RESET_ALL} {label}, p={p_value:.4f}")
+    
+    print(f"\n{Fore.WHITE}Порівняно вимірів: {compared_count}, регресій: {regressions_count}, прискорень: {improvements_count}{Style.RESET_ALL}")
+    
+    return regressions_count
+
+
 def analyze_and_display_results(test_results: Dict[str, Any]) -> None:
     """
     Аналізує та відображає результати тестування у зручному форматі.
@@ -205,6 +1115,46 @@ def analyze_and_display_results(test_results: Dict[str, Any]) -> None:
             
             if fastest_algorithm:
                 print(f"  {size:>5} елементів: {Fore.GREEN}{fastest_algorithm}{Style.RESET_ALL} ({best_time:.6f}s)")
+    
+    peak_memory = test_results.get('peak_memory', {})
+    largest_size = max(sizes)
+    
+    print(f"\n{Fore.GREEN}{Style.BRIGHT}ПІК ПАМ'ЯТІ НА {largest_size} ЕЛЕМЕНТАХ (random):{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}-" * 50 + f"{Style.RESET_ALL}")
+    
+    for algorithm in algorithms:
+        peak_bytes = peak_memory.get(algorithm, {}).get('random', {}).get(largest_size)
+        if peak_bytes is not None:
+            print(f"  {algorithm:<24} {peak_bytes / 1024:>10.1f} КБ")
+    
+    if HYBRID_ALGORITHM_NAME in algorithms and TIMSORT_ALGORITHM_NAME in algorithms:
+        display_hybrid_versus_timsort(test_results)
+
+
+def display_hybrid_versus_timsort(test_results: Dict[str, Any]) -> None:
+    """
+    Показує, у скільки разів гібрид на чистому Python повільніший за вбудований sorted().
+    """
+    results = test_results['results']
+    hybrid_parameters = test_results.get('hybrid_parameters', {})
+    
+    print(f"\n{Fore.GREEN}{Style.BRIGHT}{HYBRID_ALGORITHM_NAME.upper()} ПРОТИ sorted() (разів повільніше):{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}-" * 50 + f"{Style.RESET_ALL}")
+    print(f"  Параметри: поріг вставок {hybrid_parameters.get('insertion_cutoff')}, min_run {hybrid_parameters.get('min_run')}")
+    
+    for data_type in HYBRID_COMPARISON_DATA_TYPES:
+        if data_type not in test_results['data_types']:
+            continue
+        
+        print(f"\n{Fore.CYAN}{data_type.upper()}:{Style.RESET_ALL}")
+        for size in test_results['sizes']:
+            hybrid_time = results[HYBRID_ALGORITHM_NAME][data_type][size]
+            timsort_time = results[TIMSORT_ALGORITHM_NAME][data_type][size]
+            
+            if hybrid_time is None or not timsort_time:
+                continue
+            
+            print(f"  {size:>5} елементів: {hybrid_time / timsort_time:>8.1f}x ({hybrid_time:.6f}s проти {timsort_time:.6f}s)")
 
 
 def generate_performance_insights(test_results: Dict[str, Any]) -> None:
@@ -233,6 +1183,17 @@ def generate_performance_insights(test_results: Dict[str, Any]) -> None:
     print(f"  {Fore.CYAN}-{Style.RESET_ALL} Ефективний на великих масивах")
     print(f"  {Fore.CYAN}-{Style.RESET_ALL} Потребує додаткову пам'ять для злиття")
     
+    print(f"\n{Fore.BLUE}Merge Sort (Bottom-Up):{Style.RESET_ALL}")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Без рекурсії та без зрізів на кожному рівні")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Один допоміжний буфер на весь час сортування замість O(n log n) виділень")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Менше навантаження на збирач сміття та нижчий пік пам'яті")
+    
+    print(f"\n{Fore.BLUE}{HYBRID_ALGORITHM_NAME}:{Style.RESET_ALL}")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Ті самі ідеї, що й у Timsort, але на чистому Python")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Відсортовані та зворотні дані - один прохід O(n) без злиттів")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Пороги підбираються калібруванням на конкретній машині")
+    print(f"  {Fore.CYAN}-{Style.RESET_ALL} Відставання від sorted() - ціна інтерпретатора, а не алгоритму")
+    
     # Аналіз Timsort
     print(f"\n{Fore.GREEN}Timsort (Python):{Style.RESET_ALL}")
     print(f"  {Fore.CYAN}-{Style.RESET_ALL} Найкраща загальна продуктивність у більшості випадків")
@@ -305,22 +1266,64 @@ def generate_performance_insights(test_results: Dict[str, Any]) -> None:
 
 
 def main():
+    args = setup_command_line_arguments()
+    
+    try:
+        validate_jobs_arguments(args)
+        validate_timing_arguments(args)
+    except ValueError as error:
+        print(f"{Fore.RED}Помилка: {error}{Style.RESET_ALL}")
+        sys.exit(1)
+    
+    if args.jobs > len(get_available_cpus()):
+        print(f"{Fore.YELLOW}Увага: процесів більше, ніж доступних ядер - паралельні виміри конкуруватимуть за процесор{Style.RESET_ALL}")
+    
     print(f"{Fore.MAGENTA}{Style.BRIGHT}ПОРІВНЯЛЬНИЙ АНАЛІЗ АЛГОРИТМІВ СОРТУВАННЯ{Style.RESET_ALL}")
     print(f"{Fore.WHITE}Емпірична перевірка теоретичних оцінок складності{Style.RESET_ALL}")
     print(f"{Fore.CYAN}=" * 80 + f"{Style.RESET_ALL}")
     
     try:
-        random.seed(42)
-        
-        print(f"{Fore.WHITE}Запускаю комплексне тестування...{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Це може зайняти кілька хвилин, будь ласка, зачекайте...{Style.RESET_ALL}")
+        baseline_results = load_results_json(args.compare) if args.compare is not None else None
         
-        test_results = run_comprehensive_performance_test()
+        if args.load is not None:
+            print(f"{Fore.WHITE}Завантажую результати з {args.load}...{Style.RESET_ALL}")
+            test_results = load_results_json(args.load)
+        else:
+            random.seed(42)
+            
+            print(f"{Fore.WHITE}Запускаю комплексне тестування...{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}Це може зайняти кілька хвилин, будь ласка, зачекайте...{Style.RESET_ALL}")
+            
+            timing_settings = TimingSettings(
+                warmup_runs=args.warmup,
+                confidence_target=args.confidence,
+                min_repetitions=args.min_repetitions,
+                max_repetitions=args.max_repetitions,
+                max_seconds=args.max_seconds,
+                disable_gc=args.disable_gc
+            )
+            
+            test_results = run_comprehensive_performance_test(args.jobs, args.pin_cpus, timing_settings)
         
         analyze_and_display_results(test_results)
         
         print(f"\n{Fore.GREEN}Аналіз завершено успішно!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}Детальні результати збережені в пам'яті програми{Style.RESET_ALL}")
+        
+        if args.output is not None:
+            save_results_json(test_results, args.output)
+            print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Результати JSON збережено в: {args.output.resolve()}")
+        
+        if args.csv is not None:
+            save_results_csv(test_results, args.csv)
+            print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} Таблицю CSV збережено в: {args.csv.resolve()}")
+        
+        if args.output is None and args.csv is None:
+            print(f"{Fore.WHITE}Детальні результати збережені в пам'яті програми (--output/--csv зберігають їх у файл){Style.RESET_ALL}")
+        
+        if baseline_results is not None:
+            regressions_count = compare_with_baseline(test_results, baseline_results, args.regression_threshold)
+            if regressions_count:
+                sys.exit(1)
         
         return test_results
         
@@ -0,0 +1,223 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+TASK_01_PATH = Path(__file__).resolve().parent / "task_01.py"
+
+
+def run_task_01(*arguments):
+    completed = subprocess.run(
+        [sys.executable, os.fspath(TASK_01_PATH), "-q", *map(os.fspath, arguments)],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+
+
+def run_organizer(source_directory_path, destination_directory_path, *extra_arguments):
+    run_task_01(source_directory_path, destination_directory_path, *extra_arguments)
+
+
+def read_destination_contents(destination_directory_path):
+    return sorted(file_path.read_text() for file_path in (destination_directory_path / "txt").iterdir())
+
+
+def write_with_new_mtime(file_path, content):
+    previous_mtime_ns = file_path.stat().st_mtime_ns
+    file_path.write_text(content)
+    os.utime(file_path, ns=(previous_mtime_ns + 10**9, previous_mtime_ns + 10**9))
+
+
+def test_sync_dedup_skip_keeps_both_files_after_either_changes(tmp_path):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    (source_directory_path / "a").mkdir(parents=True)
+    (source_directory_path / "b").mkdir()
+    first_file_path = source_directory_path / "a" / "x.txt"
+    second_file_path = source_directory_path / "b" / "y.txt"
+    first_file_path.write_text("same")
+    second_file_path.write_text("same")
+
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "skip")
+    assert read_destination_contents(destination_directory_path) == ["same"]
+
+    write_with_new_mtime(first_file_path, "CHANGED a")
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "skip")
+    assert read_destination_contents(destination_directory_path) == ["CHANGED a", "same"]
+
+    write_with_new_mtime(second_file_path, "CHANGED b")
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "skip")
+    assert "CHANGED a" in read_destination_contents(destination_directory_path)
+    assert "CHANGED b" in read_destination_contents(destination_directory_path)
+
+    # Повторний запуск без змін нічого не перезаписує
+    contents_before_rerun = read_destination_contents(destination_directory_path)
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "skip")
+    assert read_destination_contents(destination_directory_path) == contents_before_rerun
+
+
+def test_execute_plan_links_duplicate_of_file_from_previous_sync_run(tmp_path):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    plan_path = tmp_path / "plan.jsonl"
+    # Файли директорії обходяться раніше за піддиректорії: x.txt - оригінал
+    source_directory_path.mkdir()
+    (source_directory_path / "x.txt").write_text("same")
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "hardlink")
+
+    (source_directory_path / "b").mkdir()
+    (source_directory_path / "b" / "y.txt").write_text("same")
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "hardlink", "--dry-run", "--save-plan", plan_path)
+    assert '"txt/x.txt"]' in plan_path.read_text()
+
+    run_task_01("--execute-plan", plan_path)
+    assert (destination_directory_path / "txt" / "y.txt").read_text() == "same"
+    assert (destination_directory_path / "txt" / "y.txt").samefile(destination_directory_path / "txt" / "x.txt")
+
+
+def test_execute_plan_copies_duplicate_when_previous_original_is_gone(tmp_path):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    plan_path = tmp_path / "plan.jsonl"
+    # Файли директорії обходяться раніше за піддиректорії: x.txt - оригінал
+    source_directory_path.mkdir()
+    (source_directory_path / "x.txt").write_text("same")
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "hardlink")
+
+    (source_directory_path / "b").mkdir()
+    (source_directory_path / "b" / "y.txt").write_text("same")
+    run_organizer(source_directory_path, destination_directory_path, "--sync", "--dedup", "hardlink", "--dry-run", "--save-plan", plan_path)
+    (destination_directory_path / "txt" / "x.txt").unlink()
+
+    run_task_01("--execute-plan", plan_path)
+    assert (destination_directory_path / "txt" / "y.txt").read_text() == "same"
+
+
+@pytest.mark.parametrize("dedup_mode", ["skip", "hardlink"])
+def test_watch_with_dedup_copies_edited_file_of_same_size(tmp_path, dedup_mode):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    source_directory_path.mkdir()
+    edited_file_path = source_directory_path / "a.txt"
+    edited_file_path.write_text("AAAA")
+
+    watch_process = subprocess.Popen(
+        [
+            sys.executable, os.fspath(TASK_01_PATH), os.fspath(source_directory_path), os.fspath(destination_directory_path), 
+            "-q", "--watch", "--debounce", "0.2", "--dedup", dedup_mode
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env=dict(os.environ, PYTHONUNBUFFERED="1")
+    )
+
+    try:
+        for line in watch_process.stdout:
+            if "[WATCH]" in line:
+                break
+
+        write_with_new_mtime(edited_file_path, "BBBB")
+
+        for line in watch_process.stdout:
+            if "Подій:" in line:
+                assert "скопійовано: 1" in line
+                break
+    finally:
+        watch_process.send_signal(signal.SIGINT)
+        output = watch_process.communicate(timeout=30)[0]
+
+    assert (destination_directory_path / "txt" / "a.txt").read_text() == "BBBB"
+    assert "Знайдено дублікатів: 0" in output
+
+
+def test_async_dedup_links_every_duplicate_without_hanging(tmp_path):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    for directory_index in range(8):
+        for file_index in range(10):
+            file_path = source_directory_path / f"d{directory_index}" / f"f{directory_index}_{file_index}.txt"
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(f"content {file_index % 3}")
+
+    run_organizer(
+        source_directory_path, 
+        destination_directory_path, 
+        "--async", "--dedup", "hardlink", "--copy-concurrency", "1", "--stat-concurrency", "16"
+    )
+
+    copied_files = list((destination_directory_path / "txt").iterdir())
+    assert len(copied_files) == 80
+    assert len({file_path.stat().st_ino for file_path in copied_files}) == 3
+    assert all(file_path.read_text().startswith("content ") for file_path in copied_files)
+
+
+def read_archive_index(index_path):
+    return [json.loads(line) for line in index_path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "zip"])
+def test_archive_index_offsets_point_at_members_after_append(tmp_path, archive_format):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    (source_directory_path / "nested").mkdir(parents=True)
+    (source_directory_path / "a.txt").write_text("alpha" * 300)
+    (source_directory_path / "nested" / "b.txt").write_text("b")
+
+    run_organizer(source_directory_path, destination_directory_path, "--archive", archive_format)
+    (source_directory_path / "a.txt").write_text("second run")
+    run_organizer(source_directory_path, destination_directory_path, "--archive", archive_format)
+
+    archive_path = destination_directory_path / f"txt.{archive_format}"
+    index_entries = read_archive_index(archive_path.with_name(archive_path.name + ".index.jsonl"))
+    expected_contents = {"a.txt": b"alpha" * 300, "b.txt": b"b", "a_1.txt": b"second run", "b_1.txt": b"b"}
+    assert sorted(entry["name"] for entry in index_entries) == sorted(expected_contents)
+
+    if archive_format == "tar":
+        archive_bytes = archive_path.read_bytes()
+        for entry in index_entries:
+            assert archive_bytes[entry["offset"]:entry["offset"] + entry["size"]] == expected_contents[entry["name"]]
+    else:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = {member.filename: member for member in archive.infolist()}
+            for entry in index_entries:
+                assert members[entry["name"]].header_offset == entry["offset"]
+                assert archive.read(members[entry["name"]]) == expected_contents[entry["name"]]
+
+
+@pytest.mark.parametrize("order", ["stream", "destination", "inode"])
+def test_execute_plan_round_trip_with_dedup(tmp_path, order):
+    source_directory_path = tmp_path / "src"
+    destination_directory_path = tmp_path / "dst"
+    plan_path = tmp_path / "plan.jsonl"
+    (source_directory_path / "d").mkdir(parents=True)
+    (source_directory_path / "x.txt").write_text("same")
+    (source_directory_path / "d" / "y.txt").write_text("same")
+    (source_directory_path / "d" / "x.txt").write_text("other")
+    (source_directory_path / "d" / "z.md").write_text("notes")
+
+    run_organizer(source_directory_path, destination_directory_path, "--dedup", "hardlink", "--dry-run", "--save-plan", plan_path)
+    assert not destination_directory_path.exists()
+
+    run_task_01("--execute-plan", plan_path, "--order", order)
+    assert (destination_directory_path / "txt" / "x.txt").read_text() == "same"
+    assert (destination_directory_path / "txt" / "x_1.txt").read_text() == "other"
+    assert (destination_directory_path / "txt" / "y.txt").samefile(destination_directory_path / "txt" / "x.txt")
+    assert (destination_directory_path / "md" / "z.md").read_text() == "notes"
+
+    # Повторне виконання застарілого плану не перезаписує файли, а звітує помилки
+    completed = subprocess.run(
+        [sys.executable, os.fspath(TASK_01_PATH), "-q", "--execute-plan", os.fspath(plan_path)],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    assert completed.returncode == 1
+    assert (destination_directory_path / "txt" / "x_1.txt").read_text() == "other"
@@ -0,0 +1,133 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import task_02
+
+TASK_02_PATH = Path(__file__).resolve().parent / "task_02.py"
+
+
+def build_reference_snowflake(recursion_level, side_length):
+    triangle_vertices = task_02.get_triangle_vertices(side_length)
+    points = []
+
+    for side_index in range(3):
+        side_points = task_02.koch_curve_points(
+            tuple(triangle_vertices[side_index]), 
+            tuple(triangle_vertices[side_index + 1]), 
+            recursion_level
+        )
+        points.extend(side_points if side_index == 0 else side_points[1:])
+
+    return np.array(points)
+
+
+@pytest.mark.parametrize("recursion_level", range(5))
+def test_koch_curve_array_matches_recursive_points(recursion_level):
+    expected_points = np.array(task_02.koch_curve_points((1.0, 2.0), (7.0, -3.0), recursion_level))
+    assert np.allclose(task_02.koch_curve_array((1.0, 2.0), (7.0, -3.0), recursion_level), expected_points)
+
+
+@pytest.mark.parametrize("recursion_level", range(5))
+def test_vectorized_snowflake_matches_recursive_points(recursion_level):
+    snowflake_points = task_02.create_koch_snowflake(recursion_level, 300)
+    assert snowflake_points.shape == (3 * 4 ** recursion_level + 1, 2)
+    assert np.allclose(snowflake_points, build_reference_snowflake(recursion_level, 300))
+
+
+@pytest.mark.parametrize("recursion_level", [0, 1, 3, 5])
+def test_cached_snowflake_matches_vectorized_from_memory_and_disk(tmp_path, recursion_level):
+    expected_points = task_02.create_koch_snowflake(recursion_level, 250)
+
+    fresh_cache = task_02.KochTemplateCache(tmp_path)
+    assert np.allclose(task_02.create_koch_snowflake(recursion_level, 250, fresh_cache), expected_points)
+    assert fresh_cache.get_template_path(recursion_level).exists()
+
+    # Новий екземпляр відкриває збережений шаблон через memory-map
+    disk_cache = task_02.KochTemplateCache(tmp_path)
+    assert isinstance(disk_cache.get_unit_curve(recursion_level), np.memmap)
+    assert np.allclose(task_02.create_koch_snowflake(recursion_level, 250, disk_cache), expected_points)
+
+
+def test_template_cache_rebuilds_template_with_wrong_shape(tmp_path):
+    template_cache = task_02.KochTemplateCache(tmp_path)
+    np.save(template_cache.get_template_path(2), np.zeros((5, 2)))
+
+    assert np.allclose(template_cache.get_unit_curve(2), task_02.koch_curve_array((0.0, 0.0), (1.0, 0.0), 2))
+
+
+def test_level_of_detail_stops_at_pixel_sized_segments():
+    assert task_02.calculate_level_of_detail(10, 300, 1.0) == 6
+    assert task_02.calculate_level_of_detail(4, 300, 1.0) == 4
+    assert task_02.calculate_level_of_detail(10, 300, 400.0) == 0
+
+
+@pytest.mark.parametrize("render_level", range(4))
+def test_every_fourth_power_point_is_the_lower_level_snowflake(render_level):
+    # Експорт бере кожну 4**k-ту точку глибшого рівня замість перерахунку
+    deep_points = task_02.create_koch_snowflake(5, 300)
+    assert np.allclose(deep_points[::4 ** (5 - render_level)], task_02.create_koch_snowflake(render_level, 300))
+
+
+@pytest.mark.parametrize("dpi", ["0", "-3"])
+def test_non_positive_dpi_is_rejected(dpi):
+    completed = subprocess.run(
+        [sys.executable, os.fspath(TASK_02_PATH), "--level", "1", "--dpi", dpi],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    assert completed.returncode == 1
+    assert "--dpi має бути не меншою за 1" in completed.stdout
+
+
+def test_batch_export_writes_every_job_with_exact_points(tmp_path):
+    completed = subprocess.run(
+        [
+            sys.executable, os.fspath(TASK_02_PATH), "--export-dir", os.fspath(tmp_path), 
+            "--export-job", "2:200", "4:100", "--formats", "npy", "png", "svg", "-p", "2", "--no-cache"
+        ],
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+
+    for recursion_level, side_length in [(2, 200), (4, 100)]:
+        file_stem = f"koch_level_{recursion_level}_size_{side_length}"
+        assert (tmp_path / f"{file_stem}.png").stat().st_size > 0
+        assert (tmp_path / f"{file_stem}.svg").stat().st_size > 0
+        assert np.allclose(np.load(tmp_path / f"{file_stem}.npy"), task_02.create_koch_snowflake(recursion_level, side_length))
+
+
+def test_progressive_levels_match_direct_generation():
+    progressive_levels = list(task_02.iterate_koch_levels(5, 300))
+
+    assert [recursion_level for recursion_level, _ in progressive_levels] == list(range(6))
+    for recursion_level, snowflake_points in progressive_levels:
+        assert np.allclose(snowflake_points, task_02.create_koch_snowflake(recursion_level, 300))
+
+
+def test_progressive_export_rasterizes_only_up_to_level_of_detail(tmp_path):
+    completed = subprocess.run(
+        [
+            sys.executable, os.fspath(TASK_02_PATH), "--export-dir", os.fspath(tmp_path), "--export-job", "7:300", 
+            "--formats", "npy", "png", "--dpi", "20", "--progressive", "-p", "1"
+        ],
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+
+    assert sorted(path.name for path in tmp_path.glob("*.npy")) == [f"koch_level_{level}_size_300.npy" for level in range(8)]
+    png_levels = sorted(int(path.name.split("_")[2]) for path in tmp_path.glob("*.png"))
+    assert png_levels == list(range(png_levels[-1] + 1)) and png_levels[-1] < 7
+
+    for recursion_level in range(8):
+        frame_points = np.load(tmp_path / f"koch_level_{recursion_level}_size_300.npy")
+        assert np.allclose(frame_points, task_02.create_koch_snowflake(recursion_level, 300))
@@ -0,0 +1,82 @@
+import functools
+import random
+
+import pytest
+
+import task_03
+
+
+# Порівнюється лише за ключем: мітка показує, чи збережено порядок рівних елементів
+@functools.total_ordering
+class KeyedItem:
+    def __init__(self, key, label):
+        self.key = key
+        self.label = label
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __repr__(self):
+        return f"KeyedItem({self.key}, {self.label})"
+
+
+def generate_keys(size, data_type):
+    input_random = random.Random(f"{size}-{data_type}")
+
+    if data_type == "random":
+        return [input_random.randint(-10**6, 10**6) for _ in range(size)]
+    if data_type == "reversed":
+        return list(range(size, 0, -1))
+    if data_type == "duplicates":
+        return [input_random.randint(0, 3) for _ in range(size)]
+    if data_type == "sorted_blocks":
+        return [key for block_start in range(0, size, 97) for key in range(block_start % 13, block_start % 13 + min(97, size - block_start))]
+    if data_type == "reversed_duplicates":
+        return sorted((input_random.randint(0, 20) for _ in range(size)), reverse=True)
+    raise ValueError(data_type)
+
+
+SIZES = [0, 1, 2, 3, 7, 31, 64, 65, 257, 3000]
+DATA_TYPES = ["random", "reversed", "duplicates", "sorted_blocks", "reversed_duplicates"]
+
+
+def assert_sorts_stably(sorting_call, size, data_type):
+    keys = generate_keys(size, data_type)
+    items = [KeyedItem(key, label) for label, key in enumerate(keys)]
+
+    assert sorting_call(keys) == sorted(keys)
+
+    sorted_items = sorting_call(items)
+    assert [(item.key, item.label) for item in sorted_items] == [(item.key, item.label) for item in sorted(items)]
+    assert [item.label for item in items] == list(range(size)), "вхідний масив не повинен змінюватися"
+
+
+@pytest.mark.parametrize("data_type", DATA_TYPES)
+@pytest.mark.parametrize("size", SIZES)
+def test_bottom_up_merge_sort_is_correct_and_stable(size, data_type):
+    assert_sorts_stably(task_03.bottom_up_merge_sort, size, data_type)
+
+
+HYBRID_PARAMETER_VARIANTS = [
+    task_03.DEFAULT_HYBRID_PARAMETERS,
+    task_03.HybridSortParameters(insertion_cutoff=0, min_run=1),
+    task_03.HybridSortParameters(insertion_cutoff=8, min_run=16),
+    task_03.HybridSortParameters(insertion_cutoff=4000, min_run=32),
+]
+
+
+@pytest.mark.parametrize("parameters", HYBRID_PARAMETER_VARIANTS)
+@pytest.mark.parametrize("data_type", DATA_TYPES)
+@pytest.mark.parametrize("size", SIZES)
+def test_adaptive_hybrid_sort_is_correct_and_stable(size, data_type, parameters):
+    assert_sorts_stably(lambda array: task_03.adaptive_hybrid_sort(array, parameters), size, data_type)
+
+
+def test_calibrated_hybrid_parameters_are_candidates():
+    parameters = task_03.calibrate_hybrid_sort_parameters()
+
+    assert parameters.insertion_cutoff in task_03.HYBRID_CUTOFF_CANDIDATES
+    assert parameters.min_run in task_03.HYBRID_MIN_RUN_CANDIDATES